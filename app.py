@@ -11,15 +11,31 @@ Architektur:
 - schemas/: Pydantic-Models für REDCap-Instrumente
 """
 
+import importlib
+from typing import Callable, Dict, Optional, Tuple
+
 import streamlit as st
 
 from state import get_state, Views
-from views.sidebar import render_sidebar
-from views.startpage import render_startpage
-from views.homepage import render_homepage
-from views.data_explorer import render_data_explorer
-from views.daily_form import render_daily_form
-from views.export_builder import render_export_builder
+
+# View -> (Modul, Render-Funktion). Importiert wird erst beim ersten Aufruf,
+# damit z.B. die Startpage nicht Explorer-Charts und Aggregatoren lädt.
+VIEW_ROUTES: Dict[Views, Tuple[str, str]] = {
+    Views.STARTPAGE: ("views.startpage", "render_startpage"),
+    Views.HOMEPAGE: ("views.homepage", "render_homepage"),
+    Views.EXPLORER: ("views.data_explorer", "render_data_explorer"),
+    Views.DAILY_FORM: ("views.daily_form", "render_daily_form"),
+    Views.EXPORT: ("views.export_builder", "render_export_builder"),
+}
+
+
+def _load_view(view: Views) -> Optional[Callable[[], None]]:
+    """Render-Funktion einer View (Modul wird bei Bedarf importiert, danach aus sys.modules)."""
+    route = VIEW_ROUTES.get(view)
+    if route is None:
+        return None
+    module_name, func_name = route
+    return getattr(importlib.import_module(module_name), func_name)
 
 
 def run_app():
@@ -29,30 +45,18 @@ def run_app():
     
     # Sidebar rendern (außer auf Startpage)
     if state.selected_view != Views.STARTPAGE:
+        from views.sidebar import render_sidebar
         render_sidebar()
     else:
         with st.sidebar:
             st.header("Bitte Datei hochladen")
     
     # View-Routing
-    match state.selected_view:
-        case Views.STARTPAGE:
-            render_startpage()
-        
-        case Views.HOMEPAGE:
-            render_homepage()
-        
-        case Views.EXPLORER:
-            render_data_explorer()
-        
-        case Views.DAILY_FORM:
-            render_daily_form()
-        
-        case Views.EXPORT:
-            render_export_builder()
-        
-        case _:
-            st.error(f"Unbekannte View: {state.selected_view}")
+    render_view = _load_view(state.selected_view)
+    if render_view is None:
+        st.error(f"Unbekannte View: {state.selected_view}")
+    else:
+        render_view()
 
 
 if __name__ == "__main__":
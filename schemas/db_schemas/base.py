@@ -4,12 +4,19 @@ Base Export Model - Gemeinsame Basis für alle REDCap-Instrumente.
 Alle Instrument-spezifischen Models erben von diesem Basis-Model.
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, ClassVar
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, ClassVar, Tuple
 from datetime import date, time
 from abc import ABC
 
 
+@lru_cache(maxsize=None)
+def _export_field_names(model_cls: type) -> Tuple[str, ...]:
+    """Exportierte Felder eines Models (ohne exclude=True), in model_dump-Reihenfolge."""
+    return tuple(name for name, info in model_cls.model_fields.items() if not info.exclude)
+
+
 class BaseExportModel(BaseModel, ABC):
     """
     Basis-Model für alle REDCap Export-Instrumente.
@@ -28,15 +35,22 @@ class BaseExportModel(BaseModel, ABC):
     INSTRUMENT_NAME: ClassVar[str] = ""  # z.B. "labor", "echocardiography"
     INSTRUMENT_LABEL: ClassVar[str] = ""  # z.B. "Labor", "Echokardiographie"
     
-    class Config:
-        populate_by_name = True
-        from_attributes = True
-        use_enum_values = True
+    model_config = ConfigDict(
+        populate_by_name=True,
+        from_attributes=True,
+        use_enum_values=True,
+    )
     
     def get_instrument_name(self) -> str:
         """Gibt den REDCap Instrument-Namen zurück."""
         return self.redcap_repeat_instrument or self.INSTRUMENT_NAME
     
+    def update_derived_fields(self, changed_field: str) -> None:
+        """
+        Aktualisiert abgeleitete Felder nach der Änderung eines einzelnen Feldes.
+        Überschreiben in Subklassen mit abgeleiteten Feldern.
+        """
+    
     def is_complete(self) -> bool:
         """
         Prüft ob das Formular als "complete" markiert werden kann.
@@ -55,7 +69,9 @@ class BaseExportModel(BaseModel, ABC):
         """
         result = {}
         
-        for field_name, value in self.model_dump().items():
+        # Felder direkt lesen statt das Model erst per model_dump() zu serialisieren
+        for field_name in _export_field_names(type(self)):
+            value = getattr(self, field_name)
             if value is None:
                 result[field_name] = ""
             elif isinstance(value, date):
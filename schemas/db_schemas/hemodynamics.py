@@ -4,7 +4,7 @@ REDCap Hemodynamics/Ventilation/Medication Instrument Model.
 Erfasst täglich: Hämodynamik, Beatmung, Medikation, NIRS, etc.
 """
 
-from pydantic import Field, model_validator, PrivateAttr
+from pydantic import model_validator, PrivateAttr
 from typing import Optional, ClassVar, Self
 from datetime import date
 from enum import IntEnum
@@ -87,206 +87,221 @@ class HemodynamicsModel(TimedExportModel):
     INSTRUMENT_NAME: ClassVar[str] = "hemodynamics_ventilation_medication"
     INSTRUMENT_LABEL: ClassVar[str] = "Hämodynamik / Beatmung / Medikation"
     
-    # REDCap-Felder mit korrektem Default
-    redcap_repeat_instrument: Optional[str] = Field(
-        "hemodynamics_ventilation_medication", 
-        alias="redcap_repeat_instrument"
+    # Feldgruppen für set_derived_fields (einmal pro Klasse statt pro Aufruf gebaut)
+    PAC_FIELDS: ClassVar[tuple] = ("pcwp", "sys_pap", "dia_pap", "mean_pap", "ci")
+    NIRS_FIELDS: ClassVar[tuple] = ("nirs_left_c", "nirs_right_c", "nirs_left_f", "nirs_right_f")
+    CATECHOLAMINE_FIELDS: ClassVar[tuple] = (
+        "dobutamine", "epinephrine", "norepinephrine", "milrinone", "vasopressin",
+    )
+    # Checkboxen 1-17 (17 = Other)
+    VASOACTIVE_CHECKBOXES: ClassVar[tuple] = tuple(f"vasoactive_spec___{i}" for i in range(1, 18))
+    ANTIPLATELET_CHECKBOXES: ClassVar[tuple] = tuple(f"post_antiplat_spec___{i}" for i in range(1, 6))
+    ANTIBIOTIC_CHECKBOXES: ClassVar[tuple] = tuple(f"antibiotic_spec___{i}" for i in range(1, 21))
+    TRANSFUSION_FIELDS: ClassVar[tuple] = (
+        "thromb_t", "ery_t", "ffp_t", "ppsb_t", "fib_t", "at3_t", "fxiii_t",
+    )
+    # Alle Eingaben von set_derived_fields (für update_derived_fields)
+    DERIVED_INPUT_FIELDS: ClassVar[frozenset] = frozenset(
+        PAC_FIELDS + NIRS_FIELDS + CATECHOLAMINE_FIELDS + VASOACTIVE_CHECKBOXES
+        + ANTIPLATELET_CHECKBOXES + ANTIBIOTIC_CHECKBOXES + TRANSFUSION_FIELDS
+        + ("iv_ac_spec", "antiviral_spec", "vent_peep", "conv_vent_rate", "fi02", "gcs",
+           "nutrition_spec___1", "nutrition_spec___2")
     )
     
+    # REDCap-Felder mit korrektem Default
+    redcap_repeat_instrument: Optional[str] = "hemodynamics_ventilation_medication"
+    
     # Kontrollfelder
-    na_post: Optional[int] = Field(1, alias="na_post")
-    ecmella: Optional[int] = Field(0, alias="ecmella")
+    na_post: Optional[int] = 1
+    ecmella: Optional[int] = 0
     
     # Zeitpunkt
-    assess_time_point: Optional[int] = Field(None, alias="assess_time_point")
-    assess_date_hemo: Optional[date] = Field(None, alias="assess_date_hemo")
+    assess_time_point: Optional[int] = None
+    assess_date_hemo: Optional[date] = None
     
     # ==================== NIRS ====================
-    nirs_avail: Optional[int] = Field(None, alias="nirs_avail")  # 0=no, 1=yes
-    nirs_loc___1: Optional[int] = Field(0, alias="nirs_loc___1") # Cerebral
-    nirs_loc___2: Optional[int] = Field(0, alias="nirs_loc___2") # Femoral
-    nirs_left_c: Optional[float] = Field(None, alias="nirs_left_c")  # Cerebral links
-    nirs_right_c: Optional[float] = Field(None, alias="nirs_right_c")  # Cerebral rechts
-    nirs_left_f: Optional[float] = Field(None, alias="nirs_left_f")  # Femoral links
-    nirs_right_f: Optional[float] = Field(None, alias="nirs_right_f")  # Femoral rechts
-    nirs_change: Optional[int] = Field(None, alias="nirs_change")
-    nirs_change_spec: Optional[str] = Field(None, alias="nirs_change_spec")
+    nirs_avail: Optional[int] = None  # 0=no, 1=yes
+    nirs_loc___1: Optional[int] = 0 # Cerebral
+    nirs_loc___2: Optional[int] = 0 # Femoral
+    nirs_left_c: Optional[float] = None  # Cerebral links
+    nirs_right_c: Optional[float] = None  # Cerebral rechts
+    nirs_left_f: Optional[float] = None  # Femoral links
+    nirs_right_f: Optional[float] = None  # Femoral rechts
+    nirs_change: Optional[int] = None
+    nirs_change_spec: Optional[str] = None
     
     # ==================== Hämodynamik ====================
-    hr: Optional[float] = Field(None, alias="hr")  # Herzfrequenz
-    sys_bp: Optional[float] = Field(None, alias="sys_bp")  # Systolischer BD
-    dia_bp: Optional[float] = Field(None, alias="dia_bp")  # Diastolischer BD
-    mean_bp: Optional[float] = Field(None, alias="mean_bp")  # Mittlerer BD
-    cvp: Optional[float] = Field(None, alias="cvp")  # ZVD
-    sp02: Optional[float] = Field(None, alias="sp02")  # SpO2
+    hr: Optional[float] = None  # Herzfrequenz
+    sys_bp: Optional[float] = None  # Systolischer BD
+    dia_bp: Optional[float] = None  # Diastolischer BD
+    mean_bp: Optional[float] = None  # Mittlerer BD
+    cvp: Optional[float] = None  # ZVD
+    sp02: Optional[float] = None  # SpO2
     
     # Pulmonalarterie (PAC)
-    pac: Optional[int] = Field(None, alias="pac")  # PAC vorhanden?
-    pcwp: Optional[float] = Field(None, alias="pcwp")  # Wedge-Druck
-    sys_pap: Optional[float] = Field(None, alias="sys_pap")  # Syst. PA-Druck
-    dia_pap: Optional[float] = Field(None, alias="dia_pap")  # Diast. PA-Druck
-    mean_pap: Optional[float] = Field(None, alias="mean_pap")  # Mittlerer PA-Druck
-    ci: Optional[float] = Field(None, alias="ci")  # Cardiac Index
+    pac: Optional[int] = None  # PAC vorhanden?
+    pcwp: Optional[float] = None  # Wedge-Druck
+    sys_pap: Optional[float] = None  # Syst. PA-Druck
+    dia_pap: Optional[float] = None  # Diast. PA-Druck
+    mean_pap: Optional[float] = None  # Mittlerer PA-Druck
+    ci: Optional[float] = None  # Cardiac Index
     
     # ==================== Katecholamine ====================
-    vasoactive_med: Optional[int] = Field(None, alias="vasoactive_med")  # Katecholamine ja/nein
+    vasoactive_med: Optional[int] = None  # Katecholamine ja/nein
     
     # Vasoactive Infusion Checkboxes (17 Medikamente)
-    vasoactive_spec___1: Optional[int] = Field(0, alias="vasoactive_spec___1")  # Dobutamine
-    vasoactive_spec___2: Optional[int] = Field(0, alias="vasoactive_spec___2")  # Dopamine
-    vasoactive_spec___3: Optional[int] = Field(0, alias="vasoactive_spec___3")  # Enoximone
-    vasoactive_spec___4: Optional[int] = Field(0, alias="vasoactive_spec___4")  # Epinephrine
-    vasoactive_spec___5: Optional[int] = Field(0, alias="vasoactive_spec___5")  # Esmolol
-    vasoactive_spec___6: Optional[int] = Field(0, alias="vasoactive_spec___6")  # Levosimendan
-    vasoactive_spec___7: Optional[int] = Field(0, alias="vasoactive_spec___7")  # Metaraminol
-    vasoactive_spec___8: Optional[int] = Field(0, alias="vasoactive_spec___8")  # Metoprolol
-    vasoactive_spec___9: Optional[int] = Field(0, alias="vasoactive_spec___9")  # Milrinone
-    vasoactive_spec___10: Optional[int] = Field(0, alias="vasoactive_spec___10")  # Nicardipine
-    vasoactive_spec___11: Optional[int] = Field(0, alias="vasoactive_spec___11")  # Nitroglycerin
-    vasoactive_spec___12: Optional[int] = Field(0, alias="vasoactive_spec___12")  # Nitroprusside
-    vasoactive_spec___13: Optional[int] = Field(0, alias="vasoactive_spec___13")  # Norepinephrine
-    vasoactive_spec___14: Optional[int] = Field(0, alias="vasoactive_spec___14")  # Phenylephrine
-    vasoactive_spec___15: Optional[int] = Field(0, alias="vasoactive_spec___15")  # Tolazoline
-    vasoactive_spec___16: Optional[int] = Field(0, alias="vasoactive_spec___16")  # Vasopressin
-    vasoactive_spec___17: Optional[int] = Field(0, alias="vasoactive_spec___17")  # Other
+    vasoactive_spec___1: Optional[int] = 0  # Dobutamine
+    vasoactive_spec___2: Optional[int] = 0  # Dopamine
+    vasoactive_spec___3: Optional[int] = 0  # Enoximone
+    vasoactive_spec___4: Optional[int] = 0  # Epinephrine
+    vasoactive_spec___5: Optional[int] = 0  # Esmolol
+    vasoactive_spec___6: Optional[int] = 0  # Levosimendan
+    vasoactive_spec___7: Optional[int] = 0  # Metaraminol
+    vasoactive_spec___8: Optional[int] = 0  # Metoprolol
+    vasoactive_spec___9: Optional[int] = 0  # Milrinone
+    vasoactive_spec___10: Optional[int] = 0  # Nicardipine
+    vasoactive_spec___11: Optional[int] = 0  # Nitroglycerin
+    vasoactive_spec___12: Optional[int] = 0  # Nitroprusside
+    vasoactive_spec___13: Optional[int] = 0  # Norepinephrine
+    vasoactive_spec___14: Optional[int] = 0  # Phenylephrine
+    vasoactive_spec___15: Optional[int] = 0  # Tolazoline
+    vasoactive_spec___16: Optional[int] = 0  # Vasopressin
+    vasoactive_spec___17: Optional[int] = 0  # Other
     
-    vasoactive_o: Optional[str] = Field(None, alias="vasoactive_o")  # Andere Katecholamine
-    dobutamine: Optional[float] = Field(None, alias="dobutamine")  # µg/kg/min
-    epinephrine: Optional[float] = Field(None, alias="epinephrine")  # µg/kg/min
-    norepinephrine: Optional[float] = Field(None, alias="norepinephrine")  # µg/kg/min
-    vasopressin: Optional[float] = Field(None, alias="vasopressin")  # IU/h
-    milrinone: Optional[float] = Field(None, alias="milrinone")  # µg/kg/min
+    vasoactive_o: Optional[str] = None  # Andere Katecholamine
+    dobutamine: Optional[float] = None  # µg/kg/min
+    epinephrine: Optional[float] = None  # µg/kg/min
+    norepinephrine: Optional[float] = None  # µg/kg/min
+    vasopressin: Optional[float] = None  # IU/h
+    milrinone: Optional[float] = None  # µg/kg/min
     
     # ==================== Beatmung ====================
-    vent: Optional[VentilationMode] = Field(None, alias="vent")
-    o2: Optional[float] = Field(None, alias="o2")  # O2-Flow L/min
-    fi02: Optional[float] = Field(None, alias="fi02")  # FiO2 %
-    vent_spec: Optional[VentilationSpec] = Field(None, alias="vent_spec")
-    vent_type: Optional[VentilationType] = Field(None, alias="vent_type")
-    hfv_rate: Optional[float] = Field(None, alias="hfv_rate")  # HF-Ventilation Rate
-    conv_vent_rate: Optional[float] = Field(None, alias="conv_vent_rate")  # Konv. Vent Rate
-    vent_map: Optional[float] = Field(None, alias="vent_map")  # MAP mbar
-    vent_pip: Optional[float] = Field(None, alias="vent_pip")  # PIP mbar
-    vent_peep: Optional[float] = Field(None, alias="vent_peep")  # PEEP mbar
-    prone_pos: Optional[int] = Field(None, alias="prone_pos")  # Bauchlage ja/nein
-    mobil: Optional[int] = Field(None, alias="mobil")  # Level of Mobilization
+    vent: Optional[VentilationMode] = None
+    o2: Optional[float] = None  # O2-Flow L/min
+    fi02: Optional[float] = None  # FiO2 %
+    vent_spec: Optional[VentilationSpec] = None
+    vent_type: Optional[VentilationType] = None
+    hfv_rate: Optional[float] = None  # HF-Ventilation Rate
+    conv_vent_rate: Optional[float] = None  # Konv. Vent Rate
+    vent_map: Optional[float] = None  # MAP mbar
+    vent_pip: Optional[float] = None  # PIP mbar
+    vent_peep: Optional[float] = None  # PEEP mbar
+    prone_pos: Optional[int] = None  # Bauchlage ja/nein
+    mobil: Optional[int] = None  # Level of Mobilization
     
     # ==================== Neurologie ====================
-    gcs_avail: Optional[int] = Field(None, alias="gcs_avail")
-    gcs: Optional[float] = Field(None, alias="gcs")  # Glasgow Coma Scale
+    gcs_avail: Optional[int] = None
+    gcs: Optional[float] = None  # Glasgow Coma Scale
     
     # RASS als Checkbox (10 Felder für RASS +4 bis -5)
-    rass___1: Optional[int] = Field(0, alias="rass___1")  # Combative (+4)
-    rass___2: Optional[int] = Field(0, alias="rass___2")  # Very agitated (+3)
-    rass___3: Optional[int] = Field(0, alias="rass___3")  # Agitated (+2)
-    rass___4: Optional[int] = Field(0, alias="rass___4")  # Restless (+1)
-    rass___5: Optional[int] = Field(0, alias="rass___5")  # Alert and calm (0)
-    rass___6: Optional[int] = Field(0, alias="rass___6")  # Drowsy (-1)
-    rass___7: Optional[int] = Field(0, alias="rass___7")  # Light sedation (-2)
-    rass___8: Optional[int] = Field(0, alias="rass___8")  # Moderate sedation (-3)
-    rass___9: Optional[int] = Field(0, alias="rass___9")  # Deep sedation (-4)
-    rass___10: Optional[int] = Field(0, alias="rass___10")  # Unarousable (-5)
+    rass___1: Optional[int] = 0  # Combative (+4)
+    rass___2: Optional[int] = 0  # Very agitated (+3)
+    rass___3: Optional[int] = 0  # Agitated (+2)
+    rass___4: Optional[int] = 0  # Restless (+1)
+    rass___5: Optional[int] = 0  # Alert and calm (0)
+    rass___6: Optional[int] = 0  # Drowsy (-1)
+    rass___7: Optional[int] = 0  # Light sedation (-2)
+    rass___8: Optional[int] = 0  # Moderate sedation (-3)
+    rass___9: Optional[int] = 0  # Deep sedation (-4)
+    rass___10: Optional[int] = 0  # Unarousable (-5)
     
     # Internes Feld für numerischen RASS-Wert (nicht exportiert)
     _rass_score: Optional[int] = PrivateAttr(default=None)
 
     # ==================== Antikoagulation ====================
-    iv_ac: Optional[int] = Field(None, alias="iv_ac")
-    iv_ac_spec: Optional[Anticoagulation] = Field(None, alias="iv_ac_spec")
+    iv_ac: Optional[int] = None
+    iv_ac_spec: Optional[Anticoagulation] = None
 
-    post_antiplat: Optional[int] = Field(None, alias="post_antiplat")
-    post_antiplat_spec___1: Optional[int] = Field(0, alias="post_antiplat_spec___1")
-    post_antiplat_spec___2: Optional[int] = Field(0, alias="post_antiplat_spec___2")
-    post_antiplat_spec___3: Optional[int] = Field(0, alias="post_antiplat_spec___3")
-    post_antiplat_spec___4: Optional[int] = Field(0, alias="post_antiplat_spec___4")
-    post_antiplat_spec___5: Optional[int] = Field(0, alias="post_antiplat_spec___5")
+    post_antiplat: Optional[int] = None
+    post_antiplat_spec___1: Optional[int] = 0
+    post_antiplat_spec___2: Optional[int] = 0
+    post_antiplat_spec___3: Optional[int] = 0
+    post_antiplat_spec___4: Optional[int] = 0
+    post_antiplat_spec___5: Optional[int] = 0
     
     # ==================== Antibiotika ====================
-    antibiotic: Optional[int] = Field(None, alias="antibiotic")
-    antibiotic_spec___1: Optional[int] = Field(0, alias="antibiotic_spec___1")
-    antibiotic_spec___2: Optional[int] = Field(0, alias="antibiotic_spec___2")
-    antibiotic_spec___3: Optional[int] = Field(0, alias="antibiotic_spec___3")
-    antibiotic_spec___4: Optional[int] = Field(0, alias="antibiotic_spec___4")
-    antibiotic_spec___5: Optional[int] = Field(0, alias="antibiotic_spec___5")
-    antibiotic_spec___6: Optional[int] = Field(0, alias="antibiotic_spec___6")
-    antibiotic_spec___7: Optional[int] = Field(0, alias="antibiotic_spec___7")
-    antibiotic_spec___8: Optional[int] = Field(0, alias="antibiotic_spec___8")
-    antibiotic_spec___9: Optional[int] = Field(0, alias="antibiotic_spec___9")
-    antibiotic_spec___10: Optional[int] = Field(0, alias="antibiotic_spec___10")
-    antibiotic_spec___11: Optional[int] = Field(0, alias="antibiotic_spec___11")
-    antibiotic_spec___12: Optional[int] = Field(0, alias="antibiotic_spec___12")
-    antibiotic_spec___13: Optional[int] = Field(0, alias="antibiotic_spec___13")
-    antibiotic_spec___14: Optional[int] = Field(0, alias="antibiotic_spec___14") # Other
-    antibiotic_spec___15: Optional[int] = Field(0, alias="antibiotic_spec___15")
-    antibiotic_spec___16: Optional[int] = Field(0, alias="antibiotic_spec___16")
-    antibiotic_spec___17: Optional[int] = Field(0, alias="antibiotic_spec___17")
-    antibiotic_spec___18: Optional[int] = Field(0, alias="antibiotic_spec___18")
-    antibiotic_spec___19: Optional[int] = Field(0, alias="antibiotic_spec___19")
-    antibiotic_spec___20: Optional[int] = Field(0, alias="antibiotic_spec___20")
-    antibiotic_spec_o: Optional[str] = Field(None, alias="antibiotic_spec_o")
+    antibiotic: Optional[int] = None
+    antibiotic_spec___1: Optional[int] = 0
+    antibiotic_spec___2: Optional[int] = 0
+    antibiotic_spec___3: Optional[int] = 0
+    antibiotic_spec___4: Optional[int] = 0
+    antibiotic_spec___5: Optional[int] = 0
+    antibiotic_spec___6: Optional[int] = 0
+    antibiotic_spec___7: Optional[int] = 0
+    antibiotic_spec___8: Optional[int] = 0
+    antibiotic_spec___9: Optional[int] = 0
+    antibiotic_spec___10: Optional[int] = 0
+    antibiotic_spec___11: Optional[int] = 0
+    antibiotic_spec___12: Optional[int] = 0
+    antibiotic_spec___13: Optional[int] = 0
+    antibiotic_spec___14: Optional[int] = 0 # Other
+    antibiotic_spec___15: Optional[int] = 0
+    antibiotic_spec___16: Optional[int] = 0
+    antibiotic_spec___17: Optional[int] = 0
+    antibiotic_spec___18: Optional[int] = 0
+    antibiotic_spec___19: Optional[int] = 0
+    antibiotic_spec___20: Optional[int] = 0
+    antibiotic_spec_o: Optional[str] = None
 
     # ==================== Spezifische Medikation ====================
-    antiviral: Optional[int] = Field(None, alias="antiviral")
-    antiviral_spec: Optional[str] = Field(None, alias="antiviral_spec")
+    antiviral: Optional[int] = None
+    antiviral_spec: Optional[str] = None
     
-    medication___1: Optional[int] = Field(0, alias="medication___1")  # Alprostadil
-    medication___2: Optional[int] = Field(0, alias="medication___2")  # IV Bicarbonate
-    medication___3: Optional[int] = Field(0, alias="medication___3")  # Prostacyclin Analogues
-    medication___4: Optional[int] = Field(0, alias="medication___4")  # Narcotics/Sedative Agents
-    medication___5: Optional[int] = Field(0, alias="medication___5")  # Neuromuscular blockers
-    medication___6: Optional[int] = Field(0, alias="medication___6")  # Sildenafil
-    medication___7: Optional[int] = Field(0, alias="medication___7")  # Systemic Steroids
-    medication___8: Optional[int] = Field(0, alias="medication___8")  # Trometamol
-    medication___9: Optional[int] = Field(0, alias="medication___9")  # None
-    medication___10: Optional[int] = Field(0, alias="medication___10") # Opioids
-    medication___11: Optional[int] = Field(0, alias="medication___11") # Antipsychotic medication
+    medication___1: Optional[int] = 0  # Alprostadil
+    medication___2: Optional[int] = 0  # IV Bicarbonate
+    medication___3: Optional[int] = 0  # Prostacyclin Analogues
+    medication___4: Optional[int] = 0  # Narcotics/Sedative Agents
+    medication___5: Optional[int] = 0  # Neuromuscular blockers
+    medication___6: Optional[int] = 0  # Sildenafil
+    medication___7: Optional[int] = 0  # Systemic Steroids
+    medication___8: Optional[int] = 0  # Trometamol
+    medication___9: Optional[int] = 0  # None
+    medication___10: Optional[int] = 0 # Opioids
+    medication___11: Optional[int] = 0 # Antipsychotic medication
 
-    narcotics_spec___1: Optional[int] = Field(0, alias="narcotics_spec___1") # Propofol
-    narcotics_spec___2: Optional[int] = Field(0, alias="narcotics_spec___2") # Midazolam
-    narcotics_spec___3: Optional[int] = Field(0, alias="narcotics_spec___3") # Ketamin
-    narcotics_spec___4: Optional[int] = Field(0, alias="narcotics_spec___4") # Dexmetomidin
+    narcotics_spec___1: Optional[int] = 0 # Propofol
+    narcotics_spec___2: Optional[int] = 0 # Midazolam
+    narcotics_spec___3: Optional[int] = 0 # Ketamin
+    narcotics_spec___4: Optional[int] = 0 # Dexmetomidin
 
     # ==================== Organ Support ====================
-    organ_support___1: Optional[int] = Field(0, alias="organ_support___1")
-    organ_support___2: Optional[int] = Field(0, alias="organ_support___2")
-    organ_support___3: Optional[int] = Field(0, alias="organ_support___3")
-    organ_support___4: Optional[int] = Field(0, alias="organ_support___4")
-    organ_support___5: Optional[int] = Field(0, alias="organ_support___5")
-    organ_support___6: Optional[int] = Field(0, alias="organ_support___6")
-    organ_support___7: Optional[int] = Field(0, alias="organ_support___7")
-    organ_support___8: Optional[int] = Field(0, alias="organ_support___8") # None
-    organ_support___9: Optional[int] = Field(0, alias="organ_support___9") # MARS
-    organ_support___10: Optional[int] = Field(0, alias="organ_support___10") # Cytosorb
+    organ_support___1: Optional[int] = 0
+    organ_support___2: Optional[int] = 0
+    organ_support___3: Optional[int] = 0
+    organ_support___4: Optional[int] = 0
+    organ_support___5: Optional[int] = 0
+    organ_support___6: Optional[int] = 0
+    organ_support___7: Optional[int] = 0
+    organ_support___8: Optional[int] = 0 # None
+    organ_support___9: Optional[int] = 0 # MARS
+    organ_support___10: Optional[int] = 0 # Cytosorb
 
     # ==================== Ernährung ====================
-    nutrition: Optional[int] = Field(None, alias="nutrition")
-    nutrition_spec___1: Optional[int] = Field(0, alias="nutrition_spec___1")
-    nutrition_spec___2: Optional[int] = Field(0, alias="nutrition_spec___2")
+    nutrition: Optional[int] = None
+    nutrition_spec___1: Optional[int] = 0
+    nutrition_spec___2: Optional[int] = 0
 
     # ==================== Transfusionen (24h) ====================
-    transfusion_coag: Optional[int] = Field(None, alias="transfusion_coag")
-    thromb_t: Optional[int] = Field(None, alias="thromb_t")  # Thrombozyten-Konzentrate Bags/24h
-    ery_t: Optional[int] = Field(None, alias="ery_t")  # Erythrozyten-Konzentrate Bags/24h
-    ffp_t: Optional[int] = Field(None, alias="ffp_t")  # Fresh Frozen Plasma Bags/24h
-    ppsb_t: Optional[int] = Field(None, alias="ppsb_t")  # PPSB Units/24h
-    fib_t: Optional[int] = Field(None, alias="fib_t")  # Fibrinogen grams/24h
-    at3_t: Optional[int] = Field(None, alias="at3_t")  # Antithrombin III Units/24h
-    fxiii_t: Optional[int] = Field(None, alias="fxiii_t")  # Faktor XIII Units/24h
+    transfusion_coag: Optional[int] = None
+    thromb_t: Optional[int] = None  # Thrombozyten-Konzentrate Bags/24h
+    ery_t: Optional[int] = None  # Erythrozyten-Konzentrate Bags/24h
+    ffp_t: Optional[int] = None  # Fresh Frozen Plasma Bags/24h
+    ppsb_t: Optional[int] = None  # PPSB Units/24h
+    fib_t: Optional[int] = None  # Fibrinogen grams/24h
+    at3_t: Optional[int] = None  # Antithrombin III Units/24h
+    fxiii_t: Optional[int] = None  # Faktor XIII Units/24h
     
     # ==================== Nierenfunktion ====================
-    renal_repl: Optional[RenalReplacement] = Field(None, alias="renal_repl")
-    urine: Optional[float] = Field(None, alias="urine")  # Urinausscheidung
-    output_renal_repl: Optional[float] = Field(None, alias="output_renal_repl")  # CRRT Output ml
+    renal_repl: Optional[RenalReplacement] = None
+    urine: Optional[float] = None  # Urinausscheidung
+    output_renal_repl: Optional[float] = None  # CRRT Output ml
     
     # ==================== Bilanz ====================
-    fluid_balance: Optional[FluidBalance] = Field(None, alias="fluid_balance")
-    fluid_balance_numb: Optional[float] = Field(None, alias="fluid_balance_numb")  # Numerische Bilanz
+    fluid_balance: Optional[FluidBalance] = None
+    fluid_balance_numb: Optional[float] = None  # Numerische Bilanz
     
     # Completion Status
-    hemodynamics_ventilation_medication_complete: Optional[int] = Field(
-        0, 
-        alias="hemodynamics_ventilation_medication_complete"
-    )
+    hemodynamics_ventilation_medication_complete: Optional[int] = 0
     
     @model_validator(mode="after")
     def set_derived_fields(self) -> Self:
@@ -295,24 +310,14 @@ class HemodynamicsModel(TimedExportModel):
         Diese Methode kann auch manuell aufgerufen werden, um abgeleitete Felder
         nach Attribut-Änderungen zu aktualisieren.
         """
+        # Felder direkt aus __dict__ lesen, ohne Zwischenlisten pro Aufruf
+        d = self.__dict__
+        
         # PAK verfügbar
-        pac_fields = [
-            self.pcwp,
-            self.sys_pap,
-            self.dia_pap,
-            self.mean_pap,
-            self.ci
-        ]
-        self.pac = 1 if any(field is not None for field in pac_fields) else 0
+        self.pac = 1 if any(d[f] is not None for f in self.PAC_FIELDS) else 0
 
         # NIRS verfügbar
-        nirs_fields = [
-            self.nirs_left_c,
-            self.nirs_right_c,
-            self.nirs_left_f,
-            self.nirs_right_f
-        ]
-        self.nirs_avail = 1 if any(field is not None for field in nirs_fields) else 0
+        self.nirs_avail = 1 if any(d[f] is not None for f in self.NIRS_FIELDS) else 0
         
         if self.nirs_avail:
             if self.nirs_left_c is not None or self.nirs_right_c is not None:
@@ -320,43 +325,20 @@ class HemodynamicsModel(TimedExportModel):
             if self.nirs_left_f is not None or self.nirs_right_f is not None:
                 self.nirs_loc___2 = 1
         
-        # Katecholamine vorhanden
-        catecholamines = [
-            self.dobutamine,
-            self.epinephrine,
-            self.norepinephrine,
-            self.milrinone,
-            self.vasopressin
-        ]
-        
-        # Prüfe auch Checkboxen (1-17, da 17=Other)
-        vaso_checkboxes = [
-            getattr(self, f"vasoactive_spec___{i}") for i in range(1, 18)
-        ]
-        
+        # Katecholamine vorhanden (oder Checkbox gesetzt)
         self.vasoactive_med = 1 if (
-            any(v is not None and v > 0 for v in catecholamines) or 
-            any(v == 1 for v in vaso_checkboxes)
+            any(d[f] is not None and d[f] > 0 for f in self.CATECHOLAMINE_FIELDS) or
+            any(d[f] == 1 for f in self.VASOACTIVE_CHECKBOXES)
         ) else 0
 
         # Antikoagulation vorhanden
         self.iv_ac = 1 if self.iv_ac_spec else 0
 
         # Antiplatelet-Therapie vorhanden
-        antiplatelets = [
-            self.post_antiplat_spec___1,
-            self.post_antiplat_spec___2,
-            self.post_antiplat_spec___3,
-            self.post_antiplat_spec___4,
-            self.post_antiplat_spec___5
-        ]
-        self.post_antiplat = 1 if any(v == 1 for v in antiplatelets) else 0
+        self.post_antiplat = 1 if any(d[f] == 1 for f in self.ANTIPLATELET_CHECKBOXES) else 0
 
         # Antibiotika vorhanden
-        antibiotics = [
-            getattr(self, f"antibiotic_spec___{i}") for i in range(1, 21)
-        ]
-        self.antibiotic = 1 if any(v == 1 for v in antibiotics) else 0
+        self.antibiotic = 1 if any(d[f] == 1 for f in self.ANTIBIOTIC_CHECKBOXES) else 0
         
         # Antiviral vorhanden
         if self.antiviral_spec:
@@ -382,11 +364,16 @@ class HemodynamicsModel(TimedExportModel):
             self.nutrition = 1
 
         # Blutprodukte (nicht default auf 0 da Apothekenprodukte (PPSB, Fibrinogen, Antithrombin III, Faktor XIII) nicht sicher erfasst)
-        if any([self.thromb_t, self.ery_t, self.ffp_t, self.ppsb_t, self.fib_t, self.at3_t, self.fxiii_t]):
+        if any(d[f] for f in self.TRANSFUSION_FIELDS):
             self.transfusion_coag = 1
         
         return self
     
+    def update_derived_fields(self, changed_field: str) -> None:
+        """Berechnet die abgeleiteten Felder neu, wenn ``changed_field`` eine ihrer Eingaben ist."""
+        if changed_field in self.DERIVED_INPUT_FIELDS:
+            self.set_derived_fields()
+    
     def set_rass_score(self, score: int) -> None:
         """Setzt den RASS-Score und konvertiert zu Checkbox-Format.
         
@@ -5,7 +5,6 @@ Erfasst täglich die Impella-Parameter und Komplikationen.
 Nur in impella_arm_2 verfügbar!
 """
 
-from pydantic import Field
 from typing import Optional, ClassVar
 from datetime import date
 from enum import IntEnum
@@ -55,48 +54,36 @@ class ImpellaAssessmentModel(TimedExportModel):
     INSTRUMENT_LABEL: ClassVar[str] = "Impella Assessment"
     
     # REDCap-Felder mit korrektem Default
-    redcap_repeat_instrument: Optional[str] = Field(
-        "impellaassessment_and_complications", 
-        alias="redcap_repeat_instrument"
-    )
+    redcap_repeat_instrument: Optional[str] = "impellaassessment_and_complications"
     
     # Dieses Instrument ist NUR in impella_arm_2 verfügbar!
-    redcap_event_name: Optional[str] = Field("impella_arm_2", alias="redcap_event_name")
+    redcap_event_name: Optional[str] = "impella_arm_2"
     
     # Zeitpunkt
-    imp_compl_time_point: Optional[int] = Field(None, alias="imp_compl_time_point")
-    imp_compl_date: Optional[date] = Field(None, alias="imp_compl_date")
+    imp_compl_time_point: Optional[int] = None
+    imp_compl_date: Optional[date] = None
     
     # ==================== Impella-Parameter ====================
-    imp_level: Optional[float] = Field(None, alias="imp_level")  # Level (numerisch)
-    imp_p_level: Optional[ImpellaPumpLevel] = Field(None, alias="imp_p_level")  # P-Level (Radio)
-    imp_flow: Optional[float] = Field(None, alias="imp_flow")  # Flow L/min
-    imp_purge_pressure: Optional[float] = Field(None, alias="imp_purge_pressure")  # Purge-Druck mmHg
-    imp_purge_flow: Optional[float] = Field(None, alias="imp_purge_flow")  # Purge-Flow ml/h
-    imp_rpm: Optional[float] = Field(None, alias="imp_rpm")  # Drehzahl
+    imp_level: Optional[float] = None  # Level (numerisch)
+    imp_p_level: Optional[ImpellaPumpLevel] = None  # P-Level (Radio)
+    imp_flow: Optional[float] = None  # Flow L/min
+    imp_purge_pressure: Optional[float] = None  # Purge-Druck mmHg
+    imp_purge_flow: Optional[float] = None  # Purge-Flow ml/h
+    imp_rpm: Optional[float] = None  # Drehzahl
     
     # ==================== Alarme & Komplikationen ====================
-    imp_alarm: Optional[int] = Field(None, alias="imp_alarm")  # Alarm aufgetreten
-    imp_position_wrong: Optional[int] = Field(None, alias="imp_position_wrong")
-    imp_position_wrong_spec: Optional[ImpellaPositionWrongSpec] = Field(
-        None,
-        alias="imp_position_wrong_spec",
-    )
-    imp_suction: Optional[int] = Field(None, alias="imp_suction")  # Suction Alarm
-    imp_position_unknown: Optional[int] = Field(None, alias="imp_position_unknown")
-    imp_high_purge_pr: Optional[int] = Field(None, alias="imp_high_purge_pr")  # Hoher Purge-Druck
-    imp_thrombolytic: Optional[int] = Field(None, alias="imp_thrombolytic")  # Thrombolyse
-    imp_exchange: Optional[int] = Field(None, alias="imp_exchange")  # Gerätewechsel
-    imp_reposition: Optional[int] = Field(None, alias="imp_reposition")  # Repositionierung
-    imp_reposition_spec: Optional[ImpellaRepositionSpec] = Field(
-        None,
-        alias="imp_reposition_spec",
-    )
-    imp_problem: Optional[int] = Field(None, alias="imp_problem")  # Anderes Problem
-    imp_problem_spec: Optional[str] = Field(None, alias="imp_problem_spec")
+    imp_alarm: Optional[int] = None  # Alarm aufgetreten
+    imp_position_wrong: Optional[int] = None
+    imp_position_wrong_spec: Optional[ImpellaPositionWrongSpec] = None
+    imp_suction: Optional[int] = None  # Suction Alarm
+    imp_position_unknown: Optional[int] = None
+    imp_high_purge_pr: Optional[int] = None  # Hoher Purge-Druck
+    imp_thrombolytic: Optional[int] = None  # Thrombolyse
+    imp_exchange: Optional[int] = None  # Gerätewechsel
+    imp_reposition: Optional[int] = None  # Repositionierung
+    imp_reposition_spec: Optional[ImpellaRepositionSpec] = None
+    imp_problem: Optional[int] = None  # Anderes Problem
+    imp_problem_spec: Optional[str] = None
     
     # Completion Status
-    impellaassessment_and_complications_complete: Optional[int] = Field(
-        0, 
-        alias="impellaassessment_and_complications_complete"
-    )
+    impellaassessment_and_complications_complete: Optional[int] = 0
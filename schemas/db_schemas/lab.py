@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, model_validator
-from typing import Optional, ClassVar, Self
+from typing import Optional, ClassVar, Dict, Self
 from datetime import datetime, date, time
 from enum import IntEnum
 
@@ -28,20 +28,28 @@ class LabModel(TimedExportModel):
     INSTRUMENT_NAME: ClassVar[str] = "labor"
     INSTRUMENT_LABEL: ClassVar[str] = "Labor"
     
+    # Abgeleitete Flags: Quellfeld -> Flag (1 wenn Wert vorhanden)
+    PRESENCE_FLAGS: ClassVar[Dict[str, str]] = {
+        "pct": "post_pct",
+        "crp": "post_crp",
+        "act": "post_act",
+    }
+    HEMOLYSIS_FIELDS: ClassVar[frozenset] = frozenset({"fhb", "hapto", "bili"})
+    
     # REDCap-Felder überschreiben mit korrektem Default
-    redcap_repeat_instrument: Optional[str] = Field("labor", alias="redcap_repeat_instrument")
+    redcap_repeat_instrument: Optional[str] = "labor"
     
     # Labor-spezifische Kontroll-Felder
-    na_post_2: Optional[int] = Field(1, alias="na_post_2")
-    ecmella_2: Optional[int] = Field(0, alias="ecmella_2")
+    na_post_2: Optional[int] = 1
+    ecmella_2: Optional[int] = 0
 
     # Zeitpunkt/Erhebungsmetadaten (Labor-spezifische Aliase)
-    assess_time_point_labor: Optional[int] = Field(None, alias="assess_time_point_labor")
-    assess_date_labor: Optional[date] = Field(None, alias="assess_date_labor")
-    date_assess_labor: Optional[date] = Field(None, alias="date_assess_labor")
-    time_assess_labor: Optional[time] = Field(None, alias="time_assess_labor")
+    assess_time_point_labor: Optional[int] = None
+    assess_date_labor: Optional[date] = None
+    date_assess_labor: Optional[date] = None
+    time_assess_labor: Optional[time] = None
 
-    art_site: WithdrawalSite = Field(WithdrawalSite.UNKNOWN, alias="art_site")
+    art_site: WithdrawalSite = WithdrawalSite.UNKNOWN
 
     # Blutgas-Parameter
     pc02: Optional[float] = Field(None)
@@ -64,31 +72,31 @@ class LabModel(TimedExportModel):
     ptt: Optional[float] = Field(None)
     quick: Optional[float] = Field(None)
     inr: Optional[float] = Field(None)
-    post_act: Optional[int] = Field(None, alias="post_act")
-    act: Optional[float] = Field(None, alias="act")
+    post_act: Optional[int] = None
+    act: Optional[float] = None
 
     # Organsystem-Labore
     ck: Optional[float] = Field(None)
     ckmb: Optional[float] = Field(None)
-    got: Optional[float] = Field(None, alias="got")
-    alat: Optional[float] = Field(None, alias="alat")
+    got: Optional[float] = None
+    alat: Optional[float] = None
     ggt: Optional[float] = Field(None)
     ldh: Optional[float] = Field(None)
     lipase: Optional[float] = Field(None)
-    albumin: Optional[float] = Field(None, alias="albumin")
-    post_crp: Optional[int] = Field(None, alias="post_crp")
-    crp: Optional[float] = Field(None, alias="crp")
-    post_pct: Optional[int] = Field(None, alias="post_pct")
+    albumin: Optional[float] = None
+    post_crp: Optional[int] = None
+    crp: Optional[float] = None
+    post_pct: Optional[int] = None
     pct: Optional[float] = Field(None)
-    hemolysis: Optional[int] = Field(None, alias="hemolysis")
+    hemolysis: Optional[int] = None
     fhb: Optional[float] = Field(None)
-    hapto: Optional[float] = Field(None, alias="hapto")
+    hapto: Optional[float] = None
     bili: Optional[float] = Field(None)
     crea: Optional[float] = Field(None)
     cc: Optional[float] = Field(None)
     urea: Optional[float] = Field(None)
 
-    labor_complete: Optional[int] = Field(0, alias="labor_complete")
+    labor_complete: Optional[int] = 0
     
     @model_validator(mode="after")
     def set_derived_fields(self) -> Self:
@@ -97,10 +105,9 @@ class LabModel(TimedExportModel):
         Diese Methode kann auch manuell aufgerufen werden, um abgeleitete Felder
         nach Attribut-Änderungen zu aktualisieren.
         """
-        self.post_pct = 1 if self.pct is not None else 0
-        self.post_crp = 1 if self.crp is not None else 0
-        self.post_act = 1 if self.act is not None else 0
-        self.hemolysis = 1 if any([self.fhb, self.hapto, self.bili]) else 0
+        for source_field in self.PRESENCE_FLAGS:
+            self.update_derived_fields(source_field)
+        self._update_hemolysis()
         
         # Albumin: Umrechnung von g/L (Daten) zu g/dL (REDCap)
         if self.albumin is not None:
@@ -112,4 +119,15 @@ class LabModel(TimedExportModel):
         
         return self
     
+    def update_derived_fields(self, changed_field: str) -> None:
+        """Aktualisiert nur die Flags, die von ``changed_field`` abhängen (ohne Einheiten-Umrechnung)."""
+        flag = self.PRESENCE_FLAGS.get(changed_field)
+        if flag is not None:
+            setattr(self, flag, 1 if getattr(self, changed_field) is not None else 0)
+        elif changed_field in self.HEMOLYSIS_FIELDS:
+            self._update_hemolysis()
+    
+    def _update_hemolysis(self) -> None:
+        self.hemolysis = 1 if (self.fhb or self.hapto or self.bili) else 0
+    
     # Config wird von TimedExportModel geerbt
\ No newline at end of file
@@ -8,7 +8,6 @@ Enthält Modelle für:
 - prevaecls
 """
 
-from pydantic import Field
 from typing import Optional, ClassVar
 from datetime import date, time
 from enum import IntEnum
@@ -28,9 +27,6 @@ class PreHVLabBaseModel(BaseExportModel):
     # pre_pco2: Optional[float]
     # ...
 
-    class Config:
-        populate_by_name = True
-
 
 class PreImpellaHVLabModel(PreHVLabBaseModel):
     """Instrument: preimpella_hemodynamics_ventilation_labor"""
@@ -38,95 +34,95 @@ class PreImpellaHVLabModel(PreHVLabBaseModel):
     INSTRUMENT_NAME: ClassVar[str] = "preimpella_hemodynamics_ventilation_labor"
     INSTRUMENT_LABEL: ClassVar[str] = "Pre-Impella Hämodynamik/Beatmung/Labor"
 
-    redcap_repeat_instrument: Optional[str] = Field(None, alias="redcap_repeat_instrument")
-    redcap_repeat_instance: Optional[int] = Field(None, alias="redcap_repeat_instance")
+    redcap_repeat_instrument: Optional[str] = None
+    redcap_repeat_instance: Optional[int] = None
 
     # ECMELLA-Steuerfeld: 1 = zeitgleich implantiert (Pre-Parameter entfallen), 0 = getrennt
-    pre_ecmella_2_0_2: Optional[int] = Field(None, alias="pre_ecmella_2_0_2")
+    pre_ecmella_2_0_2: Optional[int] = None
 
-    pre_bga_i: Optional[int] = Field(None, alias="pre_bga_i")
-    pre_assess_date_i: Optional[date] = Field(None, alias="pre_assess_date_i")
-    pre_assess_time_i: Optional[time] = Field(None, alias="pre_assess_time_i")
+    pre_bga_i: Optional[int] = None
+    pre_assess_date_i: Optional[date] = None
+    pre_assess_time_i: Optional[time] = None
     
-    pre_pco2_i: Optional[float] = Field(None, alias="pre_pco2_i")
-    pre_p02_i: Optional[float] = Field(None, alias="pre_p02_i")
-    pre_ph_i: Optional[float] = Field(None, alias="pre_ph_i")
-    pre_hco3_i: Optional[float] = Field(None, alias="pre_hco3_i")
-    pre_be_i: Optional[float] = Field(None, alias="pre_be_i")
-    pre_k_i: Optional[float] = Field(None, alias="pre_k_i")
-    pre_na_i: Optional[float] = Field(None, alias="pre_na_i")
-    pre_sa02_i: Optional[float] = Field(None, alias="pre_sa02_i")
-    pre_gluc_i: Optional[float] = Field(None, alias="pre_gluc_i")
-    pre_lactate_i: Optional[float] = Field(None, alias="pre_lactate_i")
-    pre_svo2_m_i: Optional[int] = Field(None, alias="pre_svo2_m_i")
-    pre_svo2_i: Optional[float] = Field(None, alias="pre_svo2_i")
+    pre_pco2_i: Optional[float] = None
+    pre_p02_i: Optional[float] = None
+    pre_ph_i: Optional[float] = None
+    pre_hco3_i: Optional[float] = None
+    pre_be_i: Optional[float] = None
+    pre_k_i: Optional[float] = None
+    pre_na_i: Optional[float] = None
+    pre_sa02_i: Optional[float] = None
+    pre_gluc_i: Optional[float] = None
+    pre_lactate_i: Optional[float] = None
+    pre_svo2_m_i: Optional[int] = None
+    pre_svo2_i: Optional[float] = None
     
-    pre_vent_i: Optional[int] = Field(None, alias="pre_vent_i")
-    pre_ventilation_i: Optional[int] = Field(None, alias="pre_ventilation_i")
-    pre_02l_i: Optional[float] = Field(None, alias="pre_02l_i")
-    pre_fi02_i: Optional[float] = Field(None, alias="pre_fi02_i")
-    pre_vent_spec_i: Optional[int] = Field(None, alias="pre_vent_spec_i")
-    pre_vent_type_i: Optional[int] = Field(None, alias="pre_vent_type_i")
-    pre_hfv_rate_i: Optional[float] = Field(None, alias="pre_hfv_rate_i")
-    pre_conv_vent_rate_i: Optional[float] = Field(None, alias="pre_conv_vent_rate_i")
-    pre_vent_map_i: Optional[float] = Field(None, alias="pre_vent_map_i")
-    pre_vent_pip_i: Optional[float] = Field(None, alias="pre_vent_pip_i")
-    pre_vent_peep_i: Optional[float] = Field(None, alias="pre_vent_peep_i")
+    pre_vent_i: Optional[int] = None
+    pre_ventilation_i: Optional[int] = None
+    pre_02l_i: Optional[float] = None
+    pre_fi02_i: Optional[float] = None
+    pre_vent_spec_i: Optional[int] = None
+    pre_vent_type_i: Optional[int] = None
+    pre_hfv_rate_i: Optional[float] = None
+    pre_conv_vent_rate_i: Optional[float] = None
+    pre_vent_map_i: Optional[float] = None
+    pre_vent_pip_i: Optional[float] = None
+    pre_vent_peep_i: Optional[float] = None
     
-    pre_hemodynamics_i: Optional[int] = Field(None, alias="pre_hemodynamics_i")
-    pre_hr_i: Optional[float] = Field(None, alias="pre_hr_i")
-    pre_sys_bp_i: Optional[float] = Field(None, alias="pre_sys_bp_i")
-    pre_dia_bp_i: Optional[float] = Field(None, alias="pre_dia_bp_i")
-    pre_mean_bp_i: Optional[float] = Field(None, alias="pre_mean_bp_i")
-    pre_cvd_i: Optional[float] = Field(None, alias="pre_cvd_i")
-    pre_sp02_i: Optional[float] = Field(None, alias="pre_sp02_i")
-    pre_temp_i: Optional[float] = Field(None, alias="pre_temp_i")
-    pre_pac_i: Optional[int] = Field(None, alias="pre_pac_i")
-    pre_pcwp_i: Optional[float] = Field(None, alias="pre_pcwp_i")
-    pre_sys_pap_i: Optional[float] = Field(None, alias="pre_sys_pap_i")
-    pre_dia_pap_i: Optional[float] = Field(None, alias="pre_dia_pap_i")
-    pre_mean_pap_i: Optional[float] = Field(None, alias="pre_mean_pap_i")
-    pre_ci_i: Optional[float] = Field(None, alias="pre_ci_i")
+    pre_hemodynamics_i: Optional[int] = None
+    pre_hr_i: Optional[float] = None
+    pre_sys_bp_i: Optional[float] = None
+    pre_dia_bp_i: Optional[float] = None
+    pre_mean_bp_i: Optional[float] = None
+    pre_cvd_i: Optional[float] = None
+    pre_sp02_i: Optional[float] = None
+    pre_temp_i: Optional[float] = None
+    pre_pac_i: Optional[int] = None
+    pre_pcwp_i: Optional[float] = None
+    pre_sys_pap_i: Optional[float] = None
+    pre_dia_pap_i: Optional[float] = None
+    pre_mean_pap_i: Optional[float] = None
+    pre_ci_i: Optional[float] = None
     
-    pre_neuro_i: Optional[int] = Field(None, alias="pre_neuro_i")
-    pre_gcs_i: Optional[float] = Field(None, alias="pre_gcs_i")
+    pre_neuro_i: Optional[int] = None
+    pre_gcs_i: Optional[float] = None
     
-    pre_lab_results_i: Optional[int] = Field(None, alias="pre_lab_results_i")
-    pre_lab_results_imp: Optional[int] = Field(None, alias="pre_lab_results_imp")
-    pre_wbc_i: Optional[float] = Field(None, alias="pre_wbc_i")
-    pre_hb_i: Optional[float] = Field(None, alias="pre_hb_i")
-    pre_hct_i: Optional[float] = Field(None, alias="pre_hct_i")
-    pre_mcv_i: Optional[float] = Field(None, alias="pre_mcv_i")
-    pre_mch_i: Optional[float] = Field(None, alias="pre_mch_i")
-    pre_mchc_i: Optional[float] = Field(None, alias="pre_mchc_i")
-    pre_ret_i: Optional[float] = Field(None, alias="pre_ret_i")
-    pre_rpi_i: Optional[float] = Field(None, alias="pre_rpi_i")
-    pre_rdw_i: Optional[float] = Field(None, alias="pre_rdw_i")
-    pre_plt_i: Optional[float] = Field(None, alias="pre_plt_i")
-    pre_ptt_i: Optional[float] = Field(None, alias="pre_ptt_i")
-    pre_quick_i: Optional[float] = Field(None, alias="pre_quick_i")
-    pre_inr_i: Optional[float] = Field(None, alias="pre_inr_i")
-    pre_act_m_i: Optional[int] = Field(None, alias="pre_act_m_i")
-    pre_act_i: Optional[float] = Field(None, alias="pre_act_i")
-    pre_ck_i: Optional[float] = Field(None, alias="pre_ck_i")
-    pre_ckmb_i: Optional[float] = Field(None, alias="pre_ckmb_i")
-    pre_got_i: Optional[float] = Field(None, alias="pre_got_i")
-    pre_ldh_i: Optional[float] = Field(None, alias="pre_ldh_i")
-    pre_lipase_i: Optional[float] = Field(None, alias="pre_lipase_i")
-    pre_crea_i: Optional[float] = Field(None, alias="pre_crea_i")
-    pre_urea_i: Optional[float] = Field(None, alias="pre_urea_i")
-    pre_cc_i: Optional[float] = Field(None, alias="pre_cc_i")
-    pre_alb_i: Optional[float] = Field(None, alias="pre_alb_i")
-    pre_crp_m_i: Optional[int] = Field(None, alias="pre_crp_m_i")
-    pre_crp_i: Optional[float] = Field(None, alias="pre_crp_i")
-    pre_pct_m_i: Optional[int] = Field(None, alias="pre_pct_m_i")
-    pre_pct_i: Optional[float] = Field(None, alias="pre_pct_i")
-    pre_hemolysis_i: Optional[int] = Field(None, alias="pre_hemolysis_i")
-    pre_fhb_i: Optional[float] = Field(None, alias="pre_fhb_i")
-    pre_hapto_i: Optional[float] = Field(None, alias="pre_hapto_i")
-    pre_bili_i: Optional[float] = Field(None, alias="pre_bili_i")
-    pre_trop_m_i: Optional[int] = Field(None, alias="pre_trop_m_i")
-    pre_trop_i: Optional[float] = Field(None, alias="pre_trop_i")
+    pre_lab_results_i: Optional[int] = None
+    pre_lab_results_imp: Optional[int] = None
+    pre_wbc_i: Optional[float] = None
+    pre_hb_i: Optional[float] = None
+    pre_hct_i: Optional[float] = None
+    pre_mcv_i: Optional[float] = None
+    pre_mch_i: Optional[float] = None
+    pre_mchc_i: Optional[float] = None
+    pre_ret_i: Optional[float] = None
+    pre_rpi_i: Optional[float] = None
+    pre_rdw_i: Optional[float] = None
+    pre_plt_i: Optional[float] = None
+    pre_ptt_i: Optional[float] = None
+    pre_quick_i: Optional[float] = None
+    pre_inr_i: Optional[float] = None
+    pre_act_m_i: Optional[int] = None
+    pre_act_i: Optional[float] = None
+    pre_ck_i: Optional[float] = None
+    pre_ckmb_i: Optional[float] = None
+    pre_got_i: Optional[float] = None
+    pre_ldh_i: Optional[float] = None
+    pre_lipase_i: Optional[float] = None
+    pre_crea_i: Optional[float] = None
+    pre_urea_i: Optional[float] = None
+    pre_cc_i: Optional[float] = None
+    pre_alb_i: Optional[float] = None
+    pre_crp_m_i: Optional[int] = None
+    pre_crp_i: Optional[float] = None
+    pre_pct_m_i: Optional[int] = None
+    pre_pct_i: Optional[float] = None
+    pre_hemolysis_i: Optional[int] = None
+    pre_fhb_i: Optional[float] = None
+    pre_hapto_i: Optional[float] = None
+    pre_bili_i: Optional[float] = None
+    pre_trop_m_i: Optional[int] = None
+    pre_trop_i: Optional[float] = None
 
 
 class PreImpellaMedicationModel(BaseExportModel):
@@ -135,45 +131,45 @@ class PreImpellaMedicationModel(BaseExportModel):
     INSTRUMENT_NAME: ClassVar[str] = "preimpella"
     INSTRUMENT_LABEL: ClassVar[str] = "Pre-Impella"
 
-    redcap_repeat_instrument: Optional[str] = Field(None, alias="redcap_repeat_instrument")
-    redcap_repeat_instance: Optional[int] = Field(None, alias="redcap_repeat_instance")
+    redcap_repeat_instrument: Optional[str] = None
+    redcap_repeat_instance: Optional[int] = None
 
     # ECMELLA-Steuerfeld: 1 = zeitgleich implantiert (Pre-Parameter entfallen), 0 = getrennt
-    pre_ecmella_2_0: Optional[int] = Field(None, alias="pre_ecmella_2_0")
+    pre_ecmella_2_0: Optional[int] = None
 
-    pre_med_i___1: Optional[int] = Field(0, alias="pre_med_i___1")
-    pre_med_i___2: Optional[int] = Field(0, alias="pre_med_i___2")
-    pre_med_i___3: Optional[int] = Field(0, alias="pre_med_i___3")
-    pre_med_i___4: Optional[int] = Field(0, alias="pre_med_i___4")
-    pre_med_i___5: Optional[int] = Field(0, alias="pre_med_i___5")
-    pre_med_i___6: Optional[int] = Field(0, alias="pre_med_i___6")
-    pre_med_i___7: Optional[int] = Field(0, alias="pre_med_i___7")
-    pre_med_i___8: Optional[int] = Field(0, alias="pre_med_i___8")
-    pre_med_i___9: Optional[int] = Field(0, alias="pre_med_i___9")
+    pre_med_i___1: Optional[int] = 0
+    pre_med_i___2: Optional[int] = 0
+    pre_med_i___3: Optional[int] = 0
+    pre_med_i___4: Optional[int] = 0
+    pre_med_i___5: Optional[int] = 0
+    pre_med_i___6: Optional[int] = 0
+    pre_med_i___7: Optional[int] = 0
+    pre_med_i___8: Optional[int] = 0
+    pre_med_i___9: Optional[int] = 0
     
-    pre_vasoactive_i___1: Optional[int] = Field(0, alias="pre_vasoactive_i___1")
-    pre_vasoactive_i___2: Optional[int] = Field(0, alias="pre_vasoactive_i___2")
-    pre_vasoactive_i___3: Optional[int] = Field(0, alias="pre_vasoactive_i___3")
-    pre_vasoactive_i___4: Optional[int] = Field(0, alias="pre_vasoactive_i___4")
-    pre_vasoactive_i___5: Optional[int] = Field(0, alias="pre_vasoactive_i___5")
-    pre_vasoactive_i___6: Optional[int] = Field(0, alias="pre_vasoactive_i___6")
-    pre_vasoactive_i___7: Optional[int] = Field(0, alias="pre_vasoactive_i___7")
-    pre_vasoactive_i___8: Optional[int] = Field(0, alias="pre_vasoactive_i___8")
-    pre_vasoactive_i___9: Optional[int] = Field(0, alias="pre_vasoactive_i___9")
-    pre_vasoactive_i___10: Optional[int] = Field(0, alias="pre_vasoactive_i___10")
-    pre_vasoactive_i___11: Optional[int] = Field(0, alias="pre_vasoactive_i___11")
-    pre_vasoactive_i___12: Optional[int] = Field(0, alias="pre_vasoactive_i___12")
-    pre_vasoactive_i___13: Optional[int] = Field(0, alias="pre_vasoactive_i___13")
-    pre_vasoactive_i___14: Optional[int] = Field(0, alias="pre_vasoactive_i___14")
-    pre_vasoactive_i___15: Optional[int] = Field(0, alias="pre_vasoactive_i___15")
-    pre_vasoactive_i___16: Optional[int] = Field(0, alias="pre_vasoactive_i___16")
-    pre_vasoactive_i___17: Optional[int] = Field(0, alias="pre_vasoactive_i___17")
+    pre_vasoactive_i___1: Optional[int] = 0
+    pre_vasoactive_i___2: Optional[int] = 0
+    pre_vasoactive_i___3: Optional[int] = 0
+    pre_vasoactive_i___4: Optional[int] = 0
+    pre_vasoactive_i___5: Optional[int] = 0
+    pre_vasoactive_i___6: Optional[int] = 0
+    pre_vasoactive_i___7: Optional[int] = 0
+    pre_vasoactive_i___8: Optional[int] = 0
+    pre_vasoactive_i___9: Optional[int] = 0
+    pre_vasoactive_i___10: Optional[int] = 0
+    pre_vasoactive_i___11: Optional[int] = 0
+    pre_vasoactive_i___12: Optional[int] = 0
+    pre_vasoactive_i___13: Optional[int] = 0
+    pre_vasoactive_i___14: Optional[int] = 0
+    pre_vasoactive_i___15: Optional[int] = 0
+    pre_vasoactive_i___16: Optional[int] = 0
+    pre_vasoactive_i___17: Optional[int] = 0
     
-    pre_dobutamine_i: Optional[float] = Field(None, alias="pre_dobutamine_i")
-    pre_epinephrine_i: Optional[float] = Field(None, alias="pre_epinephrine_i")
-    pre_norepinephrine_i: Optional[float] = Field(None, alias="pre_norepinephrine_i")
-    pre_vasopressin_i: Optional[float] = Field(None, alias="pre_vasopressin_i")
-    pre_milrinone_i: Optional[float] = Field(None, alias="pre_milrinone_i")
+    pre_dobutamine_i: Optional[float] = None
+    pre_epinephrine_i: Optional[float] = None
+    pre_norepinephrine_i: Optional[float] = None
+    pre_vasopressin_i: Optional[float] = None
+    pre_milrinone_i: Optional[float] = None
 
 
 class PreVAECLSHVLabModel(PreHVLabBaseModel):
@@ -182,92 +178,92 @@ class PreVAECLSHVLabModel(PreHVLabBaseModel):
     INSTRUMENT_NAME: ClassVar[str] = "prevaecls_hemodynamics_ventilation_labor"
     INSTRUMENT_LABEL: ClassVar[str] = "Pre-ECLS Hämodynamik/Beatmung/Labor"
     
-    redcap_repeat_instrument: Optional[str] = Field(None, alias="redcap_repeat_instrument")
-    redcap_repeat_instance: Optional[int] = Field(None, alias="redcap_repeat_instance")
+    redcap_repeat_instrument: Optional[str] = None
+    redcap_repeat_instance: Optional[int] = None
     
-    pre_bga: Optional[int] = Field(None, alias="pre_bga")
-    pre_assess_date: Optional[date] = Field(None, alias="pre_assess_date")
-    pre_assess_time: Optional[time] = Field(None, alias="pre_assess_time")
+    pre_bga: Optional[int] = None
+    pre_assess_date: Optional[date] = None
+    pre_assess_time: Optional[time] = None
     
-    pre_pco2: Optional[float] = Field(None, alias="pre_pco2")
-    pre_p02: Optional[float] = Field(None, alias="pre_p02")
-    pre_ph: Optional[float] = Field(None, alias="pre_ph")
-    pre_hco3: Optional[float] = Field(None, alias="pre_hco3")
-    pre_be: Optional[float] = Field(None, alias="pre_be")
-    pre_k: Optional[float] = Field(None, alias="pre_k")
-    pre_na: Optional[float] = Field(None, alias="pre_na")
-    pre_sa02: Optional[float] = Field(None, alias="pre_sa02")
-    pre_gluc: Optional[float] = Field(None, alias="pre_gluc")
-    pre_lactate: Optional[float] = Field(None, alias="pre_lactate")
-    pre_svo2_m: Optional[int] = Field(None, alias="pre_svo2_m")
-    pre_svo2: Optional[float] = Field(None, alias="pre_svo2")
+    pre_pco2: Optional[float] = None
+    pre_p02: Optional[float] = None
+    pre_ph: Optional[float] = None
+    pre_hco3: Optional[float] = None
+    pre_be: Optional[float] = None
+    pre_k: Optional[float] = None
+    pre_na: Optional[float] = None
+    pre_sa02: Optional[float] = None
+    pre_gluc: Optional[float] = None
+    pre_lactate: Optional[float] = None
+    pre_svo2_m: Optional[int] = None
+    pre_svo2: Optional[float] = None
     
-    pre_vent: Optional[int] = Field(None, alias="pre_vent")
-    pre_ventilation: Optional[int] = Field(None, alias="pre_ventilation")
-    pre_02l: Optional[float] = Field(None, alias="pre_02l")
-    pre_fi02: Optional[float] = Field(None, alias="pre_fi02")
-    pre_vent_spec: Optional[int] = Field(None, alias="pre_vent_spec")
-    pre_vent_type: Optional[int] = Field(None, alias="pre_vent_type")
-    pre_hfv_rate: Optional[float] = Field(None, alias="pre_hfv_rate")
-    pre_conv_vent_rate: Optional[float] = Field(None, alias="pre_conv_vent_rate")
-    pre_vent_map: Optional[float] = Field(None, alias="pre_vent_map")
-    pre_vent_pip: Optional[float] = Field(None, alias="pre_vent_pip")
-    pre_vent_peep: Optional[float] = Field(None, alias="pre_vent_peep")
+    pre_vent: Optional[int] = None
+    pre_ventilation: Optional[int] = None
+    pre_02l: Optional[float] = None
+    pre_fi02: Optional[float] = None
+    pre_vent_spec: Optional[int] = None
+    pre_vent_type: Optional[int] = None
+    pre_hfv_rate: Optional[float] = None
+    pre_conv_vent_rate: Optional[float] = None
+    pre_vent_map: Optional[float] = None
+    pre_vent_pip: Optional[float] = None
+    pre_vent_peep: Optional[float] = None
     
-    pre_hemodynamics: Optional[int] = Field(None, alias="pre_hemodynamics")
-    pre_hr: Optional[float] = Field(None, alias="pre_hr")
-    pre_sys_bp: Optional[float] = Field(None, alias="pre_sys_bp")
-    pre_dia_bp: Optional[float] = Field(None, alias="pre_dia_bp")
-    pre_mean_bp: Optional[float] = Field(None, alias="pre_mean_bp")
-    pre_cvd: Optional[float] = Field(None, alias="pre_cvd")
-    pre_sp02: Optional[float] = Field(None, alias="pre_sp02")
-    pre_temp: Optional[float] = Field(None, alias="pre_temp")
-    pre_pac: Optional[int] = Field(None, alias="pre_pac")
-    pre_pcwp: Optional[float] = Field(None, alias="pre_pcwp")
-    pre_sys_pap: Optional[float] = Field(None, alias="pre_sys_pap")
-    pre_dia_pap: Optional[float] = Field(None, alias="pre_dia_pap")
-    pre_mean_pap: Optional[float] = Field(None, alias="pre_mean_pap")
-    pre_ci: Optional[float] = Field(None, alias="pre_ci")
+    pre_hemodynamics: Optional[int] = None
+    pre_hr: Optional[float] = None
+    pre_sys_bp: Optional[float] = None
+    pre_dia_bp: Optional[float] = None
+    pre_mean_bp: Optional[float] = None
+    pre_cvd: Optional[float] = None
+    pre_sp02: Optional[float] = None
+    pre_temp: Optional[float] = None
+    pre_pac: Optional[int] = None
+    pre_pcwp: Optional[float] = None
+    pre_sys_pap: Optional[float] = None
+    pre_dia_pap: Optional[float] = None
+    pre_mean_pap: Optional[float] = None
+    pre_ci: Optional[float] = None
     
-    pre_neuro: Optional[int] = Field(None, alias="pre_neuro")
-    pre_gcs: Optional[float] = Field(None, alias="pre_gcs")
+    pre_neuro: Optional[int] = None
+    pre_gcs: Optional[float] = None
     
-    pre_lab_results: Optional[int] = Field(None, alias="pre_lab_results")
-    pre_lab_results_elso: Optional[int] = Field(None, alias="pre_lab_results_elso")
-    pre_wbc: Optional[float] = Field(None, alias="pre_wbc")
-    pre_hb: Optional[float] = Field(None, alias="pre_hb")
-    pre_hct: Optional[float] = Field(None, alias="pre_hct")
-    pre_mcv: Optional[float] = Field(None, alias="pre_mcv")
-    pre_mch: Optional[float] = Field(None, alias="pre_mch")
-    pre_mchc: Optional[float] = Field(None, alias="pre_mchc")
-    pre_ret: Optional[float] = Field(None, alias="pre_ret")
-    pre_rpi: Optional[float] = Field(None, alias="pre_rpi")
-    pre_rdw: Optional[float] = Field(None, alias="pre_rdw")
-    pre_plt: Optional[float] = Field(None, alias="pre_plt")
-    pre_ptt: Optional[float] = Field(None, alias="pre_ptt")
-    pre_quick: Optional[float] = Field(None, alias="pre_quick")
-    pre_inr: Optional[float] = Field(None, alias="pre_inr")
-    pre_act_m: Optional[int] = Field(None, alias="pre_act_m")
-    pre_act: Optional[float] = Field(None, alias="pre_act")
-    pre_ck: Optional[float] = Field(None, alias="pre_ck")
-    pre_ckmb: Optional[float] = Field(None, alias="pre_ckmb")
-    pre_got: Optional[float] = Field(None, alias="pre_got")
-    pre_ldh: Optional[float] = Field(None, alias="pre_ldh")
-    pre_lipase: Optional[float] = Field(None, alias="pre_lipase")
-    pre_crea: Optional[float] = Field(None, alias="pre_crea")
-    pre_urea: Optional[float] = Field(None, alias="pre_urea")
-    pre_cc: Optional[float] = Field(None, alias="pre_cc")
-    pre_alb: Optional[float] = Field(None, alias="pre_alb")
-    pre_crp_m: Optional[int] = Field(None, alias="pre_crp_m")
-    pre_crp: Optional[float] = Field(None, alias="pre_crp")
-    pre_pct_m: Optional[int] = Field(None, alias="pre_pct_m")
-    pre_pct: Optional[float] = Field(None, alias="pre_pct")
-    pre_hemolysis: Optional[int] = Field(None, alias="pre_hemolysis")
-    pre_fhb: Optional[float] = Field(None, alias="pre_fhb")
-    pre_hapto: Optional[float] = Field(None, alias="pre_hapto")
-    pre_bili: Optional[float] = Field(None, alias="pre_bili")
-    pre_trop_m: Optional[int] = Field(None, alias="pre_trop_m")
-    pre_trop: Optional[float] = Field(None, alias="pre_trop")
+    pre_lab_results: Optional[int] = None
+    pre_lab_results_elso: Optional[int] = None
+    pre_wbc: Optional[float] = None
+    pre_hb: Optional[float] = None
+    pre_hct: Optional[float] = None
+    pre_mcv: Optional[float] = None
+    pre_mch: Optional[float] = None
+    pre_mchc: Optional[float] = None
+    pre_ret: Optional[float] = None
+    pre_rpi: Optional[float] = None
+    pre_rdw: Optional[float] = None
+    pre_plt: Optional[float] = None
+    pre_ptt: Optional[float] = None
+    pre_quick: Optional[float] = None
+    pre_inr: Optional[float] = None
+    pre_act_m: Optional[int] = None
+    pre_act: Optional[float] = None
+    pre_ck: Optional[float] = None
+    pre_ckmb: Optional[float] = None
+    pre_got: Optional[float] = None
+    pre_ldh: Optional[float] = None
+    pre_lipase: Optional[float] = None
+    pre_crea: Optional[float] = None
+    pre_urea: Optional[float] = None
+    pre_cc: Optional[float] = None
+    pre_alb: Optional[float] = None
+    pre_crp_m: Optional[int] = None
+    pre_crp: Optional[float] = None
+    pre_pct_m: Optional[int] = None
+    pre_pct: Optional[float] = None
+    pre_hemolysis: Optional[int] = None
+    pre_fhb: Optional[float] = None
+    pre_hapto: Optional[float] = None
+    pre_bili: Optional[float] = None
+    pre_trop_m: Optional[int] = None
+    pre_trop: Optional[float] = None
 
 
 class PreVAECLSMedicationModel(BaseExportModel):
@@ -276,40 +272,40 @@ class PreVAECLSMedicationModel(BaseExportModel):
     INSTRUMENT_NAME: ClassVar[str] = "prevaecls"
     INSTRUMENT_LABEL: ClassVar[str] = "Pre-ECLS"
     
-    redcap_repeat_instrument: Optional[str] = Field(None, alias="redcap_repeat_instrument")
-    redcap_repeat_instance: Optional[int] = Field(None, alias="redcap_repeat_instance")
+    redcap_repeat_instrument: Optional[str] = None
+    redcap_repeat_instance: Optional[int] = None
     
-    pre_med___1: Optional[int] = Field(0, alias="pre_med___1")
-    pre_med___2: Optional[int] = Field(0, alias="pre_med___2")
-    pre_med___3: Optional[int] = Field(0, alias="pre_med___3")
-    pre_med___4: Optional[int] = Field(0, alias="pre_med___4")
-    pre_med___5: Optional[int] = Field(0, alias="pre_med___5")
-    pre_med___6: Optional[int] = Field(0, alias="pre_med___6")
-    pre_med___7: Optional[int] = Field(0, alias="pre_med___7")
-    pre_med___8: Optional[int] = Field(0, alias="pre_med___8")
-    pre_med___9: Optional[int] = Field(0, alias="pre_med___9")
+    pre_med___1: Optional[int] = 0
+    pre_med___2: Optional[int] = 0
+    pre_med___3: Optional[int] = 0
+    pre_med___4: Optional[int] = 0
+    pre_med___5: Optional[int] = 0
+    pre_med___6: Optional[int] = 0
+    pre_med___7: Optional[int] = 0
+    pre_med___8: Optional[int] = 0
+    pre_med___9: Optional[int] = 0
     
-    pre_vasoactive___1: Optional[int] = Field(0, alias="pre_vasoactive___1")
-    pre_vasoactive___2: Optional[int] = Field(0, alias="pre_vasoactive___2")
-    pre_vasoactive___3: Optional[int] = Field(0, alias="pre_vasoactive___3")
-    pre_vasoactive___4: Optional[int] = Field(0, alias="pre_vasoactive___4")
-    pre_vasoactive___5: Optional[int] = Field(0, alias="pre_vasoactive___5")
-    pre_vasoactive___6: Optional[int] = Field(0, alias="pre_vasoactive___6")
-    pre_vasoactive___7: Optional[int] = Field(0, alias="pre_vasoactive___7")
-    pre_vasoactive___8: Optional[int] = Field(0, alias="pre_vasoactive___8")
-    pre_vasoactive___9: Optional[int] = Field(0, alias="pre_vasoactive___9")
-    pre_vasoactive___10: Optional[int] = Field(0, alias="pre_vasoactive___10")
-    pre_vasoactive___11: Optional[int] = Field(0, alias="pre_vasoactive___11")
-    pre_vasoactive___12: Optional[int] = Field(0, alias="pre_vasoactive___12")
-    pre_vasoactive___13: Optional[int] = Field(0, alias="pre_vasoactive___13")
-    pre_vasoactive___14: Optional[int] = Field(0, alias="pre_vasoactive___14")
-    pre_vasoactive___15: Optional[int] = Field(0, alias="pre_vasoactive___15")
-    pre_vasoactive___16: Optional[int] = Field(0, alias="pre_vasoactive___16")
-    pre_vasoactive___17: Optional[int] = Field(0, alias="pre_vasoactive___17")
-    pre_vasoactive___18: Optional[int] = Field(0, alias="pre_vasoactive___18")
+    pre_vasoactive___1: Optional[int] = 0
+    pre_vasoactive___2: Optional[int] = 0
+    pre_vasoactive___3: Optional[int] = 0
+    pre_vasoactive___4: Optional[int] = 0
+    pre_vasoactive___5: Optional[int] = 0
+    pre_vasoactive___6: Optional[int] = 0
+    pre_vasoactive___7: Optional[int] = 0
+    pre_vasoactive___8: Optional[int] = 0
+    pre_vasoactive___9: Optional[int] = 0
+    pre_vasoactive___10: Optional[int] = 0
+    pre_vasoactive___11: Optional[int] = 0
+    pre_vasoactive___12: Optional[int] = 0
+    pre_vasoactive___13: Optional[int] = 0
+    pre_vasoactive___14: Optional[int] = 0
+    pre_vasoactive___15: Optional[int] = 0
+    pre_vasoactive___16: Optional[int] = 0
+    pre_vasoactive___17: Optional[int] = 0
+    pre_vasoactive___18: Optional[int] = 0
     
-    pre_dobutamine: Optional[float] = Field(None, alias="pre_dobutamine")
-    pre_epinephrine: Optional[float] = Field(None, alias="pre_epinephrine")
-    pre_norepinephrine: Optional[float] = Field(None, alias="pre_norepinephrine")
-    pre_vasopressin: Optional[float] = Field(None, alias="pre_vasopressin")
-    pre_milrinone: Optional[float] = Field(None, alias="pre_milrinone")
+    pre_dobutamine: Optional[float] = None
+    pre_epinephrine: Optional[float] = None
+    pre_norepinephrine: Optional[float] = None
+    pre_vasopressin: Optional[float] = None
+    pre_milrinone: Optional[float] = None
@@ -16,11 +16,21 @@ Aggregations-Strategien:
 import logging
 import re
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Tuple, Type, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Set, Tuple, Type, Any
 from datetime import date, time
+import numpy as np
 import pandas as pd
 
 from schemas.db_schemas.base import BaseExportModel
+from utils.data_processing import compile_pattern, contains_mask, day_bounds, filter_time_range
+
+# Fertigspritzen (Bolusgaben) zählen nicht als laufende Medikation
+FER_PATTERN = r"\(FER\)|Fertigspritze"
+
+# Einmal kompiliert statt bei jedem Wert über den re-Cache
+_DATE_VALUE_RE = re.compile(r"^\d{1,2}[\./]\d{1,2}[\./]\d{2,4}$")
+_NUMBER_RE = re.compile(r"[-+]?\d+(?:\.\d+)?")
 
 
 def _parse_float(v) -> Optional[float]:
@@ -36,13 +46,19 @@ def _parse_float(v) -> Optional[float]:
         s = str(v).strip()
     except Exception:
         return None
-    if not s or re.match(r"^\d{1,2}[\./]\d{1,2}[\./]\d{2,4}$", s):
+    if not s or _DATE_VALUE_RE.match(s):
         return None
     s_norm = s.replace(",", ".")
-    m = re.search(r"[-+]?\d+(?:\.\d+)?", s_norm)
+    m = _NUMBER_RE.search(s_norm)
     return float(m.group(0)) if m else None
 
 
+@lru_cache(maxsize=1024)
+def _parse_bound(bound: Optional[str]) -> Optional[float]:
+    """Grenzwert aus dem Datenwörterbuch (wenige feste Strings, daher gecacht)."""
+    return _parse_float(bound)
+
+
 def validate_value(
     value: Any,
     min_val_str: Optional[str],
@@ -64,8 +80,8 @@ def validate_value(
     if float_val is None:
         return None
 
-    min_val = _parse_float(min_val_str)
-    max_val = _parse_float(max_val_str)
+    min_val = _parse_bound(min_val_str)
+    max_val = _parse_bound(max_val_str)
 
     if min_val is not None and float_val < min_val:
         return {
@@ -94,6 +110,28 @@ def validate_value(
     return None
 
 
+@lru_cache(maxsize=None)
+def _range_checked_fields(model_cls: type) -> Tuple[str, ...]:
+    """Felder eines Export-Models mit REDCap-Grenzwerten (Reihenfolge wie model_dump)."""
+    from services.aggregators.mapping import REDCAP_FIELD_DEFS
+    
+    return tuple(
+        name for name, info in model_cls.model_fields.items()
+        if not info.exclude
+        and name in REDCAP_FIELD_DEFS
+        and (REDCAP_FIELD_DEFS[name].min_val or REDCAP_FIELD_DEFS[name].max_val)
+    )
+
+
+def _revalidation_view(entry: BaseExportModel) -> Dict[str, Any]:
+    """
+    Die für revalidate_all_data nötigen Felder eines Models, direkt gelesen
+    statt das komplette Model per model_dump() zu serialisieren.
+    """
+    names = ("record_id", "redcap_event_name", "redcap_repeat_instance") + _range_checked_fields(type(entry))
+    return {name: getattr(entry, name) for name in names}
+
+
 def revalidate_all_data():
     """
     Re-validates all export_forms in st.session_state and updates validation_warnings.
@@ -113,7 +151,7 @@ def revalidate_all_data():
         for i, entry in enumerate(entries):
             # entry can be a Pydantic model or a dict
             if hasattr(entry, "model_dump"):
-                entry_dict = entry.model_dump()
+                entry_dict = _revalidation_view(entry)
             else:
                 entry_dict = entry
             
@@ -149,13 +187,18 @@ def revalidate_all_data():
                             
     st.session_state["validation_warnings"] = all_warnings
 
-def update_export_entry(form_key: str, entry_idx: int, field: str, new_value: Any) -> bool:
+def update_export_entry(
+    form_key: str, entry_idx: int, field: str, new_value: Any, revalidate: bool = True
+) -> bool:
     """
     Aktualisiert einen Eintrag in st.session_state.export_forms und triggert Re-Validierung.
     Wird sowohl von der Tagesansicht als auch vom Quick Edit im Export Builder genutzt.
+    
+    Mit revalidate=False kann der Aufrufer mehrere Änderungen sammeln und
+    revalidate_all_data() danach einmal selbst aufrufen.
     """
     import streamlit as st
-    from state import get_state, save_state
+    from state import get_state, save_state, mark_export_forms_changed
     
     state = get_state()
     entries = state.export_forms.get(form_key, [])
@@ -171,14 +214,17 @@ def update_export_entry(form_key: str, entry_idx: int, field: str, new_value: An
             entry[field] = new_value
         else:
             setattr(entry, field, new_value)
+            entry.update_derived_fields(field)
             
         # Zurück in State schreiben
         entries[entry_idx] = entry
         state.export_forms[form_key] = entries
+        mark_export_forms_changed(state)
         save_state(state)
         
         # Validierung aktualisieren
-        revalidate_all_data()
+        if revalidate:
+            revalidate_all_data()
         return True
     return False
 
@@ -287,7 +333,10 @@ class BaseAggregator(ABC):
         df_cache: Dict[str, pd.DataFrame] = {}
 
         for redcap_key, spec in registry.items():
-            df = df_cache.setdefault(spec.source, self.get_source_data(spec.source))
+            # Quelle nur einmal pro Registry holen und für alle Felder wiederverwenden
+            if spec.source not in df_cache:
+                df_cache[spec.source] = self.get_source_data(spec.source)
+            df = df_cache[spec.source]
             val = self.aggregate_value(df, spec.category, spec.pattern)
             values[redcap_key] = val
             self.validate_range(redcap_key, val, spec.min_val, spec.max_val)
@@ -305,6 +354,62 @@ class BaseAggregator(ABC):
         """
         return _parse_float(v)
     
+    def _to_float_series(self, values: pd.Series) -> pd.Series:
+        """
+        Wie ``values.apply(self._to_float)``, parst aber jeden unterschiedlichen
+        Wert nur einmal (Messwerte und Einstellungen wiederholen sich häufig).
+        
+        Nicht numerische Werte werden NaN.
+        """
+        codes, uniques = pd.factorize(values)
+        # Zusätzlicher NaN-Eintrag für Code -1 (fehlender Wert)
+        parsed = np.array([self._to_float(v) for v in uniques] + [np.nan], dtype=float)
+        return pd.Series(parsed[codes], index=values.index, name=values.name)
+    
+    def _filter_rows(
+        self,
+        df: pd.DataFrame,
+        category_pattern: str,
+        param_pattern: str
+    ) -> pd.DataFrame:
+        """
+        Zeilen, deren Parameter (und ggf. Kategorie) auf die Patterns passen.
+        
+        Die Patterns werden nur einmal kompiliert (compile_pattern) statt bei
+        jedem Feld und Tag erneut durch ``str.contains``.
+        """
+        # Parameter-Filter immer anwenden
+        mask = contains_mask(df["parameter"], compile_pattern(param_pattern))
+        
+        # Category-Filter nur wenn Spalte existiert und Pattern nicht ".*" ist
+        if "category" in df.columns and category_pattern != ".*":
+            mask &= contains_mask(df["category"], compile_pattern(category_pattern))
+        
+        return df[mask]
+
+    def _matched_keys(
+        self,
+        df: pd.DataFrame,
+        mapping: Dict[Any, str],
+        exclude_fer: bool = False
+    ) -> Set[Any]:
+        """
+        Schlüssel der Mapping-Einträge, deren Pattern auf einen Parameter passt.
+        
+        Jeder Parametername wird nur einmal geprüft, statt für jedes Pattern
+        erneut alle Zeilen des Frames zu durchsuchen.
+        """
+        if df.empty or "parameter" not in df.columns:
+            return set()
+        names = [n for n in df["parameter"].dropna().unique() if isinstance(n, str)]
+        if exclude_fer:
+            fer = compile_pattern(FER_PATTERN)
+            names = [n for n in names if not fer.search(n)]
+        return {
+            key for key, pattern in mapping.items()
+            if any(compile_pattern(pattern).search(n) for n in names)
+        }
+
     def get_string_value(
         self,
         df: pd.DataFrame,
@@ -325,17 +430,7 @@ class BaseAggregator(ABC):
         if df.empty:
             return None
         
-        # Parameter-Filter
-        param_mask = df["parameter"].str.contains(param_pattern, case=False, na=False, regex=True)
-        
-        # Category-Filter
-        if "category" in df.columns and category_pattern != ".*":
-            cat_mask = df["category"].str.contains(category_pattern, case=False, na=False, regex=True)
-            mask = param_mask & cat_mask
-        else:
-            mask = param_mask
-        
-        filtered = df[mask]
+        filtered = self._filter_rows(df, category_pattern, param_pattern)
         
         if filtered.empty:
             return None
@@ -360,29 +455,28 @@ class BaseAggregator(ABC):
         """
         if self._data is not None:
             df = self._data
+            if "timestamp" in df.columns:
+                df = filter_time_range(df, *day_bounds(self.date))
             if "source_type" in df.columns:
                 from services.aggregators.mapping import SOURCE_MAPPING
                 source_lower = source.lower()
                 if source_lower in SOURCE_MAPPING:
                     target = SOURCE_MAPPING[source_lower]
                     if target == "__CONTAINS__":
-                        mask = df["source_type"].str.upper().str.contains(source.upper(), na=False)
+                        mask = contains_mask(df["source_type"], source)
                     else:
                         mask = df["source_type"].isin(target)
                 else:
-                    mask = df["source_type"].str.lower().str.contains(source_lower, na=False, regex=False)
+                    mask = contains_mask(df["source_type"], source_lower, regex=False)
                 df = df[mask]
         else:
             from state import get_data
-            df = get_data(source)
+            # Tagesfilter direkt beim Abruf (nur der Tagesausschnitt wird kopiert)
+            df = get_data(source, time_range=day_bounds(self.date))
         
         if df.empty:
             return pd.DataFrame()
         
-        # Auf Tag filtern
-        if "timestamp" in df.columns:
-            return df[df["timestamp"].dt.date == self.date].copy()
-        
         return df.copy()
     
     def aggregate_value(
@@ -405,29 +499,20 @@ class BaseAggregator(ABC):
         if df.empty:
             return None
         
-        # Parameter-Filter immer anwenden
-        param_mask = df["parameter"].str.contains(param_pattern, case=False, na=False, regex=True)
-        
-        # Category-Filter nur wenn Spalte existiert und Pattern nicht ".*" ist
-        if "category" in df.columns and category_pattern != ".*":
-            cat_mask = df["category"].str.contains(category_pattern, case=False, na=False, regex=True)
-            mask = param_mask & cat_mask
-        else:
-            mask = param_mask
-        
-        filtered = df[mask]
+        filtered = self._filter_rows(df, category_pattern, param_pattern)
         
         if filtered.empty:
             return None
         
-        # Numerische Werte (robust parsen, z. B. ">180")
-        parsed = filtered["value"].apply(self._to_float).dropna()
+        # Numerische Werte (robust parsen, z. B. ">180") - je unterschiedlichem Wert einmal
+        numeric = self._to_float_series(filtered["value"])
+        parsed = numeric.dropna()
         if parsed.empty:
             return None
         
         # Strategie anwenden
         if self.value_strategy == "nearest" and self.nearest_time:
-            return self._get_nearest_value(filtered, parsed)
+            return self._get_nearest_value(filtered, numeric)
         elif self.value_strategy == "median":
             return float(parsed.median())
         elif self.value_strategy == "mean":
@@ -445,7 +530,12 @@ class BaseAggregator(ABC):
         df: pd.DataFrame,
         values: pd.Series
     ) -> Optional[float]:
-        """Findet den Wert am nächsten zur Referenzzeit."""
+        """
+        Findet den Wert am nächsten zur Referenzzeit.
+        
+        ``values`` sind die bereits geparsten Werte zu den Zeilen von ``df``
+        (gleiche Reihenfolge, NaN = nicht numerisch).
+        """
         
         if self.nearest_time is None:
             return float(values.median())
@@ -457,24 +547,16 @@ class BaseAggregator(ABC):
             self.nearest_time.second
         )
         
-        def time_diff(ts):
-            if pd.isna(ts):
-                return float('inf')
-            s = ts.hour * 3600 + ts.minute * 60 + ts.second
-            return abs(s - target_seconds)
-        
-        df = df.copy()
-        df["_time_diff"] = df["timestamp"].dt.time.apply(time_diff)
-        # Robuste Konvertierung
-        df["_value_numeric"] = df["value"].apply(self._to_float)
-        
-        # Nächsten gültigen Wert finden
-        valid = df.dropna(subset=["_value_numeric"])
-        if valid.empty:
+        # Nächsten gültigen Wert finden (positionsbasiert, ohne Kopie des Frames)
+        valid = values.notna().to_numpy()
+        if not valid.any():
             return None
         
-        nearest_idx = valid["_time_diff"].idxmin()
-        return float(valid.loc[nearest_idx, "_value_numeric"])
+        # Sekunden seit Mitternacht spaltenweise statt per apply (fehlende Zeit = unendlich weit)
+        ts = df["timestamp"]
+        seconds = (ts.dt.hour * 3600 + ts.dt.minute * 60 + ts.dt.second).to_numpy(dtype=float, na_value=np.inf)
+        time_diffs = np.abs(seconds - target_seconds)[valid]
+        return float(values.to_numpy()[valid][time_diffs.argmin()])
     
     def get_all_day_values(
         self,
@@ -493,34 +575,28 @@ class BaseAggregator(ABC):
         if df.empty:
             return []
         
-        # Parameter-Filter immer anwenden
-        param_mask = df["parameter"].str.contains(param_pattern, case=False, na=False, regex=True)
-        
-        # Category-Filter nur wenn Spalte existiert und Pattern nicht ".*" ist
-        if "category" in df.columns and category_pattern != ".*":
-            cat_mask = df["category"].str.contains(category_pattern, case=False, na=False, regex=True)
-            mask = param_mask & cat_mask
-        else:
-            mask = param_mask
-        
-        filtered = df[mask]
+        filtered = self._filter_rows(df, category_pattern, param_pattern)
         
         if filtered.empty:
             return []
         
-        results = []
-        for _, row in filtered.iterrows():
-            val = self._to_float(row.get("value"))
-            if val is None:
-                continue
-            time_str = row["timestamp"].strftime("%H:%M") if pd.notna(row["timestamp"]) else "?"
-            results.append((val, time_str))
+        # Spaltenweise statt iterrows: ein Parse pro unterschiedlichem Wert, Uhrzeiten in einem Rutsch
+        values = self._to_float_series(filtered["value"])
+        times = filtered["timestamp"].dt.strftime("%H:%M").fillna("?")
+        valid = values.notna()
+        results = list(zip(values[valid].tolist(), times[valid].tolist()))
         
         results.sort(key=lambda x: x[1])
         return results
 
     def _check_ecmella(self) -> int:
         """Prüft ob sowohl ECMO als auch Impella am Tag aktiv sind."""
-        ecmo_df = self.get_source_data("ecmo")
-        impella_df = self.get_source_data("impella")
-        return 1 if (not ecmo_df.empty and not impella_df.empty) else 0
+        return 1 if (self._has_source_data("ecmo") and self._has_source_data("impella")) else 0
+
+    def _has_source_data(self, source: str) -> bool:
+        """Prüft ob eine Quelle am Tag Daten hat, ohne den Tagesausschnitt zu kopieren."""
+        if self._data is None:
+            from state import get_data_days
+            # Gecachtes Set der Kalendertage statt Filter + Kopie
+            return self.date in get_data_days(source)
+        return not self.get_source_data(source).empty
@@ -7,10 +7,19 @@ from datetime import date
 
 from .base import BaseAggregator
 from schemas.db_schemas.demography import DemographyModel
+from utils.data_processing import contains_mask
 from .mapping import DEMOGRAPHY_REGISTRY
 
 logger = logging.getLogger(__name__)
 
+# Alle unterstützten Datumsformate in einem Pattern: TT.MM.JJJJ bzw.
+# TT/MM/JJJJ (gleiches Trennzeichen, per Rückverweis) oder JJJJ-MM-TT.
+# Die Gruppen liefern Tag/Monat/Jahr direkt, ohne strptime-Formatparsing.
+_DATE_RE = re.compile(
+    r"(\d{1,2})([./])(\d{1,2})\2(\d{4})"
+    r"|(\d{4})-(\d{2})-(\d{2})"
+)
+
 
 class DemographyAggregator(BaseAggregator):
     """Aggregator für demographische Stammdaten (baseline_arm_2)."""
@@ -40,7 +49,7 @@ class DemographyAggregator(BaseAggregator):
 
         # PatientInfo direkt holen (ohne Tages-Filter, da Stammdaten)
         if self._data is not None:
-            mask = self._data["source_type"].str.lower().str.contains("patientinfo", na=False)
+            mask = contains_mask(self._data["source_type"], "patientinfo")
             patientinfo_df = self._data[mask].copy()
         else:
             from state import get_data
@@ -82,15 +91,13 @@ class DemographyAggregator(BaseAggregator):
         """Konvertiert Datums-String (DD.MM.YYYY oder YYYY-MM-DD) zu date."""
         if not date_str:
             return None
-        from datetime import datetime
-        for fmt, pat in [
-            ("%d.%m.%Y", r"^\d{1,2}\.\d{1,2}\.\d{4}$"),
-            ("%d/%m/%Y", r"^\d{1,2}/\d{1,2}/\d{4}$"),
-            ("%Y-%m-%d", r"^\d{4}-\d{2}-\d{2}$"),
-        ]:
-            if re.match(pat, date_str):
-                try:
-                    return datetime.strptime(date_str, fmt).date()
-                except ValueError:
-                    pass
-        return None
+        m = _DATE_RE.fullmatch(date_str)
+        if not m:
+            return None
+        day, _, month, year, iso_year, iso_month, iso_day = m.groups()
+        if iso_year is not None:
+            day, month, year = iso_day, iso_month, iso_year
+        try:
+            return date(int(year), int(month), int(day))
+        except ValueError:
+            return None
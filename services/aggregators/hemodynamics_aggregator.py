@@ -6,6 +6,7 @@ WICHTIG: Katecholamine werden von ml/h zu µg/kg/min umgerechnet (benötigt Gewi
 
 import logging
 import re
+from functools import lru_cache
 
 import pandas as pd
 from typing import Optional, Dict, Tuple
@@ -18,7 +19,8 @@ from schemas.db_schemas.hemodynamics import (
     VentilationSpec,
     Anticoagulation,
 )
-from .base import BaseAggregator
+from .base import BaseAggregator, FER_PATTERN
+from utils.data_processing import compile_pattern, contains_mask
 from .mapping import (
     HEMODYNAMICS_REGISTRY,
     HEMODYNAMICS_MEDICATION_MAP,
@@ -32,6 +34,34 @@ from .mapping import (
     NARCOTICS_SPEC_MAP,
 )
 
+# Standard-Konzentrationen (µg/ml), falls der Perfusor-Name keine Angabe enthält
+DEFAULT_CONCENTRATIONS: Dict[str, float] = {
+    "norepinephrine": 100.0,
+    "epinephrine":    200.0,
+    "dobutamine":    5000.0,
+    "milrinone":      200.0,
+}
+
+# Konzentrationsangaben im Perfusor-Namen ("50 mg/50 ml" bzw. "5 mg/ml")
+_MG_PER_ML_VOLUME_RE = re.compile(r"(\d+(?:[,\.]\d+)?)\s*mg\s*/\s*(\d+)\s*ml", re.IGNORECASE)
+_MG_PER_ML_RE = re.compile(r"(\d+(?:[,\.]\d+)?)\s*mg/ml", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _concentration_from_name(param: str, field_name: str) -> Optional[float]:
+    """Konzentration in µg/ml aus einem Perfusor-Namen (None = keine Angabe)."""
+    if "(FER)" in param or "Fertigspritze" in param.lower():
+        return None
+    m = _MG_PER_ML_VOLUME_RE.search(param)
+    if m:
+        return (float(m.group(1).replace(",", ".")) * 1000) / float(m.group(2))
+    m = _MG_PER_ML_RE.search(param)
+    if m:
+        if field_name == "dobutamine":
+            return 5000.0
+        return float(m.group(1).replace(",", ".")) * 1000
+    return None
+
 
 class HemodynamicsAggregator(BaseAggregator):
     """Aggregiert Hämodynamik-Daten zu einem HemodynamicsModel."""
@@ -58,6 +88,10 @@ class HemodynamicsAggregator(BaseAggregator):
             nearest_time=nearest_time,
             data=data
         )
+        # Gewicht aus den Daten: einmal pro Aggregator gesucht (siehe _get_patient_weight)
+        self._data_weight: Optional[float] = None
+        self._data_weight_loaded = False
+        self._weight_warned = False
 
     def create_entry(self) -> HemodynamicsModel:
         """Erstellt ein HemodynamicsModel mit aggregierten Werten."""
@@ -113,10 +147,11 @@ class HemodynamicsAggregator(BaseAggregator):
 
         self._set_medication_checkboxes(model, med_df, VASOACTIVE_SPEC_MAP, "vasoactive_spec", exclude_fer=True)
 
-        if not med_df.empty:
-            for key, pattern in ANTICOAGULANT_MAP.items():
-                if med_df["parameter"].str.contains(pattern, case=False, na=False, regex=True).any():
-                    model.iv_ac_spec = Anticoagulation(key)
+        # Bei mehreren Antikoagulanzien gewinnt (wie bisher) der letzte Mapping-Eintrag
+        matched_ac = self._matched_keys(med_df, ANTICOAGULANT_MAP)
+        for key in ANTICOAGULANT_MAP:
+            if key in matched_ac:
+                model.iv_ac_spec = Anticoagulation(key)
 
         self._set_medication_checkboxes(model, med_df, ANTIPLATELET_MAP,   "post_antiplat_spec")
         self._set_medication_checkboxes(model, med_df, ANTIBIOTIC_MAP,     "antibiotic_spec")
@@ -146,13 +181,9 @@ class HemodynamicsAggregator(BaseAggregator):
     ) -> None:
         if med_df.empty:
             return
-        for drug_id, pattern in mapping.items():
-            mask = med_df["parameter"].str.contains(pattern, case=False, na=False, regex=True)
-            if exclude_fer:
-                mask &= ~med_df["parameter"].str.contains(
-                    r"\(FER\)|Fertigspritze", case=False, na=False, regex=True
-                )
-            setattr(model, f"{field_prefix}___{drug_id}", 1 if mask.any() else 0)
+        matched = self._matched_keys(med_df, mapping, exclude_fer=exclude_fer)
+        for drug_id in mapping:
+            setattr(model, f"{field_prefix}___{drug_id}", 1 if drug_id in matched else 0)
 
     def _set_transfusion(self, model: HemodynamicsModel, med_df: pd.DataFrame) -> None:
         for redcap_key, spec in TRANSFUSION_REGISTRY.items():
@@ -181,16 +212,10 @@ class HemodynamicsAggregator(BaseAggregator):
         if df.empty:
             return None
 
-        mask = df["parameter"].str.contains(pattern, case=False, na=False, regex=True)
-        filtered = df[mask]
-        if filtered.empty:
-            return None
-
-        # Fertigspritzen ausschließen
-        fer_mask = ~filtered["parameter"].str.contains(
-            r"\(FER\)|Fertigspritze", case=False, na=False, regex=True
-        )
-        filtered = filtered[fer_mask]
+        # Fertigspritzen ausschließen (Suche nur über die Kategorien)
+        params = df["parameter"]
+        mask = contains_mask(params, pattern) & ~contains_mask(params, compile_pattern(FER_PATTERN))
+        filtered = df[mask.to_numpy()]
         if filtered.empty:
             return None
 
@@ -215,10 +240,13 @@ class HemodynamicsAggregator(BaseAggregator):
 
         weight_kg = self._get_patient_weight()
         if weight_kg is None:
-            logger.warning(
+            # Nur beim ersten Perfusor warnen, weitere nur auf Debug-Level
+            log = logger.debug if self._weight_warned else logger.warning
+            log(
                 "Patientengewicht fehlt – Medikamentendosierung '%s' kann nicht berechnet werden.",
                 field_name,
             )
+            self._weight_warned = True
             return None
 
         ug_kg_min = (rate_ml_h * conc_ug_ml) / (60 * weight_kg)
@@ -226,24 +254,12 @@ class HemodynamicsAggregator(BaseAggregator):
 
     def _extract_concentration(self, df: pd.DataFrame, field_name: str) -> Optional[float]:
         """Extrahiert Konzentration in µg/ml aus dem Perfusor-Namen."""
-        default_concentrations = {
-            "norepinephrine": 100.0,
-            "epinephrine":    200.0,
-            "dobutamine":    5000.0,
-            "milrinone":      200.0,
-        }
-        for param in df["parameter"].dropna():
-            if "(FER)" in param or "Fertigspritze" in param.lower():
-                continue
-            m = re.search(r"(\d+(?:[,\.]\d+)?)\s*mg\s*/\s*(\d+)\s*ml", param, re.IGNORECASE)
-            if m:
-                return (float(m.group(1).replace(",", ".")) * 1000) / float(m.group(2))
-            m = re.search(r"(\d+(?:[,\.]\d+)?)\s*mg/ml", param, re.IGNORECASE)
-            if m:
-                if field_name == "dobutamine":
-                    return 5000.0
-                return float(m.group(1).replace(",", ".")) * 1000
-        return default_concentrations.get(field_name)
+        # Derselbe Perfusor-Name steht in jeder Zeile des Tages -> je Name nur einmal parsen
+        for param in df["parameter"].dropna().unique():
+            conc = _concentration_from_name(param, field_name)
+            if conc is not None:
+                return conc
+        return DEFAULT_CONCENTRATIONS.get(field_name)
 
     def _get_patient_weight(self) -> Optional[float]:
         """Gewicht aus State (manuell) oder PatientInfo-Daten."""
@@ -255,6 +271,14 @@ class HemodynamicsAggregator(BaseAggregator):
         except (ImportError, RuntimeError, AttributeError):
             pass
 
+        # Jeder Perfusor braucht das Gewicht -> Datensatz nur beim ersten Mal durchsuchen
+        if not self._data_weight_loaded:
+            self._data_weight = self._find_weight_in_data()
+            self._data_weight_loaded = True
+        return self._data_weight
+
+    def _find_weight_in_data(self) -> Optional[float]:
+        """Sucht das Gewicht in den PatientInfo-Daten."""
         full_df = self._data if self._data is not None else None
         if full_df is None:
             try:
@@ -16,6 +16,9 @@ from .mapping import IMPELLA_REGISTRY
 
 logger = logging.getLogger(__name__)
 
+# P-Stufe in den Werten der Flußregelung (z.B. "P8")
+_P_LEVEL_RE = re.compile(r"P(\d+)", re.IGNORECASE)
+
 
 class ImpellaAggregator(BaseAggregator):
     """Aggregiert Impella-Daten zu einem ImpellaAssessmentModel."""
@@ -73,7 +76,7 @@ class ImpellaAggregator(BaseAggregator):
             return None
         mask = df["parameter"].str.contains(r"Flu.*regelung|Fluss.*regelung", case=False, na=False, regex=True)
         for value in df[mask]["value"].dropna():
-            match = re.search(r"P(\d+)", str(value), re.IGNORECASE)
+            match = _P_LEVEL_RE.search(str(value))
             if match:
                 return int(match.group(1))
         return None
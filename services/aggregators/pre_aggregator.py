@@ -10,7 +10,8 @@ from datetime import date, time, datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
-from .base import BaseAggregator
+from .base import BaseAggregator, FER_PATTERN
+from utils.data_processing import compile_pattern, contains_mask
 from .mapping import (
     HEMODYNAMICS_MEDICATION_MAP,
     MEDICATION_SPEC_MAP,
@@ -59,6 +60,8 @@ class PreDeviceAggregatorBase(BaseAggregator):
             data=data
         )
         self.anchor_datetime = anchor_datetime
+        # Hilfs-Aggregator für Perfusor-Raten (einmal pro Pre-Assessment angelegt)
+        self._rate_aggregator: Optional[BaseAggregator] = None
 
     def get_source_data(self, source: str) -> pd.DataFrame:
         """Holt Daten ohne Tages-Filter (Pre-Assessments können mehrere Tage umfassen)."""
@@ -68,11 +71,11 @@ class PreDeviceAggregatorBase(BaseAggregator):
         if source_lower in SOURCE_MAPPING:
             target = SOURCE_MAPPING[source_lower]
             if target == "__CONTAINS__":
-                mask = self._data["source_type"].str.upper().str.contains(source.upper(), na=False)
+                mask = contains_mask(self._data["source_type"], source)
             else:
                 mask = self._data["source_type"].isin(target)
         else:
-            mask = self._data["source_type"].str.lower().str.contains(source_lower, na=False, regex=False)
+            mask = contains_mask(self._data["source_type"], source_lower, regex=False)
         return self._data[mask].copy()
 
     def _get_pre_window_data(self, source_df: pd.DataFrame, max_hours: int = 6) -> pd.DataFrame:
@@ -106,7 +109,7 @@ class PreDeviceAggregatorBase(BaseAggregator):
         if filtered.empty:
             return None, None
 
-        filtered["_val_num"] = filtered["value"].apply(self._to_float)
+        filtered["_val_num"] = self._to_float_series(filtered["value"])
         filtered = filtered.dropna(subset=["_val_num"])
         if filtered.empty:
             return None, None
@@ -151,35 +154,28 @@ class PreDeviceAggregatorBase(BaseAggregator):
         window_df = self._get_pre_window_data(med_df, max_hours=24)
         if window_df.empty:
             return results
-        for drug_id, pattern in mapping.items():
-            mask = window_df["parameter"].str.contains(pattern, case=False, na=False, regex=True)
-            if exclude_fer:
-                mask &= ~window_df["parameter"].str.contains(
-                    r"\(FER\)|Fertigspritze", case=False, na=False, regex=True
-                )
-            if mask.any():
-                results[drug_id] = 1
+        for drug_id in self._matched_keys(window_df, mapping, exclude_fer=exclude_fer):
+            results[drug_id] = 1
         return results
 
     def _get_medication_rate_pre(self, med_df, pattern, field_name, max_hours=24):
         window_df = self._get_pre_window_data(med_df, max_hours)
         if window_df.empty:
             return None
-        mask = window_df["parameter"].str.contains(pattern, case=False, na=False, regex=True)
-        fer_mask = ~window_df["parameter"].str.contains(
-            r"\(FER\)|Fertigspritze", case=False, na=False, regex=True
-        )
-        filtered = window_df[mask & fer_mask]
+        params = window_df["parameter"]
+        mask = contains_mask(params, pattern) & ~contains_mask(params, compile_pattern(FER_PATTERN))
+        filtered = window_df[mask.to_numpy()]
         if filtered.empty:
             return None
         idx = filtered["timestamp"].idxmax()
         row = filtered.loc[[idx]]
-        from .hemodynamics_aggregator import HemodynamicsAggregator
-        mock_agg = HemodynamicsAggregator(
-            date=self.anchor_datetime.date(), record_id=self.record_id,
-            redcap_event_name="", redcap_repeat_instance=0, data=self._data
-        )
-        return mock_agg._get_medication_rate(row, pattern, field_name)
+        if self._rate_aggregator is None:
+            from .hemodynamics_aggregator import HemodynamicsAggregator
+            self._rate_aggregator = HemodynamicsAggregator(
+                date=self.anchor_datetime.date(), record_id=self.record_id,
+                redcap_event_name="", redcap_repeat_instance=0, data=self._data
+            )
+        return self._rate_aggregator._get_medication_rate(row, pattern, field_name)
 
     def _process_pre_registry(self, registry: Dict[str, Any], max_hours: int = 6) -> Tuple[Dict[str, Any], List[datetime]]:
         """
@@ -191,7 +187,10 @@ class PreDeviceAggregatorBase(BaseAggregator):
         df_cache = {}
         
         for redcap_key, spec in registry.items():
-            df = df_cache.setdefault(spec.source, self.get_source_data(spec.source))
+            # Quelle nur einmal pro Registry holen und für alle Felder wiederverwenden
+            if spec.source not in df_cache:
+                df_cache[spec.source] = self.get_source_data(spec.source)
+            df = df_cache[spec.source]
             val, ts = self._get_closest_pre_value(df, spec.category, spec.pattern, max_hours=max_hours)
             if val is not None:
                 values[redcap_key] = val
@@ -240,7 +239,9 @@ class PreImpellaAggregator(PreDeviceAggregatorBase):
         df_cache: Dict[str, pd.DataFrame] = {}
 
         def get_df(source: str) -> pd.DataFrame:
-            return df_cache.setdefault(source, self.get_source_data(source))
+            if source not in df_cache:
+                df_cache[source] = self.get_source_data(source)
+            return df_cache[source]
 
         # 1. BGA (6h)
         timestamps: List[datetime] = []
@@ -395,7 +396,9 @@ class PreVAECLSAggregator(PreDeviceAggregatorBase):
         df_cache: Dict[str, pd.DataFrame] = {}
 
         def get_df(source: str) -> pd.DataFrame:
-            return df_cache.setdefault(source, self.get_source_data(source))
+            if source not in df_cache:
+                df_cache[source] = self.get_source_data(source)
+            return df_cache[source]
 
         # 1. BGA (6h)
         timestamps = []
@@ -11,18 +11,22 @@ Die State-Struktur ist so aufgebaut, dass neue Instrumente hinzugefügt
 werden können, ohne den Code zu ändern (INSTRUMENT_REGISTRY).
 """
 
+import uuid
+from contextlib import contextmanager
+
 import streamlit as st
 import pandas as pd
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List, Any, Dict, Type
-from datetime import datetime, time
+from typing import Optional, List, Any, Dict, Tuple, Type, NamedTuple, Iterator, FrozenSet
+from datetime import date, datetime, time
 
 from schemas.db_schemas.base import BaseExportModel
 from schemas.db_schemas.lab import LabModel
 from schemas.db_schemas.hemodynamics import HemodynamicsModel
 from schemas.db_schemas.pump import PumpModel
 from schemas.db_schemas.impella import ImpellaAssessmentModel
+from utils.data_processing import contains_mask, filter_time_range
 
 
 class Views(Enum):
@@ -50,14 +54,23 @@ EVENT_INSTRUMENTS: Dict[str, list[str]] = {
 }
 
 
+# Spalten, die beim Laden als Categorical gespeichert werden
+CATEGORICAL_COLUMNS = ("source_type", "category", "parameter")
+
+
 @dataclass
 class AppState:
     """Zentraler Application State - wird in st.session_state gespeichert."""
     
     # Kerndaten
-    data: Optional[pd.DataFrame] = None
-    filtered_data: Optional[pd.DataFrame] = None  # Gefilterte Daten (wenn filter_outliers aktiv)
+    # repr/compare aus: die DataFrames sollen nie in repr() oder == des States
+    # mitlaufen (teuer bzw. bei DataFrames nicht eindeutig)
+    data: Optional[pd.DataFrame] = field(default=None, repr=False, compare=False)
+    filtered_data: Optional[pd.DataFrame] = field(default=None, repr=False, compare=False)  # Gefilterte Daten (wenn filter_outliers aktiv)
     record_id: Optional[str] = None
+    data_key: Optional[str] = None  # Eindeutiger Schlüssel pro geladenem Datensatz (für st.cache_data)
+    # Logische Quelle (SOURCE_MAPPING-Key) -> vorhandene source_type-Werte, beim Laden berechnet
+    source_families: Dict[str, List[str]] = field(default_factory=dict)
     
     # Navigation
     selected_view: Views = Views.STARTPAGE
@@ -82,6 +95,7 @@ class AppState:
     # Value = Liste von Export-Models
     value_strategy: str = "nearest"
     export_forms: Dict[str, List[Any]] = field(default_factory=dict)
+    export_key: Optional[str] = None  # Neu bei jeder Änderung an export_forms (für den gecachten CSV-Export)
     
     # Rückwärtskompatibilität: lab_form Property
     @property
@@ -96,6 +110,7 @@ class AppState:
             self.export_forms.pop("labor", None)
         else:
             self.export_forms["labor"] = value
+        mark_export_forms_changed(self)
     
     # Explorer UI State (für die generische Datenansicht)
     explorer_selected_sources: List[str] = field(default_factory=list)
@@ -129,11 +144,33 @@ def update_state(**kwargs) -> None:
     save_state(state)
 
 
+@contextmanager
+def mutate_state() -> Iterator[AppState]:
+    """
+    Liefert den State zum direkten Ändern und speichert ihn einmalig beim Verlassen.
+    
+    Ersetzt mehrere update_state-Aufrufe (je ein get/save) innerhalb einer View:
+        with mutate_state() as state:
+            state.patient_weight = 75.0
+    """
+    state = get_state()
+    try:
+        yield state
+    finally:
+        # Auch bei st.rerun() (Exception) innerhalb des Blocks speichern
+        save_state(state)
+
+
 def reset_state() -> None:
     """Setzt den State zurück."""
     st.session_state.app_state = AppState()
 
 
+def mark_export_forms_changed(state: AppState) -> None:
+    """Vergibt einen neuen export_key, damit gecachte Exporte neu erzeugt werden."""
+    state.export_key = uuid.uuid4().hex
+
+
 # ============================================================================
 # Data Loading
 # ============================================================================
@@ -150,9 +187,25 @@ def load_data(df: pd.DataFrame) -> AppState:
     
     # Timestamp sicherstellen
     if "timestamp" in df.columns:
-        df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
+        df["timestamp"] = _to_timestamps(df["timestamp"])
+    
+    # Chronologisch sortieren (stabil, Zeilen ohne Zeitstempel ans Ende),
+    # damit Zeitfilter per Binärsuche statt Maske erfolgen (siehe get_data).
+    # Bereits sortierte Exporte (ohne NaT) werden nicht erneut sortiert.
+    if "timestamp" in df.columns:
+        if df["timestamp"].is_monotonic_increasing:
+            df = df.reset_index(drop=True)
+        else:
+            df = df.sort_values("timestamp", kind="stable", na_position="last", ignore_index=True)
+    
+    # Wenige, oft wiederholte Strings als Categorical speichern
+    # (schnelleres unique/isin, weniger Speicher)
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
     
     state.data = df
+    state.data_key = uuid.uuid4().hex
     
     # Daten direkt filtern und Checkbox aktivieren
     from utils.data_processing import filter_outliers
@@ -166,6 +219,9 @@ def load_data(df: pd.DataFrame) -> AppState:
             state.time_range = (ts_clean.min(), ts_clean.max())
             state.selected_time_range = state.time_range
     
+    # Zuordnung logische Quelle -> source_type einmalig auflösen
+    state.source_families = _resolve_source_families(df)
+    
     # Device-Zeiten für Export ermitteln
     _update_device_times(state, df)
     
@@ -174,24 +230,64 @@ def load_data(df: pd.DataFrame) -> AppState:
     return state
 
 
+def _to_timestamps(values: pd.Series) -> pd.Series:
+    """
+    Wandelt die timestamp-Spalte in datetime um.
+    
+    Der mlife-parser schreibt ISO-Zeitstempel; passt der erste Wert dazu, wird
+    direkt der ISO-Parser genutzt (auch Werte ohne Sekunden bleiben erhalten),
+    sonst wie bisher die Format-Erkennung von pandas.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    
+    fmt = None
+    first = values.first_valid_index()
+    if first is not None:
+        try:
+            pd.to_datetime(values.loc[[first]], format="ISO8601")
+            fmt = "ISO8601"
+        except (ValueError, TypeError):
+            pass
+    return pd.to_datetime(values, format=fmt, errors="coerce")
+
+
+def _resolve_source_families(df: pd.DataFrame) -> Dict[str, List[str]]:
+    """
+    Löst jede logische Quelle aus SOURCE_MAPPING auf die im Datensatz
+    vorhandenen source_type-Werte auf (inkl. contains-Quellen wie Impella).
+    """
+    if df.empty or "source_type" not in df.columns:
+        return {}
+    
+    source_types = pd.Series(df["source_type"].dropna().unique()).astype(str)
+    families = {}
+    for source, target in SOURCE_MAPPING.items():
+        if target == "__CONTAINS__":
+            mask = contains_mask(source_types, source)
+        else:
+            mask = source_types.isin(target)
+        families[source] = source_types[mask].tolist()
+    return families
+
+
 def _update_device_times(state: AppState, df: pd.DataFrame) -> None:
     """Ermittelt die frühesten Device-Startzeiten für den Export."""
-    if df.empty or "source_type" not in df.columns:
+    if df.empty or "source_type" not in df.columns or "timestamp" not in df.columns:
         return
     
+    # Nur die Zeitstempel-Spalte auswählen statt Teil-Frames mit allen Spalten
+    timestamps = df["timestamp"]
+    
     # ECMO
-    ecmo_df = df[df["source_type"] == "ECMO"]
-    if not ecmo_df.empty and "timestamp" in ecmo_df.columns:
-        earliest = ecmo_df["timestamp"].min()
-        if pd.notna(earliest):
-            state.nearest_ecls_time = earliest.time()
+    earliest = timestamps[(df["source_type"] == "ECMO").to_numpy()].min()
+    if pd.notna(earliest):
+        state.nearest_ecls_time = earliest.time()
     
     # Impella (mit contains, da oft "Impella A. axillaris rechts" etc.)
-    impella_df = df[df["source_type"].str.upper().str.contains("IMPELLA", na=False)]
-    if not impella_df.empty and "timestamp" in impella_df.columns:
-        earliest = impella_df["timestamp"].min()
-        if pd.notna(earliest):
-            state.nearest_impella_time = earliest.time()
+    earliest = timestamps[contains_mask(df["source_type"], "IMPELLA").to_numpy()].min()
+    if pd.notna(earliest):
+        state.nearest_impella_time = earliest.time()
 
 
 # ============================================================================
@@ -203,46 +299,89 @@ def _update_device_times(state: AppState, df: pd.DataFrame) -> None:
 from services.aggregators.mapping import SOURCE_MAPPING  # noqa: F401
 
 
-def get_data(source: Optional[str] = None) -> pd.DataFrame:
+def _active_data(state: AppState) -> Optional[pd.DataFrame]:
+    """Nutze filtered_data wenn die Outlier-Filter-Checkbox aktiv ist, sonst state.data."""
+    use_filtered = st.session_state.get("filter_outliers_enabled", False)
+    return state.filtered_data if (use_filtered and state.filtered_data is not None) else state.data
+
+
+def _source_mask(df: pd.DataFrame, source: str) -> pd.Series:
+    """Boolesche Maske für eine logische Quelle (über SOURCE_MAPPING)."""
+    source_lower = source.lower()
+    
+    # Beim Laden aufgelöste Zuordnung: reiner isin-Vergleich ohne String-Suche
+    families = get_state().source_families
+    if source_lower in families:
+        return df["source_type"].isin(families[source_lower])
+    
+    # Mapping anwenden
+    if source_lower in SOURCE_MAPPING:
+        target = SOURCE_MAPPING[source_lower]
+        
+        # Spezialfall: contains-Suche (für Impella etc.)
+        if target == "__CONTAINS__":
+            return contains_mask(df["source_type"], source)
+        
+        # Standard: Liste von exakten Matches
+        return df["source_type"].isin(target)
+    
+    # Direkte Suche
+    return df["source_type"].str.lower() == source_lower
+
+
+def _slice_time_range(df: pd.DataFrame, start, end) -> pd.DataFrame:
     """
-    Holt Daten aus dem State, optional gefiltert nach Source.
+    Zeitfilter (start <= timestamp <= end) für die State-Daten.
+    
+    load_data sortiert nach timestamp (NaT am Ende) - daher reicht eine
+    Binärsuche und ein iloc-Slice statt einer Maske über alle Zeilen.
+    """
+    if "timestamp" not in df.columns:
+        return filter_time_range(df, start, end)
+    
+    ts = df["timestamp"]
+    lo = ts.searchsorted(start, side="left")
+    hi = ts.searchsorted(end, side="right")
+    return df.iloc[lo:hi]
+
+
+def get_data(source: Optional[str] = None, time_range: Optional[tuple] = None) -> pd.DataFrame:
+    """
+    Holt Daten aus dem State, optional gefiltert nach Source und Zeitraum.
     Nutzt gefilterte Daten wenn die Outlier-Filter-Checkbox aktiv ist.
     
     Args:
         source: Optional - "lab", "vitals", "ecmo", etc. oder None für alle Daten
+        time_range: Optional - (start, end), beide inklusive
         
     Returns:
         DataFrame (kann leer sein)
     """
-    state = get_state()
+    df = _active_data(get_state())
     
-    # Nutze filtered_data wenn Filter aktiv, sonst state.data
-    use_filtered = st.session_state.get("filter_outliers_enabled", False)
-    df_to_use = state.filtered_data if (use_filtered and state.filtered_data is not None) else state.data
-    
-    if df_to_use is None or df_to_use.empty:
+    if df is None or df.empty:
         return pd.DataFrame()
     
-    df = df_to_use
+    # Zeitfilter zuerst, damit Source-Filter und Kopie nur den Ausschnitt betreffen
+    if time_range is not None:
+        df = _slice_time_range(df, *time_range)
     
     if source is None:
         return df.copy()
     
-    source_lower = source.lower()
-    
-    # Mapping anwenden
-    if source_lower in SOURCE_MAPPING:
-        target = SOURCE_MAPPING[source_lower]
-        
-        # Spezialfall: contains-Suche (für Impella etc.)
-        if target == "__CONTAINS__":
-            return df[df["source_type"].str.upper().str.contains(source.upper(), na=False)].copy()
-        
-        # Standard: Liste von exakten Matches
-        return df[df["source_type"].isin(target)].copy()
-    
-    # Direkte Suche
-    return df[df["source_type"].str.lower() == source_lower].copy()
+    return df[_source_mask(df, source)].copy()
+
+
+def data_cache_key() -> Optional[Tuple[str, bool]]:
+    """
+    (data_key, nutzt gefilterte Daten) für gecachte Auswertungen außerhalb
+    dieses Moduls. None, solange kein Datensatz geladen ist.
+    """
+    state = get_state()
+    df = _active_data(state)
+    if df is None or state.data_key is None:
+        return None
+    return state.data_key, df is state.filtered_data
 
 
 def has_data() -> bool:
@@ -251,30 +390,117 @@ def has_data() -> bool:
     return state.data is not None and not state.data.empty
 
 
+@st.cache_data(show_spinner=False, max_entries=256)
+def _cached_row_count(data_key: str, use_filtered: bool, source: str) -> int:
+    """Zeilenanzahl einer Quelle, einmal pro Datensatz und Filterstatus berechnet."""
+    df = _active_data(get_state())
+    if df is None or df.empty:
+        return 0
+    return int(_source_mask(df, source).sum())
+
+
+def row_count(source: str) -> int:
+    """Anzahl Datenpunkte einer Quelle (ohne den Frame zu kopieren, gecacht)."""
+    state = get_state()
+    df = _active_data(state)
+    if df is None or df.empty:
+        return 0
+    if state.data_key is None:
+        return int(_source_mask(df, source).sum())
+    return _cached_row_count(state.data_key, df is state.filtered_data, source)
+
+
 def has_device_data(device: str) -> bool:
     """Prüft ob Daten für ein bestimmtes Device vorhanden sind."""
-    return not get_data(device).empty
+    return row_count(device) > 0
+
+
+def _compute_data_days(df: pd.DataFrame, source: str) -> FrozenSet[date]:
+    timestamps = df.loc[_source_mask(df, source), "timestamp"].dropna()
+    return frozenset(timestamps.dt.date.unique().tolist())
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _cached_data_days(data_key: str, use_filtered: bool, source: str) -> FrozenSet[date]:
+    """Kalendertage mit Daten einer Quelle, einmal pro Datensatz und Filterstatus berechnet."""
+    df = _active_data(get_state())
+    if df is None or df.empty:
+        return frozenset()
+    return _compute_data_days(df, source)
+
+
+def get_data_days(source: str) -> FrozenSet[date]:
+    """
+    Alle Kalendertage, an denen eine Quelle Daten hat.
+    
+    Ersetzt pro-Tag-Scans wie ``df["timestamp"].dt.date == day`` durch einen
+    Set-Lookup (gecacht pro data_key).
+    """
+    state = get_state()
+    df = _active_data(state)
+    if df is None or df.empty:
+        return frozenset()
+    if state.data_key is None:
+        return _compute_data_days(df, source)
+    return _cached_data_days(state.data_key, df is state.filtered_data, source)
 
 
 def get_available_sources() -> List[str]:
     """Gibt alle verfügbaren source_type Werte zurück (aus gefilterten oder ungefilterten Daten)."""
-    state = get_state()
-    use_filtered = st.session_state.get("filter_outliers_enabled", False)
-    df_to_use = state.filtered_data if (use_filtered and state.filtered_data is not None) else state.data
+    df_to_use = _active_data(get_state())
     
     if df_to_use is None or df_to_use.empty:
         return []
     return df_to_use["source_type"].unique().tolist()
 
 
-def get_device_time_range(device: str) -> Optional[tuple]:
-    """Gibt den Zeitbereich für ein Device zurück."""
-    df = get_data(device)
-    if df.empty or "timestamp" not in df.columns:
+class DeviceRange(NamedTuple):
+    """Zeitbereich eines Devices (erster und letzter Zeitstempel)."""
+    start: datetime
+    end: datetime
+
+
+def _compute_device_time_range(device: str) -> Optional[DeviceRange]:
+    """Berechnet den Zeitbereich eines Devices direkt aus den aktiven Daten."""
+    df = _active_data(get_state())
+    if df is None or df.empty or "timestamp" not in df.columns:
         return None
     
-    ts = df["timestamp"].dropna()
+    ts = df.loc[_source_mask(df, device), "timestamp"].dropna()
     if ts.empty:
         return None
     
-    return (ts.min(), ts.max())
+    return DeviceRange(ts.min(), ts.max())
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_device_time_range(data_key: str, use_filtered: bool, device: str) -> Optional[DeviceRange]:
+    """Device-Zeitbereich, einmal pro Datensatz und Filterstatus berechnet."""
+    return _compute_device_time_range(device)
+
+
+def get_device_time_range(device: str) -> Optional[DeviceRange]:
+    """Gibt den Zeitbereich für ein Device zurück (gecacht pro Datensatz)."""
+    state = get_state()
+    if state.data_key is None:
+        return _compute_device_time_range(device)
+    
+    use_filtered = _active_data(state) is state.filtered_data
+    return _cached_device_time_range(state.data_key, use_filtered, device.lower())
+
+
+def get_mcs_time_range() -> Optional[DeviceRange]:
+    """
+    Gibt den gesamten MCS-Zeitraum (ECMO und Impella zusammen) zurück.
+    
+    Returns:
+        DeviceRange mit datetime-Werten oder None ohne Device-Daten
+    """
+    ranges = [r for r in (get_device_time_range("ecmo"), get_device_time_range("impella")) if r]
+    if not ranges:
+        return None
+    
+    # pd.Timestamp zu datetime für konsistenten Vergleich
+    mcs_start = pd.Timestamp(min(r.start for r in ranges)).to_pydatetime()
+    mcs_end = pd.Timestamp(max(r.end for r in ranges)).to_pydatetime()
+    return DeviceRange(mcs_start, mcs_end)
@@ -0,0 +1,77 @@
+import re
+import pandas as pd
+from utils.data_processing import (
+    compile_pattern, contains_mask, filter_outliers, source_category_index,
+)
+
+
+def test_contains_mask_categorical_matches_object():
+    values = ["ECMO", "Impella CP", None, "Lab", "IMPELLA 5.5", "Impella CP"]
+    obj = pd.Series(values, dtype=object)
+    cat = obj.astype("category")
+    
+    expected = obj.str.upper().str.contains("IMPELLA", na=False)
+    
+    assert contains_mask(obj, "impella").tolist() == expected.tolist()
+    assert contains_mask(cat, "impella").tolist() == expected.tolist()
+    
+    # Maske muss auf den Original-Index passen
+    assert contains_mask(cat.iloc[2:], "impella").index.tolist() == [2, 3, 4, 5]
+
+
+def test_contains_mask_literal_pattern():
+    series = pd.Series(["Vitals", "Vitalparameter (manuell)", "Lab"]).astype("category")
+    
+    # regex=False: Klammern werden nicht als Gruppe interpretiert
+    assert contains_mask(series, "(manuell)", regex=False).tolist() == [False, True, False]
+
+
+def test_contains_mask_compiled_pattern():
+    values = ["PCO2 [mmHg]", "pco2", None, "PO2"]
+    pattern = re.compile(r"^PCO2", re.IGNORECASE)
+    expected = [True, True, False, False]
+    
+    assert contains_mask(pd.Series(values, dtype=object), pattern).tolist() == expected
+    assert contains_mask(pd.Series(values).astype("category"), pattern).tolist() == expected
+
+
+def test_compile_pattern_cached_and_case_insensitive():
+    pattern = compile_pattern(r"^hb$")
+    
+    assert pattern is compile_pattern(r"^hb$")
+    assert pattern.search("HB")
+
+
+def test_filter_outliers_per_parameter():
+    df = pd.DataFrame({
+        "parameter": ["HF"] * 40 + ["MAP"] * 3,
+        "value": [str(v) for v in range(60, 99)] + ["400", "70", "500", "x"],
+    })
+    
+    filtered, removed = filter_outliers(df)
+    
+    # Je ein Wert unter/über den Perzentilen bei HF; MAP hat zu wenige Werte
+    assert removed == 2
+    assert "400" not in filtered["value"].tolist()
+    assert filtered["parameter"].tolist().count("MAP") == 3
+
+
+def test_source_category_index_without_category_column():
+    df = pd.DataFrame({
+        "timestamp": pd.to_datetime(["2026-01-01 08:00", "2026-01-02 09:00", None, "2026-01-01 10:00"]),
+        "source_type": pd.Series(["Lab", "Lab", "Lab", "Vitals"], dtype="category"),
+        "parameter": ["Hb", "Kalium", "Natrium", "HF"],
+        "value": [10.1, 4.2, 140, 80],
+    })
+    
+    index = source_category_index(df).set_index("source_type")
+    
+    # Ohne category-Spalte nur nach source_type gruppiert, Zeilen ohne Zeitstempel ignoriert
+    assert "category" not in index.columns
+    assert index.loc["Lab", "parameters"] == ("Hb", "Kalium")
+    assert index.loc["Lab", "first_ts"] == pd.Timestamp("2026-01-01 08:00")
+    assert index.loc["Lab", "last_ts"] == pd.Timestamp("2026-01-02 09:00")
+    assert index.loc["Vitals", "parameters"] == ("HF",)
+    
+    with_category = source_category_index(df.assign(category="Blutgase"))
+    assert with_category["category"].tolist() == ["Blutgase", "Blutgase"]
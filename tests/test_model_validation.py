@@ -59,3 +59,74 @@ def test_lab_derived_fields_manual_update():
     model.albumin = 35.0
     model.set_derived_fields()
     assert model.albumin == 3.5
+
+def test_lab_update_derived_fields_single_field():
+    model = LabModel(
+        record_id="test_1",
+        redcap_event_name="event_1",
+        assess_date_labor="2026-01-26",
+        crp=50.0,
+    )
+    assert model.crp == 5.0
+    assert model.hemolysis == 0
+    
+    # Nur das abhängige Flag wird gesetzt, keine erneute Einheiten-Umrechnung
+    model.act = 180
+    model.update_derived_fields("act")
+    assert model.post_act == 1
+    assert model.crp == 5.0
+    
+    model.hapto = 1.2
+    model.update_derived_fields("hapto")
+    assert model.hemolysis == 1
+
+
+def test_hemodynamics_update_derived_fields_single_field():
+    model = HemodynamicsModel(
+        record_id="test_1",
+        redcap_event_name="event_1",
+        assess_date_hemo="2026-01-26",
+    )
+    assert model.vasoactive_med == 0
+    assert model.nirs_avail == 0
+    
+    # Bearbeitete Eingaben aktualisieren die abgeleiteten Flags
+    model.norepinephrine = 0.1
+    model.update_derived_fields("norepinephrine")
+    assert model.vasoactive_med == 1
+    
+    model.nirs_left_c = 65
+    model.update_derived_fields("nirs_left_c")
+    assert model.nirs_avail == 1
+    assert model.nirs_loc___1 == 1
+    
+    model.ery_t = 2
+    model.update_derived_fields("ery_t")
+    assert model.transfusion_coag == 1
+    
+    model.norepinephrine = None
+    model.update_derived_fields("norepinephrine")
+    assert model.vasoactive_med == 0
+    
+    # Felder ohne Einfluss auf abgeleitete Werte lösen keine Neuberechnung aus
+    model.vent = 2
+    model.vent_peep = 5
+    model.update_derived_fields("hr")
+    assert model.vent == 2
+
+def test_to_redcap_dict_matches_model_dump():
+    model = HemodynamicsModel(
+        record_id="test_1",
+        redcap_event_name="event_1",
+        assess_date_hemo="2026-01-26",
+        assess_date="2026-01-26",
+        norepinephrine=0.1,
+    )
+    result = model.to_redcap_dict()
+
+    # Gleiche Felder wie model_dump (exclude=True Felder fehlen)
+    assert list(result) == list(model.model_dump())
+    assert "assess_date" not in result
+    assert result["assess_date_hemo"] == "2026-01-26"
+    assert result["norepinephrine"] == 0.1
+    assert result["sys_bp"] == ""
@@ -2,8 +2,87 @@
 Gemeinsame Datenverarbeitungsfunktionen für Explorer und Export Builder.
 """
 
+import re
+import numpy as np
 import pandas as pd
-from typing import Tuple
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import Tuple, Union
+
+
+@lru_cache(maxsize=1024)
+def compile_pattern(pattern: str) -> re.Pattern:
+    """
+    Kompiliert ein Such-Pattern einmalig (case-insensitiv).
+    
+    Die Aggregatoren prüfen dieselben Feld-Patterns für jeden Tag und jedes
+    Instrument; der Cache von ``re`` ist dafür zu klein und wird von pandas
+    bei ``case=False`` zudem mit eigenen Flags befüllt.
+    """
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _str_contains(values, pattern: Union[str, re.Pattern], case: bool, regex: bool):
+    # Vorkompilierte Patterns bringen ihre Flags (z.B. re.IGNORECASE) selbst mit,
+    # pandas erlaubt dafür kein case-Argument
+    if isinstance(pattern, re.Pattern):
+        return values.str.contains(pattern, regex=True, na=False)
+    return values.str.contains(pattern, case=case, regex=regex, na=False)
+
+
+def contains_mask(
+    series: pd.Series, pattern: Union[str, re.Pattern], case: bool = False, regex: bool = True
+) -> pd.Series:
+    """
+    Boolesche Maske wie ``series.str.contains`` (NaN -> False).
+    
+    Bei Categorical-Spalten (siehe state.load_data) wird das Pattern nur gegen
+    die wenigen Kategorien geprüft; das Ergebnis pro Zeile ist dann ein
+    Lookup über die Kategorie-Codes statt einer Suche im Zeilenwert.
+    ``pattern`` darf auch ein vorkompiliertes ``re.Pattern`` sein; ``case``
+    wird dann ignoriert.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories
+        if pd.api.types.is_object_dtype(categories) or pd.api.types.is_string_dtype(categories):
+            matched = np.asarray(_str_contains(categories, pattern, case, regex), dtype=bool)
+            codes = series.cat.codes.to_numpy()
+            # Code -1 = fehlender Wert -> False
+            hits = np.append(matched, False)[codes]
+            return pd.Series(hits, index=series.index, name=series.name)
+    return _str_contains(series, pattern, case, regex).astype(bool)
+
+
+def day_bounds(day: date) -> Tuple[datetime, datetime]:
+    """Start und Ende (inklusive) eines Kalendertags - wie im Sidebar-Zeitraum."""
+    return datetime.combine(day, time.min), datetime.combine(day, time.max)
+
+
+def filter_time_range(df: pd.DataFrame, start, end) -> pd.DataFrame:
+    """
+    Schränkt den DataFrame auf Zeilen mit start <= timestamp <= end ein.
+    
+    Zeilen ohne Zeitstempel fallen heraus.
+    """
+    if df.empty or "timestamp" not in df.columns:
+        return df
+    return df[df["timestamp"].between(start, end)]
+
+
+def source_category_index(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Index pro (source_type, category): Zeitbereich und enthaltene Parameter.
+    
+    Die category-Spalte ist optional (Startpage verlangt sie nicht); fehlt sie,
+    wird nur nach source_type gruppiert.
+    """
+    keys = ["source_type", "category"] if "category" in df.columns else ["source_type"]
+    df = df.dropna(subset=["timestamp"])
+    return df.groupby(keys, observed=True, dropna=False).agg(
+        first_ts=("timestamp", "min"),
+        last_ts=("timestamp", "max"),
+        parameters=("parameter", lambda s: tuple(s.dropna().unique().tolist())),
+    ).reset_index()
 
 
 def filter_outliers(df: pd.DataFrame, lower_pct: float = 2.5, upper_pct: float = 97.5) -> Tuple[pd.DataFrame, int]:
@@ -21,46 +100,49 @@ def filter_outliers(df: pd.DataFrame, lower_pct: float = 2.5, upper_pct: float =
     if df.empty or "value" not in df.columns:
         return df, 0
     
-    df_work = df.copy()
-    df_work["_value_numeric"] = pd.to_numeric(df_work["value"], errors="coerce")
+    # Nur die numerische Spalte separat halten statt den ganzen Frame zu kopieren
+    value_numeric = pd.to_numeric(df["value"], errors="coerce")
     
-    original_count = len(df_work)
+    original_count = len(df)
     
     # Erstelle Maske für zu behaltende Zeilen
-    keep_mask = pd.Series(True, index=df_work.index)
+    keep_mask = pd.Series(True, index=df.index)
     
-    # Pro Parameter filtern (falls vorhanden)
-    if "parameter" in df_work.columns:
-        for param in df_work["parameter"].dropna().unique():
-            param_mask = df_work["parameter"] == param
-            param_values = df_work.loc[param_mask, "_value_numeric"].dropna()
-            
-            if len(param_values) < 5:  # Zu wenige Werte für sinnvolle Perzentile
-                continue
-            
-            lower = param_values.quantile(lower_pct / 100)
-            upper = param_values.quantile(upper_pct / 100)
-            
-            # Numerische Werte außerhalb des Bereichs markieren
-            numeric_mask = param_mask & df_work["_value_numeric"].notna()
-            out_of_range = numeric_mask & (
-                (df_work["_value_numeric"] < lower) | (df_work["_value_numeric"] > upper)
-            )
-            keep_mask = keep_mask & ~out_of_range
+    # Pro Parameter filtern (falls vorhanden): alle Perzentile in einem groupby
+    # über die Parameter-Codes statt einer Maske über alle Zeilen pro Parameter
+    if "parameter" in df.columns:
+        codes, uniques = pd.factorize(df["parameter"])
+        numeric = value_numeric.to_numpy(dtype=float, na_value=np.nan)
+        has_value = (codes >= 0) & ~np.isnan(numeric)
+        grouped = pd.Series(numeric[has_value]).groupby(codes[has_value])
+        
+        counts = grouped.count()
+        enough = counts.index[counts >= 5]  # Zu wenige Werte für sinnvolle Perzentile
+        
+        # Grenzen pro Code, zusätzlicher NaN-Eintrag für Code -1 (kein Parameter)
+        lower = np.full(len(uniques) + 1, np.nan)
+        upper = np.full(len(uniques) + 1, np.nan)
+        lower[enough] = grouped.quantile(lower_pct / 100)[enough].to_numpy()
+        upper[enough] = grouped.quantile(upper_pct / 100)[enough].to_numpy()
+        
+        # Numerische Werte außerhalb des Bereichs markieren (NaN-Grenzen -> nie außerhalb)
+        out_of_range = has_value & ((numeric < lower[codes]) | (numeric > upper[codes]))
+        keep_mask = keep_mask & ~out_of_range
     else:
         # Ohne Parameter: globale Perzentile
-        numeric_vals = df_work["_value_numeric"].dropna()
+        numeric_vals = value_numeric.dropna()
         if len(numeric_vals) >= 5:
             lower = numeric_vals.quantile(lower_pct / 100)
             upper = numeric_vals.quantile(upper_pct / 100)
             
-            numeric_mask = df_work["_value_numeric"].notna()
+            numeric_mask = value_numeric.notna()
             out_of_range = numeric_mask & (
-                (df_work["_value_numeric"] < lower) | (df_work["_value_numeric"] > upper)
+                (value_numeric < lower) | (value_numeric > upper)
             )
             keep_mask = keep_mask & ~out_of_range
     
-    df_filtered = df[keep_mask].copy()
+    # Boolesche Indizierung liefert bereits einen neuen Frame - keine zweite Kopie
+    df_filtered = df[keep_mask]
     outlier_count = original_count - len(df_filtered)
     
     return df_filtered, outlier_count
@@ -1,10 +1,12 @@
 
+import re
 import pandas as pd
 import streamlit as st
 from datetime import date, datetime
 from typing import List, Optional, Tuple, Any
 
-from state import get_data
+from state import data_cache_key, get_data
+from utils.data_processing import contains_mask, day_bounds
 
 def get_form_date(form: Any) -> Optional[date]:
     """Holt das Datum aus einem Formular-Objekt."""
@@ -148,59 +150,88 @@ FIELD_TO_SOURCE = {
     "at3_t": ("Medication", ".*", r"Antithrombin"),
 }
 
-def get_day_values(field: str, day: date) -> List[Tuple[float, str]]:
-    """
-    Holt alle Werte eines Feldes für einen Tag.
-    
-    Returns:
-        Liste von (wert, uhrzeit_string) Tupeln
-    """
-    if field not in FIELD_TO_SOURCE:
-        return []
-    
-    source_type, category_pattern, param_pattern = FIELD_TO_SOURCE[field]
-    
-    # Daten laden
-    df = get_data(source_type.lower() if source_type != "Impella" else "impella")
-    if df.empty:
-        return []
-    
-    # Auf Tag filtern
-    if "timestamp" not in df.columns:
-        return []
+# Vorkompilierte Patterns: Feld -> (category_regex oder None für ".*", parameter_regex)
+FIELD_PATTERNS = {
+    field: (
+        re.compile(category_pattern, re.IGNORECASE) if category_pattern != ".*" else None,
+        re.compile(param_pattern, re.IGNORECASE),
+    )
+    for field, (_, category_pattern, param_pattern) in FIELD_TO_SOURCE.items()
+}
+
+def _field_source(field: str) -> str:
+    source_type = FIELD_TO_SOURCE[field][0]
+    return source_type.lower() if source_type != "Impella" else "impella"
+
+
+def _match_field(df: pd.DataFrame, field: str) -> pd.DataFrame:
+    """Numerische Werte eines Feldes (timestamp, value) in zeitlicher Reihenfolge."""
+    if df.empty or "timestamp" not in df.columns:
+        return pd.DataFrame({"timestamp": pd.Series(dtype="datetime64[ns]"), "value": pd.Series(dtype=float)})
     
-    day_df = df[df["timestamp"].dt.date == day]
-    if day_df.empty:
-        return []
+    category_re, param_re = FIELD_PATTERNS[field]
     
     # Parameter-Filter
-    param_mask = day_df["parameter"].str.contains(param_pattern, case=False, na=False, regex=True)
+    mask = contains_mask(df["parameter"], param_re)
     
     # Category-Filter (optional)
-    if "category" in day_df.columns and category_pattern != ".*":
-        cat_mask = day_df["category"].str.contains(category_pattern, case=False, na=False, regex=True)
-        mask = param_mask & cat_mask
-    else:
-        mask = param_mask
+    if "category" in df.columns and category_re is not None:
+        mask &= contains_mask(df["category"], category_re)
     
-    filtered = day_df[mask]
-    if filtered.empty:
+    matched = pd.DataFrame({
+        "timestamp": df.loc[mask, "timestamp"],
+        "value": pd.to_numeric(df.loc[mask, "value"], errors="coerce"),
+    })
+    return matched.dropna().reset_index(drop=True)
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _cached_field_rows(data_key: str, use_filtered: bool, field: str) -> pd.DataFrame:
+    """Alle Werte eines Feldes, einmal pro Datensatz und Filterstatus ermittelt."""
+    return _match_field(get_data(_field_source(field)), field)
+
+
+def _day_values(rows: pd.DataFrame, day: date) -> List[Tuple[float, str]]:
+    # Tagesausschnitt (Zeilen sind nach timestamp sortiert)
+    start, end = day_bounds(day)
+    ts = rows["timestamp"]
+    day_rows = rows.iloc[ts.searchsorted(start, side="left"):ts.searchsorted(end, side="right")]
+    if day_rows.empty:
         return []
     
-    # Werte extrahieren
-    results = []
-    for _, row in filtered.iterrows():
-        try:
-            val = float(row["value"])
-            time_str = row["timestamp"].strftime("%H:%M") if pd.notna(row["timestamp"]) else "?"
-            results.append((val, time_str))
-        except (ValueError, TypeError):
-            continue
+    times = day_rows["timestamp"].dt.strftime("%H:%M")
+    results = list(zip(day_rows["value"].tolist(), times.tolist()))
     
     # Nach Zeit sortieren
     results.sort(key=lambda x: x[1])
     return results
 
+
+@st.cache_data(show_spinner=False, max_entries=2048)
+def _cached_day_values(data_key: str, use_filtered: bool, field: str, day: date) -> List[Tuple[float, str]]:
+    """Tageswerte eines Feldes - überdauert Reruns, solange der Datensatz gleich bleibt."""
+    return _day_values(_cached_field_rows(data_key, use_filtered, field), day)
+
+
+def get_day_values(field: str, day: date) -> List[Tuple[float, str]]:
+    """
+    Holt alle Werte eines Feldes für einen Tag.
+    
+    Die Regex-Filter laufen einmal pro Datensatz über alle Tage; das Ergebnis
+    pro (Feld, Tag) wird zusätzlich gecacht, da die Formulare bei jedem Rerun
+    alle Felder neu rendern.
+    
+    Returns:
+        Liste von (wert, uhrzeit_string) Tupeln
+    """
+    if field not in FIELD_TO_SOURCE:
+        return []
+    
+    cache_key = data_cache_key()
+    if cache_key is None:
+        return _day_values(_match_field(get_data(_field_source(field)), field), day)
+    return _cached_day_values(*cache_key, field, day)
+
 def render_field_with_hints(
     label: str,
     current_value: Optional[float],
@@ -231,32 +262,24 @@ def render_field_with_hints(
     
     # Falls der aktuelle Wert nicht in den Rohdaten ist, fügen wir ihn als "Aktueller Wert" hinzu
     # damit er ausgewählt bleibt, bis der User einen anderen wählt.
-    current_val_in_day_values = False
+    # Die passende Option wird direkt beim Aufbau gemerkt (kein zweiter Suchlauf)
+    current_option = None
     for val, time_str in day_values:
-        if current_value is not None and abs(val - current_value) < 0.001:
-            current_val_in_day_values = True
-        
         option_label = f"{val:.2f} ({time_str})"
         options.append(option_label)
         value_map[option_label] = val
+        
+        if current_option is None and current_value is not None and abs(val - current_value) < 0.001:
+            current_option = option_label
     
-    if current_value is not None and not current_val_in_day_values:
+    if current_value is not None and current_option is None:
         # Aktuellen Wert an den Anfang stellen
         current_label = f"{current_value:.2f} (Aktuell)"
         options.insert(0, current_label)
         value_map[current_label] = current_value
         current_option = current_label
-    else:
-        # Aktuellen Wert in den Optionen finden
-        current_option = None
-        if current_value is not None:
-            for opt, opt_val in value_map.items():
-                if abs(opt_val - current_value) < 0.001:
-                    current_option = opt
-                    break
-        
-        if current_option is None and options:
-            current_option = options[0]
+    elif current_option is None and options:
+        current_option = options[0]
 
     selected_option = st.selectbox(
         label,
@@ -10,7 +10,7 @@ Gruppiert nach Events (ECLS, Impella) und Instrumenten.
 
 import streamlit as st
 from datetime import date
-from typing import List, Any
+from typing import Dict, List, Any
 
 from state import get_state, save_state, has_data, EVENT_INSTRUMENTS
 from services.aggregators.base import revalidate_all_data, update_export_entry
@@ -70,6 +70,13 @@ INSTRUMENT_CONFIG = {
     },
 }
 
+# Tab-Labels der Events
+EVENT_LABELS = {
+    "ecls_arm_2": "ECLS",
+    "impella_arm_2": "Impella",
+}
+
+
 def render_daily_form():
     """Hauptfunktion für die tagesbasierte Formularansicht."""
     
@@ -81,8 +88,11 @@ def render_daily_form():
     
     state = get_state()
     
+    # Einträge einmal nach Datum indizieren (statt mehrfach über alle Formulare zu laufen)
+    forms_by_day = _index_forms_by_day()
+    
     # Verfügbare Tage ermitteln
-    available_days = _get_available_days()
+    available_days = _get_available_days(forms_by_day)
     
     if not available_days:
         st.info("Keine exportierten Daten vorhanden. Bitte zuerst im Export-Builder Daten generieren.")
@@ -111,7 +121,8 @@ def render_daily_form():
     day_number = (selected_day - available_days[0]).days + 1
     
     # Verfügbare Events für diesen Tag
-    events = _get_events_for_day(selected_day)
+    day_forms = forms_by_day.get(selected_day, {})
+    events = _get_events_for_day(day_forms)
     
     if not events:
         st.warning(f"Keine Daten für {selected_day.strftime('%d.%m.%Y')} vorhanden.")
@@ -122,69 +133,62 @@ def render_daily_form():
         event_tabs = st.tabs([_get_event_label(e) for e in events])
         for event_tab, event_name in zip(event_tabs, events):
             with event_tab:
-                _render_day_instruments(selected_day, day_number, event_name, hide_empty)
+                _render_day_instruments(day_forms, day_number, event_name, hide_empty)
     else:
         # Nur ein Event - kein Tab nötig
-        _render_day_instruments(selected_day, day_number, events[0], hide_empty)
+        _render_day_instruments(day_forms, day_number, events[0], hide_empty)
 
 
-def _get_available_days() -> List[date]:
-    """Ermittelt alle Tage die durch den Builder generiert wurden.
+def _index_forms_by_day() -> Dict[date, Dict[str, int]]:
+    """
+    Ordnet jedem Tag die Einträge aus export_forms zu: {tag: {form_key: entry_idx}}.
     
-    Nur Tage für die export_forms existieren werden angezeigt.
+    Das Datum wird pro Eintrag nur einmal bestimmt; pro form_key und Tag
+    zählt der erste Eintrag.
     """
     state = get_state()
+    forms_by_day: Dict[date, Dict[str, int]] = {}
     
-    days = set()
-    
-    # Aus export_forms sammeln
-    for forms in state.export_forms.values():
-        for entry in forms:
+    for form_key, entries in state.export_forms.items():
+        for i, entry in enumerate(entries):
             entry_date = get_form_date(entry)
             if entry_date:
-                days.add(entry_date)
+                forms_by_day.setdefault(entry_date, {}).setdefault(form_key, i)
     
+    return forms_by_day
+
+
+def _get_available_days(forms_by_day: Dict[date, Dict[str, int]]) -> List[date]:
+    """Ermittelt alle Tage die durch den Builder generiert wurden.
+    
+    Nur Tage für die export_forms existieren werden angezeigt.
+    """
     # Sortiert zurückgeben
-    return sorted(days)
+    return sorted(forms_by_day)
 
 
-def _get_events_for_day(day: date) -> List[str]:
-    """Ermittelt verfügbare Events für einen Tag basierend auf export_forms."""
-    state = get_state()
+def _get_events_for_day(day_forms: Dict[str, int]) -> List[str]:
+    """Ermittelt verfügbare Events für einen Tag anhand seiner export_forms-Einträge."""
     events = set()
     
-    # Aus export_forms ermitteln welche Events für diesen Tag existieren
-    for form_key, entries in state.export_forms.items():
-        # form_key ist z.B. "labor_ecls_arm_2" oder "pump_ecls_arm_2"
+    # form_key ist z.B. "labor_ecls_arm_2" oder "pump_ecls_arm_2"
+    for form_key in day_forms:
         if form_key.endswith("_ecls_arm_2"):
-            event_name = "ecls_arm_2"
+            events.add("ecls_arm_2")
         elif form_key.endswith("_impella_arm_2"):
-            event_name = "impella_arm_2"
+            events.add("impella_arm_2")
         elif form_key.endswith("_baseline_arm_2"):
-            event_name = "baseline_arm_2"
-        else:
-            continue
-        
-        # Prüfen ob ein Entry für diesen Tag existiert
-        for entry in entries:
-            entry_date = get_form_date(entry)
-            if entry_date == day:
-                events.add(event_name)
-                break
+            events.add("baseline_arm_2")
     
     return sorted(events)
 
 
 def _get_event_label(event_name: str) -> str:
     """Gibt das Label für einen Event-Namen zurück."""
-    labels = {
-        "ecls_arm_2": "ECLS",
-        "impella_arm_2": "Impella",
-    }
-    return labels.get(event_name, event_name)
+    return EVENT_LABELS.get(event_name, event_name)
 
 
-def _render_day_instruments(day: date, day_number: int, event_name: str, hide_empty: bool = True):
+def _render_day_instruments(day_forms: Dict[str, int], day_number: int, event_name: str, hide_empty: bool = True):
     """Rendert alle Instrumente für einen Tag und Event."""
     
     state = get_state()
@@ -205,15 +209,9 @@ def _render_day_instruments(day: date, day_number: int, event_name: str, hide_em
         form_key = f"{instr_key}_{event_name}"
         forms = state.export_forms.get(form_key, [])
         
-        # Finde den Eintrag für diesen Tag
-        entry = None
-        entry_idx = None
-        for i, form in enumerate(forms):
-            form_date = get_form_date(form)
-            if form_date == day:
-                entry = form
-                entry_idx = i
-                break
+        # Eintrag für diesen Tag (aus dem Tagesindex)
+        entry_idx = day_forms.get(form_key)
+        entry = forms[entry_idx] if entry_idx is not None else None
         
         # Status-Text
         status_text = "(Vollständig)" if entry else "(Fehlt)"
@@ -229,8 +227,15 @@ def _render_day_instruments(day: date, day_number: int, event_name: str, hide_em
 
 
 
+@st.fragment
 def _render_instrument_fields(instr_key: str, entry: Any, form_key: str, entry_idx: int, hide_empty: bool = True):
-    """Rendert die Felder eines Instruments mit Werte-Auswahl."""
+    """
+    Rendert die Felder eines Instruments mit Werte-Auswahl.
+    
+    Als Fragment: eine Wertänderung rendert nur dieses Instrument neu,
+    nicht die komplette Tagesansicht mit allen anderen Instrumenten.
+    Die Felder liegen in einem Formular und werden gemeinsam gespeichert.
+    """
     
     config = INSTRUMENT_CONFIG.get(instr_key, {})
     sections = config.get("sections", {})
@@ -241,43 +246,62 @@ def _render_instrument_fields(instr_key: str, entry: Any, form_key: str, entry_i
     # Datum für Tageswerte
     entry_date = get_form_date(entry)
     
-    changed = False
-    
+    # Sichtbare Felder pro Section (bei hide_empty nur befüllte)
+    visible_sections = []
     for section_name, fields in sections.items():
-        # Felder filtern wenn hide_empty aktiv
         if hide_empty:
             visible_fields = [f for f in fields if getattr(entry, f, None) is not None]
         else:
             visible_fields = fields
         
         # Section überspringen wenn keine sichtbaren Felder
-        if not visible_fields:
-            continue
-        
-        st.markdown(f"**{section_name}**")
-        
-        # Felder in Spalten
-        cols = st.columns(3)
+        if visible_fields:
+            visible_sections.append((section_name, visible_fields))
+    
+    if not visible_sections:
+        return
+    
+    # Änderungen sammeln und nach dem Absenden gemeinsam übernehmen:
+    # eine Re-Validierung und ein Rerun statt einem pro Feld
+    changes = {}
+    
+    # Im Formular lösen Auswahländerungen erst beim Speichern einen Rerun aus
+    with st.form(f"df_form_{form_key}_{entry_idx}", border=False):
+        for section_name, visible_fields in visible_sections:
+            st.markdown(f"**{section_name}**")
+            
+            # Felder in Spalten
+            cols = st.columns(3)
+            
+            for i, field in enumerate(visible_fields):
+                with cols[i % 3]:
+                    label = FIELD_LABELS.get(field, field)
+                    current_value = getattr(entry, field, None)
+                    key_base = f"df_{form_key}_{entry_idx}_{field}"
+                    
+                    # Tageswerte holen wenn Mapping existiert
+                    day_values = get_day_values(field, entry_date) if entry_date else []
+                    
+                    # Dropdown mit Hints rendern
+                    new_value = render_field_with_hints(
+                        label=label,
+                        current_value=current_value,
+                        day_values=day_values,
+                        key_base=key_base
+                    )
+                    
+                    if new_value != current_value:
+                        changes[field] = new_value
         
-        for i, field in enumerate(visible_fields):
-            with cols[i % 3]:
-                label = FIELD_LABELS.get(field, field)
-                current_value = getattr(entry, field, None)
-                key_base = f"df_{form_key}_{entry_idx}_{field}"
-                
-                # Tageswerte holen wenn Mapping existiert
-                day_values = get_day_values(field, entry_date) if entry_date else []
-                
-                # Dropdown mit Hints rendern
-                new_value = render_field_with_hints(
-                    label=label,
-                    current_value=current_value,
-                    day_values=day_values,
-                    key_base=key_base
-                )
-                
-                if new_value != current_value:
-                    if update_export_entry(form_key, entry_idx, field, new_value):
-                        st.rerun()
+        submitted = st.form_submit_button("Speichern")
+    
+    if submitted and changes:
+        updated = [
+            update_export_entry(form_key, entry_idx, field, value, revalidate=False)
+            for field, value in changes.items()
+        ]
+        if any(updated):
+            revalidate_all_data()
+            st.rerun(scope="fragment")
 
 
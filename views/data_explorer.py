@@ -13,8 +13,10 @@ import streamlit as st
 import pandas as pd
 import altair as alt
 from datetime import datetime, time as dt_time
+from typing import Optional
 
 from state import get_state, get_data, has_data
+from utils.data_processing import contains_mask, source_category_index
 
 
 # Labels für source_type Werte
@@ -48,6 +50,13 @@ CORE_SOURCES = [
     ("Blutprodukte", "__CATEGORY__:Blutersatz", False),  # Spezial: category-Filter
     ("Bilanzen", "FluidBalance", False),
 ]
+CORE_SOURCE_LABELS = tuple(label for label, _, _ in CORE_SOURCES)
+
+# Ab dieser Punktzahl wird der Chart auf Intervall-Mittelwerte reduziert
+CHART_MAX_POINTS = 5000
+
+# Maximal angezeigte Tabellenzeilen (alle Zeilen per CSV-Download)
+TABLE_MAX_ROWS = 1000
 
 
 def render_data_explorer():
@@ -58,7 +67,8 @@ def render_data_explorer():
         st.warning("Keine Daten geladen. Bitte zuerst eine CSV-Datei hochladen.")
         return
     
-    df = state.data.copy()
+    # Keine Kopie: alle Filter unten erzeugen neue Frames, state.data bleibt unverändert
+    df = state.data
     
     st.header("Data Explorer")
     
@@ -86,8 +96,8 @@ def render_data_explorer():
         with col1:
             if show_all_sources:
                 # Alle source_types anzeigen
-                available_sources = sorted(df["source_type"].unique().tolist())
-                source_options = [f"{SOURCE_LABELS.get(s, s)}" for s in available_sources]
+                available_sources = _unique_sources(state.data_key)
+                source_options = tuple(SOURCE_LABELS.get(s, s) for s in available_sources)
                 
                 selected_source_labels = st.multiselect(
                     "Datenquellen",
@@ -97,15 +107,13 @@ def render_data_explorer():
                 )
                 
                 # Labels zurück zu source_type mappen
-                label_to_source = {f"{SOURCE_LABELS.get(s, s)}": s for s in available_sources}
+                label_to_source = dict(zip(source_options, available_sources))
                 selected_sources = [label_to_source.get(label, label) for label in selected_source_labels]
             else:
                 # Nur die wichtigsten Quellen anzeigen
-                core_options = [label for label, pattern, _ in CORE_SOURCES]
-                
                 selected_core_labels = st.multiselect(
                     "Datenquellen",
-                    options=core_options,
+                    options=CORE_SOURCE_LABELS,
                     default=[],
                     key="explorer_sources_core"
                 )
@@ -114,33 +122,12 @@ def render_data_explorer():
                 selected_sources = []  # Wird unten speziell behandelt
             
             # Filter anwenden
-            if show_all_sources:
-                if selected_sources:
-                    df = df[df["source_type"].isin(selected_sources)]
-            else:
-                # Core-Sources: Spezielle Filterlogik
-                if selected_core_labels:
-                    mask = pd.Series(False, index=df.index)
-                    
-                    for label, pattern, use_contains in CORE_SOURCES:
-                        if label not in selected_core_labels:
-                            continue
-                        
-                        if pattern.startswith("__CATEGORY__:"):
-                            # Category-Filter für Blutprodukte
-                            cat_value = pattern.replace("__CATEGORY__:", "")
-                            mask |= (df["category"] == cat_value)
-                        elif use_contains:
-                            # Contains-Suche für Impella, CRRT, NIRS
-                            mask |= df["source_type"].str.contains(pattern, case=False, na=False)
-                        else:
-                            # Exakte Suche
-                            mask |= (df["source_type"] == pattern)
-                    
-                    df = df[mask]
+            source_selection = tuple(selected_sources if show_all_sources else selected_core_labels)
+            df = _filter_by_sources(df, show_all_sources, source_selection)
         
         with col2:
             # 2. Zeitfilter
+            date_bounds = None
             if "timestamp" in df.columns and not df.empty:
                 ts_clean = df["timestamp"].dropna()
                 if not ts_clean.empty:
@@ -158,11 +145,15 @@ def render_data_explorer():
                     if isinstance(date_range, tuple) and len(date_range) == 2:
                         start_dt = datetime.combine(date_range[0], dt_time.min)
                         end_dt = datetime.combine(date_range[1], dt_time.max)
+                        date_bounds = (start_dt, end_dt)
                         df = df[(df["timestamp"] >= start_dt) & (df["timestamp"] <= end_dt)]
         
         # 3. Parameter Filter
         if not df.empty and "parameter" in df.columns:
-            available_params = sorted(df["parameter"].dropna().unique().tolist())
+            # Tupel direkt als Optionen übergeben (gecacht pro data_key/Auswahl)
+            available_params = _unique_parameters(
+                state.data_key, show_all_sources, source_selection, date_bounds
+            )
             if available_params:
                 selected_params = st.multiselect(
                     "Parameter",
@@ -239,12 +230,27 @@ def render_data_explorer():
             display_cols = ["timestamp", "source_type", "parameter", "value"]
         display_cols = [c for c in display_cols if c in df_display.columns]
         
+        table_df = df_display[display_cols].sort_values(display_cols[0], ascending=False)
+        
+        # Nur die ersten Zeilen ans Frontend schicken - die Darstellung
+        # tausender Zeilen kostet bei jedem Rerun Serialisierung und Rendering
         st.dataframe(
-            df_display[display_cols].sort_values(display_cols[0], ascending=False),
+            table_df.head(TABLE_MAX_ROWS),
             use_container_width=True,
             height=400,
             hide_index=True
         )
+        
+        if len(table_df) > TABLE_MAX_ROWS:
+            st.caption(f"Angezeigt werden die ersten {TABLE_MAX_ROWS} von {len(table_df)} Zeilen.")
+            # CSV nur auf Anforderung erzeugen, nicht bei jedem Rerun
+            if st.toggle("Alle Zeilen als CSV bereitstellen", value=False, key="explorer_csv_toggle"):
+                st.download_button(
+                    "CSV herunterladen",
+                    data=table_df.to_csv(index=False),
+                    file_name="data_explorer.csv",
+                    mime="text/csv",
+                )
     
     with tab_chart:
         _render_chart(df_display, is_aggregated=show_daily_median)
@@ -253,6 +259,81 @@ def render_data_explorer():
 
 
 
+def _filter_by_sources(df: pd.DataFrame, show_all_sources: bool, selection: tuple) -> pd.DataFrame:
+    """Filtert nach source_type (alle Quellen) bzw. nach den gewählten Core-Source-Labels."""
+    if not selection:
+        return df
+    
+    if show_all_sources:
+        return df[df["source_type"].isin(selection)]
+    
+    # Core-Sources: Spezielle Filterlogik
+    mask = pd.Series(False, index=df.index)
+    
+    for label, pattern, use_contains in CORE_SOURCES:
+        if label not in selection:
+            continue
+        
+        if pattern.startswith("__CATEGORY__:"):
+            # Category-Filter für Blutprodukte
+            cat_value = pattern.replace("__CATEGORY__:", "")
+            mask |= (df["category"] == cat_value)
+        elif use_contains:
+            # Contains-Suche für Impella, CRRT, NIRS (bei Categorical nur über die Kategorien)
+            mask |= contains_mask(df["source_type"], pattern)
+        else:
+            # Exakte Suche
+            mask |= (df["source_type"] == pattern)
+    
+    return df[mask]
+
+
+# Auswahllisten werden pro Datensatz (data_key) gecacht, damit nicht bei jedem
+# Rerun die komplette source_type-/parameter-Spalte gescannt werden muss.
+@st.cache_data(show_spinner=False, max_entries=32)
+def _unique_sources(data_key: str) -> tuple[str, ...]:
+    """Sortierte source_type-Werte des geladenen Datensatzes."""
+    source_types = get_state().data["source_type"]
+    if isinstance(source_types.dtype, pd.CategoricalDtype):
+        # Categorical (siehe load_data): Kategorien statt Scan über alle Zeilen
+        return tuple(sorted(source_types.cat.categories.tolist()))
+    return tuple(sorted(source_types.dropna().unique().tolist()))
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _source_category_index(data_key: str) -> pd.DataFrame:
+    """
+    source_category_index des geladenen Datensatzes.
+    
+    Wird einmal pro Datensatz berechnet und ersetzt den Scan über alle Zeilen,
+    solange der gewählte Zeitraum die Daten nicht einschränkt.
+    """
+    return source_category_index(get_state().data)
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _unique_parameters(
+    data_key: str,
+    show_all_sources: bool,
+    selection: tuple,
+    date_bounds: Optional[tuple],
+) -> tuple[str, ...]:
+    """Sortierte Parameter für die aktuelle Quellen- und Zeitraumauswahl."""
+    if date_bounds is not None:
+        # Auswahl über den vorberechneten Index auflösen; nur wenn der Zeitraum
+        # die Daten tatsächlich einschränkt, muss der Datensatz gescannt werden.
+        index = _filter_by_sources(_source_category_index(data_key), show_all_sources, selection)
+        start_dt, end_dt = date_bounds
+        if index.empty or (start_dt <= index["first_ts"].min() and index["last_ts"].max() <= end_dt):
+            return tuple(sorted({p for params in index["parameters"] for p in params}))
+    
+    df = _filter_by_sources(get_state().data, show_all_sources, selection)
+    if date_bounds is not None:
+        start_dt, end_dt = date_bounds
+        df = df[(df["timestamp"] >= start_dt) & (df["timestamp"] <= end_dt)]
+    return tuple(sorted(df["parameter"].dropna().unique().tolist()))
+
+
 def _aggregate_daily_median(df: pd.DataFrame) -> pd.DataFrame:
     """Aggregiert numerische Werte zu 24h-Median pro Parameter."""
     
@@ -276,7 +357,8 @@ def _aggregate_daily_median(df: pd.DataFrame) -> pd.DataFrame:
     if "parameter" in df_agg.columns:
         group_cols.append("parameter")
     
-    aggregated = df_agg.groupby(group_cols, as_index=False).agg(
+    # observed=True: bei Categorical-Spalten nur tatsächlich vorkommende Kombinationen
+    aggregated = df_agg.groupby(group_cols, as_index=False, observed=True).agg(
         median_value=("value_numeric", "median"),
         count=("value_numeric", "count")
     )
@@ -284,29 +366,72 @@ def _aggregate_daily_median(df: pd.DataFrame) -> pd.DataFrame:
     return aggregated
 
 
+def _downsample_for_plot(
+    df: pd.DataFrame,
+    x_col: str,
+    y_col: str,
+    group_cols: list[str],
+    max_points: int = CHART_MAX_POINTS,
+) -> pd.DataFrame:
+    """
+    Reduziert Zeitreihen auf höchstens ca. max_points Punkte.
+    
+    Pro Gruppe (z.B. Parameter) wird über gleich lange Zeitintervalle gemittelt;
+    die Intervalllänge ergibt sich aus Zeitspanne und Anzahl der Gruppen.
+    """
+    if len(df) <= max_points or df.empty:
+        return df
+    
+    n_groups = max(df.groupby(group_cols, observed=True).ngroups, 1) if group_cols else 1
+    buckets_per_group = max(max_points // n_groups, 1)
+    span = df[x_col].max() - df[x_col].min()
+    
+    # Mindestens 1 Minute (Auflösung der Quelldaten)
+    bucket_seconds = max(int(span.total_seconds() // buckets_per_group) + 1, 60)
+    
+    grouper = pd.Grouper(key=x_col, freq=f"{bucket_seconds}s")
+    return (
+        df.groupby(group_cols + [grouper], observed=True)[y_col]
+        .mean()
+        .dropna()
+        .reset_index()
+    )
+
+
+@st.fragment
 def _render_chart(df: pd.DataFrame, is_aggregated: bool = False):
-    """Rendert einen interaktiven Chart für numerische Daten."""
+    """
+    Rendert einen interaktiven Chart für numerische Daten.
+    
+    Als Fragment: Chart-eigene Widgets (z.B. "Alle Einzelwerte anzeigen")
+    lösen keinen Rerun des kompletten Explorers samt Filterung aus.
+    """
     
     if df.empty:
         st.info("Keine Daten für Chart verfügbar.")
         return
     
-    df_chart = df.copy()
+    # Nur die vom Chart genutzten Spalten übernehmen - Altair serialisiert
+    # den kompletten Frame als JSON für den Browser
+    chart_cols = [c for c in ("timestamp", "parameter", "source_type") if c in df.columns]
     
     if is_aggregated:
         # Aggregierte Daten: date und median_value verwenden
-        if "date" not in df_chart.columns or "median_value" not in df_chart.columns:
+        if "date" not in df.columns or "median_value" not in df.columns:
             st.info("Keine aggregierten Daten verfügbar.")
             return
         
+        df_chart = df[[c for c in chart_cols if c != "timestamp"]].copy()
         # Date zu datetime konvertieren für Chart
-        df_chart["timestamp"] = pd.to_datetime(df_chart["date"])
+        df_chart["timestamp"] = pd.to_datetime(df["date"])
+        df_chart["median_value"] = df["median_value"].astype("float32")
         value_field = "median_value:Q"
         y_title = "Median-Wert (24h)"
         tooltip_value = alt.Tooltip("median_value:Q", title="Median", format=".2f")
     else:
-        # Rohdaten: value zu numerisch konvertieren
-        df_chart["value_numeric"] = pd.to_numeric(df_chart["value"], errors="coerce")
+        # Rohdaten: value zu numerisch konvertieren (float32 halbiert die Payload)
+        df_chart = df[chart_cols].copy()
+        df_chart["value_numeric"] = pd.to_numeric(df["value"], errors="coerce", downcast="float")
         df_chart = df_chart.dropna(subset=["value_numeric", "timestamp"])
         
         if df_chart.empty:
@@ -317,17 +442,30 @@ def _render_chart(df: pd.DataFrame, is_aggregated: bool = False):
         y_title = "Wert"
         tooltip_value = alt.Tooltip("value_numeric:Q", title="Wert", format=".2f")
     
-    # Warnung bei zu vielen Datenpunkten
-    if len(df_chart) > 5000:
-        st.warning(f"Große Datenmenge ({len(df_chart)} Punkte). Chart könnte langsam sein.")
-        if not st.checkbox("Trotzdem anzeigen", key="chart_large_data"):
-            return
+    # Bei zu vielen Datenpunkten vor dem Plotten auf Zeitintervalle mitteln
+    show_points = True
+    if len(df_chart) > CHART_MAX_POINTS:
+        show_all_points = st.checkbox(
+            "Alle Einzelwerte anzeigen",
+            value=False,
+            key="chart_large_data",
+            help="Standardmäßig werden große Datenmengen für den Chart auf Intervall-Mittelwerte reduziert"
+        )
+        if show_all_points:
+            st.warning(f"Große Datenmenge ({len(df_chart)} Punkte). Chart könnte langsam sein.")
+        else:
+            y_col = value_field.split(":")[0]
+            group_cols = [c for c in ("parameter", "source_type") if c in df_chart.columns]
+            n_raw = len(df_chart)
+            df_chart = _downsample_for_plot(df_chart, "timestamp", y_col, group_cols, CHART_MAX_POINTS)
+            st.caption(f"{n_raw:,} Punkte auf {len(df_chart):,} Intervall-Mittelwerte reduziert.")
+            show_points = False
     
     # Parameter für Farbkodierung
     color_field = "parameter:N" if "parameter" in df_chart.columns else "source_type:N"
     
     # Altair Chart
-    chart = alt.Chart(df_chart).mark_line(point=True).encode(
+    chart = alt.Chart(df_chart).mark_line(point=show_points).encode(
         x=alt.X("timestamp:T", title="Zeit"),
         y=alt.Y(value_field, title=y_title),
         color=alt.Color(color_field, title="Parameter"),
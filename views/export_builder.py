@@ -18,7 +18,10 @@ import pandas as pd
 from datetime import date, datetime, time, timedelta
 from typing import Optional, List, Dict, Any
 
-from state import get_state, update_state, save_state, get_data, has_data
+from state import (
+    get_state, update_state, save_state, get_data_days, has_data,
+    has_device_data, get_device_time_range, mark_export_forms_changed,
+)
 from services.aggregators.base import revalidate_all_data, update_export_entry
 from utils.field_hints import get_day_values, render_field_with_hints, get_form_date, FIELD_LABELS
 from services.aggregators import (
@@ -32,6 +35,10 @@ from services.aggregators import (
 )
 from services.aggregators.mapping import REDCAP_VALIDATION_TYPES  # noqa: F401
 
+# Wert-Strategien für die Tagesaggregation (Optionen + Index für die Vorauswahl)
+VALUE_STRATEGIES = ("nearest", "median", "mean", "first", "last")
+VALUE_STRATEGY_INDEX = {strategy: i for i, strategy in enumerate(VALUE_STRATEGIES)}
+
 # Verfügbare Instrumente mit Labels
 AVAILABLE_INSTRUMENTS = {
     "labor": {
@@ -113,9 +120,9 @@ def _render_instrument_selection():
         st.session_state.export_instruments = {}
     
     # Prüfe welche Datenquellen verfügbar sind
-    has_ecmo = not get_data("ecmo").empty
-    has_impella = not get_data("impella").empty
-    has_patientinfo = not get_data("PatientInfo").empty
+    has_ecmo = has_device_data("ecmo")
+    has_impella = has_device_data("impella")
+    has_patientinfo = has_device_data("PatientInfo")
     
     # Instrument-Checkboxen in Spalten
     cols = st.columns(2)
@@ -157,8 +164,8 @@ def _render_ecmella_config():
     zeitgleich implantiert wurden (ECMELLA 2.0), da in diesem Fall keine
     Pre-Impella-Parameter erhoben werden (REDCap Branching-Logik).
     """
-    has_ecmo = not get_data("ecmo").empty
-    has_impella = not get_data("impella").empty
+    has_ecmo = has_device_data("ecmo")
+    has_impella = has_device_data("impella")
     pre_impella_selected = st.session_state.get("export_instruments", {}).get(
         "pre_impella_impella_arm_2", False
     )
@@ -221,13 +228,11 @@ def _render_settings():
             st.warning("Keine Record ID gesetzt (Sidebar)")
         
         # Value Strategy
-        strategies = ["nearest", "median", "mean", "first", "last"]
-        current_strategy = state.value_strategy if state.value_strategy in strategies else "nearest"
-        strategy_idx = strategies.index(current_strategy)
+        strategy_idx = VALUE_STRATEGY_INDEX.get(state.value_strategy, VALUE_STRATEGY_INDEX["nearest"])
         
         selected_strategy = st.selectbox(
             "Wert-Strategie",
-            strategies,
+            VALUE_STRATEGIES,
             index=strategy_idx,
             help="Wie sollen mehrere Werte am selben Tag aggregiert werden?"
         )
@@ -245,7 +250,7 @@ def _render_settings():
 
 def _render_time_range_selector():
     """Rendert die Zeitraum-Auswahl im Export Builder."""
-    from state import get_device_time_range
+    from state import get_mcs_time_range
     
     state = get_state()
     
@@ -259,56 +264,42 @@ def _render_time_range_selector():
         st.warning("Kein Zeitraum ausgewählt")
     
     # MCS-Zeitraum Button
-    ecmo_range = get_device_time_range("ecmo")
-    impella_range = get_device_time_range("impella")
+    mcs_range = get_mcs_time_range()
     
-    if ecmo_range or impella_range:
-        ranges = [r for r in [ecmo_range, impella_range] if r]
-        mcs_start = min(r[0] for r in ranges)
-        mcs_end = max(r[1] for r in ranges)
-        
-        # Konvertiere pd.Timestamp zu datetime
-        if hasattr(mcs_start, 'to_pydatetime'):
-            mcs_start = mcs_start.to_pydatetime()
-        if hasattr(mcs_end, 'to_pydatetime'):
-            mcs_end = mcs_end.to_pydatetime()
-        
+    if mcs_range:
         if st.button("Zeitraum auf MCS setzen", key="builder_mcs_range"):
-            update_state(selected_time_range=(mcs_start, mcs_end))
+            # Über _pending_time_range, damit auch das Sidebar-Widget übernommen wird
+            st.session_state["_pending_time_range"] = tuple(mcs_range)
             st.rerun()
             
     # Hinweis zu Pre-Assessments
     st.caption("ℹ️ Pre-Assessments werden immer für den Zeitpunkt der Implantation erstellt, unabhängig vom gewählten Zeitraum.")
 
 
+# Referenzzeiten der nearest-Strategie: (Quelle, Label, AppState-Feld)
+NEAREST_TIME_DEVICES = (
+    ("ecmo", "ECLS", "nearest_ecls_time"),
+    ("impella", "Impella", "nearest_impella_time"),
+)
+
+
 def _render_nearest_time_pickers():
     """Rendert die Time-Picker für die nearest-Strategie."""
     
     state = get_state()
     
-    # ECMO
-    ecmo_df = get_data("ecmo")
-    if not ecmo_df.empty:
-        default_time = state.nearest_ecls_time or time(0, 0)
-        selected_time = st.time_input(
-            "ECLS Referenzzeit",
-            value=default_time,
-            help="Zeit für 'nearest'-Suche bei ECLS-Daten"
-        )
-        if selected_time != state.nearest_ecls_time:
-            update_state(nearest_ecls_time=selected_time)
-    
-    # Impella
-    impella_df = get_data("impella")
-    if not impella_df.empty:
-        default_time = state.nearest_impella_time or time(0, 0)
+    for device, label, state_attr in NEAREST_TIME_DEVICES:
+        if get_device_time_range(device) is None:
+            continue
+        
+        current_time = getattr(state, state_attr)
         selected_time = st.time_input(
-            "Impella Referenzzeit",
-            value=default_time,
-            help="Zeit für 'nearest'-Suche bei Impella-Daten"
+            f"{label} Referenzzeit",
+            value=current_time or time(0, 0),
+            help=f"Zeit für 'nearest'-Suche bei {label}-Daten"
         )
-        if selected_time != state.nearest_impella_time:
-            update_state(nearest_impella_time=selected_time)
+        if selected_time != current_time:
+            update_state(**{state_attr: selected_time})
 
 
 def _render_build_section():
@@ -335,7 +326,10 @@ def _render_build_section():
     all_forms = _get_all_export_forms()
     if all_forms:
         with col2:
-            csv_data = _export_multi_csv(all_forms)
+            csv_data = (
+                _cached_export_csv(state.export_key, all_forms)
+                if state.export_key else _export_multi_csv(all_forms)
+            )
             st.download_button(
                 "CSV herunterladen",
                 data=csv_data,
@@ -414,9 +408,18 @@ def _render_build_section():
                                 )
                                 
                                 if new_val != current_val:
-                                    if update_export_entry(form_key, entry_idx, w['field'], new_val):
-                                        st.rerun()
+                                    to_save.append((form_key, entry_idx, w['field'], new_val))
                         st.divider()
+                    
+                    # Gesammelte Korrekturen übernehmen, dann einmal validieren
+                    if to_save:
+                        updated = [
+                            update_export_entry(fk, idx, field, val, revalidate=False)
+                            for fk, idx, field, val in to_save
+                        ]
+                        if any(updated):
+                            revalidate_all_data()
+                            st.rerun()
                 else:
                     w_df = pd.DataFrame(warnings)
                     # Spalten sortieren für bessere Lesbarkeit
@@ -445,15 +448,14 @@ def _render_build_section():
         summary = ", ".join([f"{k}: {v}" for k, v in instrument_counts.items()])
         st.info(f"Zusammenfassung: {summary}")
         
-        # Vorschau
-        with st.expander("Vorschau"):
-            preview_data = []
-            for entry in all_forms:
-                if isinstance(entry, dict):
-                    preview_data.append(entry)
-                else:
-                    preview_data.append(entry.model_dump())
-            st.dataframe(pd.DataFrame(preview_data), hide_index=True)
+        # Vorschau - nur bei Bedarf aufbauen: ein eingeklappter Expander würde
+        # model_dump() + DataFrame trotzdem bei jedem Rerun ausführen
+        if st.toggle("Vorschau anzeigen", value=False, key="export_preview_toggle"):
+            preview_df = (
+                _cached_forms_frame(state.export_key, all_forms)
+                if state.export_key else _forms_to_frame(all_forms)
+            )
+            st.dataframe(preview_df, hide_index=True)
 
 
 def _get_all_export_forms() -> List[Any]:
@@ -531,27 +533,24 @@ def _build_multi_instrument_data():
         # Referenz-Zeit je nach Event
         if event_name == "ecls_arm_2":
             ref_time = state.nearest_ecls_time
-            ref_df = get_data("ecmo")
+            ref_source = "ecmo"
         elif event_name == "impella_arm_2":
             ref_time = state.nearest_impella_time
-            ref_df = get_data("impella")
+            ref_source = "impella"
         else:  # baseline_arm_2
             ref_time = None
-            ref_df = get_data("PatientInfo")
+            ref_source = "PatientInfo"
         
-        if ref_df.empty:
+        if not has_device_data(ref_source):
             continue
         
         # Pre-Assessment (einmalig)
         if AVAILABLE_INSTRUMENTS.get(instr_name, {}).get("is_pre"):
-            # Bestimme Ankerzeitpunkt
-            if event_name == "ecls_arm_2":
-                earliest = get_data("ecmo")["timestamp"].min()
-            else:
-                earliest = get_data("impella")["timestamp"].min()
-
-            if pd.isna(earliest):
+            # Bestimme Ankerzeitpunkt (gecachter Device-Zeitbereich statt Kopie aller Device-Zeilen)
+            device_range = get_device_time_range("ecmo" if event_name == "ecls_arm_2" else "impella")
+            if device_range is None:
                 continue
+            earliest = device_range.start
 
             agg_class = globals().get(AVAILABLE_INSTRUMENTS[instr_name]["aggregator"])
             if not agg_class:
@@ -603,10 +602,11 @@ def _build_multi_instrument_data():
         # Einträge für jeden Tag erstellen
         entries = []
         instance = 1
+        # Tage mit Referenzdaten (Set-Lookup statt Tages-Scan pro Datum)
+        ref_days = get_data_days(ref_source)
         
         for day in dates:
-            day_data = ref_df[ref_df["timestamp"].dt.date == day]
-            if day_data.empty:
+            if day not in ref_days:
                 continue
             
             entry = _create_instrument_entry(
@@ -629,6 +629,7 @@ def _build_multi_instrument_data():
     
     # State aktualisieren
     state.export_forms = new_export_forms
+    mark_export_forms_changed(state)
     save_state(state)
     
     # Neu validieren um Metadaten für Quick Edit zu erhalten
@@ -732,25 +733,36 @@ def _create_instrument_entry(
     return None
 
 
+def _forms_to_frame(forms: List[Any]) -> pd.DataFrame:
+    """Export-Formulare als DataFrame, eine Zeile pro Formular."""
+    # Forms können Pydantic Models oder bereits Dicts sein (gemergte Pre-Assessments);
+    # exclude=True Felder werden von model_dump automatisch ausgeschlossen
+    return pd.DataFrame([
+        entry if isinstance(entry, dict) else entry.model_dump()
+        for entry in forms
+    ])
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_forms_frame(export_key: str, _forms: List[Any]) -> pd.DataFrame:
+    """Vorschau-Frame, einmal pro Stand der export_forms aufgebaut."""
+    return _forms_to_frame(_forms)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_export_csv(export_key: str, _forms: List[Any]) -> str:
+    """CSV-Export, einmal pro Stand der export_forms erzeugt statt bei jedem Rerun."""
+    return _export_multi_csv(_forms)
+
+
 def _export_multi_csv(forms: List[Any]) -> str:
     """Exportiert alle Formulare als eine CSV-Datei."""
 
     if not forms:
         return ""
 
-    # Alle Formulare zu Dicts konvertieren (exclude=True Felder werden automatisch ausgeschlossen)
-    # Forms können entweder Pydantic Models oder bereits Dicts sein (bei gemergte Pre-Assessments)
-    data = []
-    for entry in forms:
-        if isinstance(entry, dict):
-            data.append(entry)
-        else:
-            data.append(entry.model_dump())
-
-    df = pd.DataFrame(data)
-
     # Formatierung
-    df = _format_dataframe(df)
+    df = _format_dataframe(_forms_to_frame(forms))
 
     return df.to_csv(index=False, sep=",", na_rep="")
 
@@ -758,15 +770,19 @@ def _export_multi_csv(forms: List[Any]) -> str:
 def _format_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """Formatiert DataFrame für REDCap-Export."""
     
-    formatted = df.copy()
-    
-    for col in formatted.columns:
+    # Spaltenweise als Listen neu aufbauen statt Kopie + Series.apply pro Spalte;
+    # komplett leere Spalten (jede Zeile füllt nur ein Instrument) direkt als ""
+    empty = df.isna().all().to_dict()
+    blank = [""] * len(df)
+    formatted = {}
+    for col in df.columns:
+        if empty[col]:
+            formatted[col] = blank
+            continue
         validation_type = REDCAP_VALIDATION_TYPES.get(col)
-        formatted[col] = formatted[col].apply(
-            lambda v: _format_value(v, validation_type)
-        )
+        formatted[col] = [_format_value(v, validation_type) for v in df[col].tolist()]
     
-    return formatted
+    return pd.DataFrame(formatted, index=df.index)
 
 
 def _format_value(value, validation_type=None):
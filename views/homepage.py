@@ -11,8 +11,14 @@ Zeigt nach dem Datei-Upload:
 import streamlit as st
 import pandas as pd
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
 
-from state import get_state, update_state, has_data, get_data, get_device_time_range, Views
+from state import (
+    get_state, update_state, mutate_state, has_data, get_data,
+    get_device_time_range, get_mcs_time_range, Views,
+)
+from utils.data_processing import contains_mask
 
 
 def render_homepage():
@@ -63,60 +69,83 @@ def _render_time_info():
     col1, col2 = st.columns(2)
     
     with col1:
-        st.subheader("Verfügbarer Zeitraum")
-        if state.time_range:
-            start, end = state.time_range
-            start_str = start.strftime("%d.%m.%Y") if isinstance(start, datetime) else str(start)
-            end_str = end.strftime("%d.%m.%Y") if isinstance(end, datetime) else str(end)
-            st.write(f"**{start_str}** bis **{end_str}**")
-        else:
-            st.write("Nicht verfügbar")
+        _render_time_range("Verfügbarer Zeitraum", state.time_range, "Nicht verfügbar")
     
     with col2:
-        st.subheader("Ausgewählter Zeitraum")
-        if state.selected_time_range:
-            start, end = state.selected_time_range
-            start_str = start.strftime("%d.%m.%Y") if isinstance(start, datetime) else str(start)
-            end_str = end.strftime("%d.%m.%Y") if isinstance(end, datetime) else str(end)
-            st.write(f"**{start_str}** bis **{end_str}**")
-        else:
-            st.write("Nicht ausgewählt")
+        _render_time_range("Ausgewählter Zeitraum", state.selected_time_range, "Nicht ausgewählt")
 
 
-def _render_data_summary(df: pd.DataFrame):
-    """Zeigt eine Zusammenfassung der Daten."""
-    
-    st.subheader("Datenübersicht")
+@lru_cache(maxsize=1024)
+def _fmt_date(dt: datetime) -> str:
+    """Formatiert ein Datum als TT.MM.JJJJ (gecacht, da bei jedem Rerun gleich)."""
+    return dt.strftime("%d.%m.%Y")
+
+
+@lru_cache(maxsize=1024)
+def _fmt_datetime(dt: datetime) -> str:
+    """Formatiert einen Zeitpunkt als TT.MM.JJJJ HH:MM (gecacht)."""
+    return dt.strftime("%d.%m.%Y %H:%M")
+
+
+def _render_time_range(title: str, time_range: Optional[tuple], empty_text: str):
+    """Zeigt einen Zeitbereich (Start bis Ende) mit Überschrift."""
+    st.subheader(title)
+    if time_range:
+        start, end = time_range
+        start_str = _fmt_date(start) if isinstance(start, datetime) else str(start)
+        end_str = _fmt_date(end) if isinstance(end, datetime) else str(end)
+        st.write(f"**{start_str}** bis **{end_str}**")
+    else:
+        st.write(empty_text)
+
+
+# Kategorien für die Datenübersicht: key -> (Label, source_types, use_contains)
+DATA_CATEGORIES = {
+    "vitals": ("Vitalwerte", ["Vitals", "Vitalparameter (manuell)"], False),
+    "lab": ("Labor", ["Lab"], False),
+    "ecmo": ("ECMO", ["ECMO"], False),
+    "impella": ("Impella", ["Impella"], True),  # contains-Suche
+    "respiratory": ("Beatmung", ["Beatmung", "Respiratory"], False),
+    "medication": ("Medikation", ["Medikation", "Medication"], False),
+    "crrt": ("CRRT", ["Hämofilter"], True),  # contains-Suche
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _category_counts(data_key: str) -> tuple[tuple[str, int], ...]:
+    """Anzahl Datenpunkte pro Kategorie - einmal pro Datensatz (data_key) berechnet."""
+    df = get_state().data
     
     # Zähle pro source_type
     source_counts = df["source_type"].value_counts().to_dict()
+    # Kleinschreibung einmal vorberechnen statt pro Pattern erneut
+    lowered_counts = [(str(src).lower(), cnt) for src, cnt in source_counts.items()]
     
-    # Kategorien
-    categories = {
-        "vitals": ("Vitalwerte", ["Vitals", "Vitalparameter (manuell)"], False),
-        "lab": ("Labor", ["Lab"], False),
-        "ecmo": ("ECMO", ["ECMO"], False),
-        "impella": ("Impella", ["Impella"], True),  # contains-Suche
-        "respiratory": ("Beatmung", ["Beatmung", "Respiratory"], False),
-        "medication": ("Medikation", ["Medikation", "Medication"], False),
-        "crrt": ("CRRT", ["Hämofilter"], True),  # contains-Suche
-    }
-    
-    # 4 Spalten für die Metriken
-    cols = st.columns(4)
-    col_idx = 0
-    
-    for key, (label, sources, use_contains) in categories.items():
+    counts = []
+    for label, sources, use_contains in DATA_CATEGORIES.values():
         if use_contains:
             # Contains-Suche für source_types wie "Impella A. axilliaris rechts"
             count = 0
             for pattern in sources:
-                for src, cnt in source_counts.items():
-                    if pattern.lower() in src.lower():
-                        count += cnt
+                needle = pattern.lower()
+                count += sum(cnt for src, cnt in lowered_counts if needle in src)
         else:
             count = sum(source_counts.get(s, 0) for s in sources)
-        
+        counts.append((label, count))
+    
+    return tuple(counts)
+
+
+def _render_data_summary(df: pd.DataFrame):
+    """Zeigt eine Zusammenfassung der Daten."""
+    
+    st.subheader("Datenübersicht")
+    
+    # 4 Spalten für die Metriken
+    cols = st.columns(4)
+    col_idx = 0
+    
+    for label, count in _category_counts(get_state().data_key):
         if count > 0:
             with cols[col_idx % 4]:
                 st.metric(label, f"{count:,}")
@@ -126,49 +155,32 @@ def _render_data_summary(df: pd.DataFrame):
     st.caption(f"Gesamt: **{len(df):,}** Datenpunkte")
 
 
+# MCS-Geräte für die Übersicht: (Quelle für get_device_time_range, Label)
+MCS_DEVICES = (("ecmo", "ECMO"), ("impella", "Impella"))
+
+
 def _render_device_info():
     """Zeigt MCS-Device Informationen."""
     
     st.subheader("MCS-Geräte")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        ecmo_range = get_device_time_range("ecmo")
-        if ecmo_range:
-            start, end = ecmo_range
-            st.markdown(f"**ECMO**")
-            st.write(f"{start.strftime('%d.%m.%Y %H:%M')} - {end.strftime('%d.%m.%Y %H:%M')}")
-        else:
-            st.write("Keine ECMO-Daten")
-    
-    with col2:
-        impella_range = get_device_time_range("impella")
-        if impella_range:
-            start, end = impella_range
-            st.markdown(f"**Impella**")
-            st.write(f"{start.strftime('%d.%m.%Y %H:%M')} - {end.strftime('%d.%m.%Y %H:%M')}")
-        else:
-            st.write("Keine Impella-Daten")
+    for col, (device, label) in zip(st.columns(len(MCS_DEVICES)), MCS_DEVICES):
+        with col:
+            device_range = get_device_time_range(device)
+            if device_range:
+                start, end = device_range
+                # Ein Markdown-Element statt Überschrift + Text (ein Delta weniger pro Rerun)
+                st.markdown(f"**{label}**  \n{_fmt_datetime(start)} - {_fmt_datetime(end)}")
+            else:
+                st.write(f"Keine {label}-Daten")
     
     # Button zum Setzen des MCS-Zeitraums
-    ecmo_range = get_device_time_range("ecmo")
-    impella_range = get_device_time_range("impella")
+    mcs_range = get_mcs_time_range()
     
-    if ecmo_range or impella_range:
-        ranges = [r for r in [ecmo_range, impella_range] if r]
-        mcs_start = min(r[0] for r in ranges)
-        mcs_end = max(r[1] for r in ranges)
-        
-        # Konvertiere pd.Timestamp zu datetime für konsistenten Vergleich
-        if hasattr(mcs_start, 'to_pydatetime'):
-            mcs_start = mcs_start.to_pydatetime()
-        if hasattr(mcs_end, 'to_pydatetime'):
-            mcs_end = mcs_end.to_pydatetime()
-        
+    if mcs_range:
         if st.button("Zeitraum auf MCS setzen", help="Setzt den ausgewählten Zeitraum auf den MCS-Gerätezeitraum"):
             # Pending time range setzen - wird in sidebar.py verarbeitet
-            st.session_state["_pending_time_range"] = (mcs_start, mcs_end)
+            st.session_state["_pending_time_range"] = tuple(mcs_range)
             st.rerun()
 
 
@@ -193,52 +205,49 @@ def _render_quick_actions():
 def _render_patient_data_section():
     """Zeigt Patientendaten (Gewicht) und ermöglicht manuelle Eingabe falls fehlend."""
     
-    state = get_state()
-    
     st.subheader("Patientendaten")
     
     # Prüfe ob Gewicht in den Daten vorhanden ist
-    df = state.data
     patient_info_data = get_data("patient_info")
     
     weight_found = False
     
-    if not patient_info_data.empty:
-        # Suche nach Gewicht in den Daten
-        weight_params = patient_info_data[
-            patient_info_data["parameter"].str.lower().str.contains("gewicht|weight", na=False, regex=True)
-        ]
+    # State einmal holen, direkt ändern und am Ende einmal speichern
+    with mutate_state() as state:
+        if not patient_info_data.empty:
+            # Suche nach Gewicht in den Daten (case-insensitiv, ohne kleingeschriebene Kopie)
+            weight_params = patient_info_data[
+                contains_mask(patient_info_data["parameter"], "gewicht|weight")
+            ]
+            
+            if not weight_params.empty:
+                weight_found = True
+                # Nimm den letzten Wert
+                weight_val = weight_params.iloc[-1]["value"]
+                st.info(f"Gewicht aus Datensatz: **{weight_val} kg**")
+                # Speichere im State falls noch nicht gesetzt
+                if state.patient_weight is None:
+                    state.patient_weight = float(weight_val)
         
-        if not weight_params.empty:
-            weight_found = True
-            # Nimm den letzten Wert
-            weight_val = weight_params.iloc[-1]["value"]
-            st.info(f"Gewicht aus Datensatz: **{weight_val} kg**")
-            # Speichere im State falls noch nicht gesetzt
-            if state.patient_weight is None:
-                state.patient_weight = float(weight_val)
-    
-    # Falls Gewicht fehlt: Warnung + Eingabefeld
-    if not weight_found:
-        st.warning(
-            "**Gewicht nicht im Datensatz vorhanden!**\n\n"
-            "Das Gewicht wird zur Berechnung der Katecholaminperfusoren (µg/kg/min) benötigt. "
-            "Falls keine Eingabe erfolgt, werden diese Parameter nicht exportiert."
-        )
-        
-        col1, col2 = st.columns([3, 1])
-        with col1:
-            weight_input = st.text_input(
-                "Gewicht eingeben (kg)",
-                value=str(state.patient_weight) if state.patient_weight else "",
-                key="patient_weight_input"
+        # Falls Gewicht fehlt: Warnung + Eingabefeld
+        if not weight_found:
+            st.warning(
+                "**Gewicht nicht im Datensatz vorhanden!**\n\n"
+                "Das Gewicht wird zur Berechnung der Katecholaminperfusoren (µg/kg/min) benötigt. "
+                "Falls keine Eingabe erfolgt, werden diese Parameter nicht exportiert."
             )
-            if weight_input:
-                try:
-                    weight_val = float(weight_input)
-                    state.patient_weight = weight_val
-                    st.success(f"Gewicht gespeichert: **{weight_val} kg**")
-                except ValueError:
-                    st.error("Ungültige Eingabe - bitte eine Dezimalzahl eingeben (z.B. 75.5)")
-        
-        update_state(patient_weight=state.patient_weight)
+            
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                weight_input = st.text_input(
+                    "Gewicht eingeben (kg)",
+                    value=str(state.patient_weight) if state.patient_weight else "",
+                    key="patient_weight_input"
+                )
+                if weight_input:
+                    try:
+                        weight_val = float(weight_input)
+                        state.patient_weight = weight_val
+                        st.success(f"Gewicht gespeichert: **{weight_val} kg**")
+                    except ValueError:
+                        st.error("Ungültige Eingabe - bitte eine Dezimalzahl eingeben (z.B. 75.5)")
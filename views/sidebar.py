@@ -10,7 +10,7 @@ Enthält:
 import streamlit as st
 from datetime import datetime
 
-from state import get_state, update_state, has_data, Views
+from state import get_state, update_state, mutate_state, has_data, Views
 
 
 def render_sidebar():
@@ -118,11 +118,8 @@ def _render_time_range_picker():
 
 def _render_filter_options():
     """Rendert die Filter-Optionen."""
-    from state import get_state, save_state
     from utils.data_processing import filter_outliers
     
-    state = get_state()
-    
     st.subheader("Filter")
     
     # Checkbox für Ausreißer-Filterung
@@ -132,17 +129,17 @@ def _render_filter_options():
         help="Filtert Werte außerhalb des 2.5-97.5% Perzentil-Bereichs pro Parameter"
     )
     
-    # Wenn Checkbox aktiviert wird, wende Filterung an
-    if filter_enabled and state.filtered_data is None:
-        if state.data is not None and not state.data.empty:
-            state.filtered_data, _ = filter_outliers(state.data)
-            save_state(state)
-            st.rerun()
-    
-    # Wenn Checkbox deaktiviert wird, lösche gefilterte Daten
-    elif not filter_enabled and state.filtered_data is not None:
-        state.filtered_data = None
-        save_state(state)
+    # Gefilterte Daten bleiben beim Deaktivieren erhalten (state._active_data
+    # wertet die Checkbox aus) - erneutes Aktivieren filtert nicht noch einmal
+    changed = False
+    with mutate_state() as state:
+        # Nur berechnen, falls für diesen Datensatz noch kein Ergebnis existiert
+        if filter_enabled and state.filtered_data is None:
+            if state.data is not None and not state.data.empty:
+                state.filtered_data, _ = filter_outliers(state.data)
+                changed = True
+    
+    if changed:
         st.rerun()
 
 
@@ -12,7 +12,7 @@ Erste Seite der Anwendung. Erwartet eine CSV-Datei mit:
 import streamlit as st
 import pandas as pd
 
-from state import load_data, Views
+from state import CATEGORICAL_COLUMNS, load_data, Views
 
 
 def render_startpage():
@@ -41,8 +41,13 @@ def render_startpage():
     if uploaded_file is not None:
         try:
             with st.spinner("Lade Daten..."):
-                # CSV einlesen
-                df = pd.read_csv(uploaded_file, sep=";")
+                # CSV einlesen - wiederholte Strings direkt als Categorical,
+                # statt erst Millionen Python-Strings anzulegen und dann umzuwandeln
+                df = pd.read_csv(
+                    uploaded_file,
+                    sep=";",
+                    dtype={col: "category" for col in CATEGORICAL_COLUMNS},
+                )
                 
                 # Validierung
                 required_cols = ["timestamp", "source_type", "parameter", "value"]